@@ -0,0 +1,58 @@
+"""
+Analyse many positions from random games on all CPU cores.
+"""
+
+import sys
+import random
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.batch import BatchAnalyzer
+from src.ai.difficulties import Difficulty
+from src.game.mill_state import MillState
+
+
+def random_positions(num_positions: int, seed: int = 0):
+    """Generate positions from random play, one at a time."""
+    rng = random.Random(seed)
+    for _ in range(num_positions):
+        state = MillState()
+        player = 1
+        for _ in range(rng.randint(4, 40)):
+            legal_moves = state.legal_moves(player)
+            if not legal_moves or state.game_over():
+                break
+            state.make_move(player, rng.choice(legal_moves))
+            player = 2 if player == 1 else 1
+        if state.legal_moves(player) and not state.game_over():
+            yield state.get_state(), player, (state.in_hand[1], state.in_hand[2])
+
+
+def main():
+    """Run batch analysis and report throughput."""
+    num_positions = 200
+    print(f"Analysing {num_positions} random positions (MEDIUM)...\n")
+    
+    start_time = time.perf_counter()
+    total_nodes = 0
+    count = 0
+    with BatchAnalyzer(Difficulty.MEDIUM) as analyzer:
+        for position, move, score, nodes, seconds in analyzer.analyze(
+                random_positions(num_positions)):
+            count += 1
+            total_nodes += nodes
+            if count % 50 == 0:
+                print(f"{count} positions done (last: {move}, "
+                      f"score {score:.1f}, {seconds:.2f}s)")
+    elapsed = time.perf_counter() - start_time
+    
+    print(f"\nAnalysed {count} positions in {elapsed:.2f}s "
+          f"({count / elapsed:.1f} positions/sec, {total_nodes} nodes)")
+
+
+if __name__ == "__main__":
+    main()
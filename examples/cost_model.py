@@ -0,0 +1,51 @@
+"""
+Cost model example - predict search cost for capacity planning.
+
+Plays a few instrumented games at several depths, trains a cost model on
+the recorded moves, and prints the expected search cost per game of each
+difficulty.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+from src.analysis.tournament import Tournament
+from src.ai.cost_model import CostModel
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def main():
+    """Train a cost model and report per-game costs."""
+    print("Playing instrumented games...")
+    tournament = Tournament(record_games=True, seed=0)
+    for depth1, depth2 in [(1, 3), (2, 4), (3, 5), (4, 2)]:
+        tournament.run_match(MillAI(difficulty=Difficulty.HARD, custom_depth=depth1),
+                             MillAI(difficulty=Difficulty.HARD, custom_depth=depth2),
+                             num_games=1, verbose=False)
+    
+    cost_model = CostModel().fit(tournament.move_log)
+    os.makedirs('results/statistics', exist_ok=True)
+    cost_model.save('results/statistics/cost_model.json')
+    print(f"Trained on {cost_model.num_samples} searched moves")
+    
+    print("\nExpected search cost per game (one side):")
+    print(f"{'AI':28s} {'moves':>6s} {'nodes':>10s} {'seconds':>8s}")
+    for difficulty in Difficulty:
+        for target in (None, 0.05):
+            ai = MillAI(difficulty=difficulty, cost_model=cost_model,
+                        latency_target=target)
+            cost = ai.expected_game_cost(tournament.records)
+            name = difficulty.value + (f" (<= {target}s/move)" if target else "")
+            print(f"{name:28s} {cost['moves']:6.1f} {cost['nodes']:10.0f} "
+                  f"{cost['seconds']:8.2f}")
+    
+    print("\nCost model saved to results/statistics/cost_model.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.analysis.statistics import Statistics
+from src.ai.disk_cache import DiskSearchCache
 import os
 
 
@@ -22,7 +23,12 @@ def main():
     # Reduced parameters for faster execution:
     # - max_depth=6: Test depths 1-6 (depth 7+ takes too long)
     # - num_tests=3: Fewer tests per depth for speed
-    data = Statistics.analyze_depth_performance(max_depth=6, num_tests=3)
+    # Deep search results are kept on disk, so later runs are faster
+    # (delete the cache file to time full searches again)
+    os.makedirs('results/cache', exist_ok=True)
+    with DiskSearchCache('results/cache/search.cache') as disk_cache:
+        data = Statistics.analyze_depth_performance(max_depth=6, num_tests=3,
+                                                    disk_cache=disk_cache)
     
     # Print results
     print("\nDepth Analysis Results:")
@@ -0,0 +1,51 @@
+"""
+Distributed match example - play a match on TCP worker processes.
+
+Starts a coordinator and a few localhost workers; workers on other
+machines can join with:
+    python examples/tournament_worker.py <coordinator-host> 8766
+(start the coordinator with host='0.0.0.0' to accept them).
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import subprocess
+import time
+from src.analysis.tournament import Tournament
+from src.ai.difficulties import MillAI, Difficulty
+from src.server.distributed import GameCoordinator
+
+
+def main():
+    """Run a MEDIUM vs EASY match on local worker processes."""
+    num_workers = 3
+    worker_script = str(project_root / 'examples' / 'tournament_worker.py')
+    
+    with GameCoordinator(host='127.0.0.1', port=8766) as coordinator:
+        workers = [subprocess.Popen([sys.executable, worker_script,
+                                     '127.0.0.1', str(coordinator.port)])
+                   for _ in range(num_workers)]
+        
+        # Games are queued until workers connect, so this only makes the
+        # dispatch message accurate
+        time.sleep(2.0)
+        
+        tournament = Tournament(seed=0)
+        tournament.run_match(MillAI(difficulty=Difficulty.MEDIUM),
+                             MillAI(difficulty=Difficulty.EASY),
+                             num_games=6,
+                             coordinator=coordinator)
+        tournament.print_results()
+        print(f"\nGames retried after lost workers: {coordinator.lost_games}")
+    
+    for worker in workers:
+        worker.wait()
+
+
+if __name__ == "__main__":
+    main()
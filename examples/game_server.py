@@ -0,0 +1,33 @@
+"""
+Run the asyncio game server for human vs AI sessions.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import asyncio
+from src.server.game_server import GameServer
+
+
+def main():
+    """Serve games on localhost until interrupted."""
+    server = GameServer(host='127.0.0.1', port=8765,
+                        session_cpu_budget=60.0,
+                        global_cpu_budget=240.0)
+    
+    print(f"Serving Mill games on {server.host}:{server.port}")
+    print("Protocol: one JSON request per line (new_game, move, state, close, stats)")
+    print("Press Ctrl+C to stop.\n")
+    
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+if __name__ == "__main__":
+    main()
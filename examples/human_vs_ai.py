@@ -9,9 +9,29 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import pygame
 from famnit_gym.envs import mill
 from famnit_gym.wrappers.mill import UserInteraction
 from src.ai.difficulties import MillAI, Difficulty
+from src.ai.background import BackgroundSearch
+
+
+def report_progress(progress: dict):
+    """Print the AI's best move after each completed search depth."""
+    print(f"  AI depth {progress['depth']}: best {progress['best_move']} "
+          f"(score {progress['score']:.1f}, {progress['nodes']} nodes)")
+
+
+def start_hints(hint_ai: MillAI, model, player: int) -> BackgroundSearch:
+    """Search the human's best moves in the background and print them."""
+    def show_hints(progress: dict):
+        if progress['depth'] == hint_ai.max_depth:
+            for move, score, variation in progress['top_moves']:
+                print(f"  Hint: {move} (score {score:.1f}, line {variation})")
+    
+    search = BackgroundSearch(hint_ai, on_progress=show_hints, num_moves=3)
+    search.start(model, player)
+    return search
 
 
 def main():
@@ -21,14 +41,18 @@ def main():
     env = UserInteraction(env)
     env.reset()
     
-    # Create AI agent
+    # Create AI agent, and a separate one for hints (searched while the
+    # human thinks, so it must not share the opponent's search)
     ai = MillAI(difficulty=Difficulty.MEDIUM)
+    hint_ai = MillAI(difficulty=Difficulty.MEDIUM)
     
     print("Human vs AI Game")
     print("Instructions:")
     print("  - Placing phase: Click on empty position to place piece")
     print("  - Moving phase: Click source, then destination")
     print("  - Press SPACE to skip your turn (let AI move)")
+    print("  - Press H for hints on your turn")
+    print("  - Press SPACE while the AI thinks to make it move now")
     print("  - Press ESC to quit")
     print("\nYou are Player 1, AI is Player 2\n")
     
@@ -55,6 +79,9 @@ def main():
             print(f"\nYour turn (Player {player})")
             print(f"Phase: {info.get('phase', 'unknown')}")
             
+            # Hints are only searched on request, in the background
+            hints = None
+            
             # Get legal moves and phase
             legal_moves = info['legal_moves']
             phase = info.get('phase', 'placing')
@@ -110,6 +137,11 @@ def main():
                             env.clear_markings()
                             env.step(None)
                             done = True
+                        elif key == 'h' and hints is None:
+                            print("Searching hints...")
+                            hints = start_hints(
+                                hint_ai, mill.transition_model(env.unwrapped),
+                                player)
                         elif key == 'escape':
                             return
             
@@ -182,15 +214,50 @@ def main():
                                 env.clear_markings()
                                 env.step(None)
                                 done = True
+                        elif key == 'h' and hints is None:
+                            print("Searching hints...")
+                            hints = start_hints(
+                                hint_ai, mill.transition_model(env.unwrapped),
+                                player)
                         elif key == 'escape':
                             return
+            
+            if hints is not None:
+                hints.cancel()
+                hints.result()
         
         else:
             # AI player's turn
             print(f"\nAI's turn (Player {player})")
             # Use unwrapped environment for transition model
             model = mill.transition_model(env.unwrapped)
-            move = ai.get_move(model, player)
+            
+            # Search in the background so the window stays responsive
+            search = BackgroundSearch(ai, on_progress=report_progress)
+            search.start(model, player)
+            caption = pygame.display.get_caption()[0]
+            frame = 0
+            while not search.done:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT or (
+                            event.type == pygame.KEYDOWN
+                            and event.key == pygame.K_ESCAPE):
+                        search.cancel()
+                        return
+                    if (event.type == pygame.KEYDOWN
+                            and event.key == pygame.K_SPACE):
+                        print("  Moving now...")
+                        search.move_now()
+                
+                # Thinking indicator in the window title
+                dots = '.' * (frame % 4)
+                pygame.display.set_caption(
+                    f"AI thinking{dots} (depth {search.completed_depth})")
+                frame += 1
+                pygame.time.wait(100)
+            pygame.display.set_caption(caption)
+            
+            move = search.result()
             print(f"AI moves: {move}")
             env.step(move)
     
@@ -0,0 +1,58 @@
+"""
+Fixed-work benchmark - time searches of exactly N nodes.
+
+Every search visits the same nodes on every run and machine, so the
+times measure search speed alone, independent of how deep a machine
+gets within a time limit.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import statistics
+import time
+from src.ai.difficulties import MillAI, Difficulty
+from src.game.mill_state import MillState
+
+
+POSITIONS = {
+    'opening': [[0, 1, 0], [0, 10, 0], [0, 2, 0], [0, 3, 0]],
+    'midgame': [[0, 1, 0], [0, 4, 0], [0, 2, 0], [0, 3, 0], [0, 10, 0],
+                [0, 5, 0], [0, 22, 0], [0, 6, 0], [0, 9, 0], [0, 19, 0]],
+}
+
+
+def main():
+    """Search each position with a fixed node budget several times."""
+    node_budget = 20000
+    repetitions = 5
+    
+    print(f"Fixed-work benchmark ({node_budget} nodes, {repetitions} runs)")
+    print("-" * 60)
+    for name, moves in POSITIONS.items():
+        state = MillState.from_moves(moves)
+        player = 1 if len(moves) % 2 == 0 else 2
+        times = []
+        results = set()
+        for _ in range(repetitions):
+            ai = MillAI(difficulty=Difficulty.HARD, seed=0,
+                        node_budget=node_budget)
+            start_time = time.perf_counter()
+            move = ai.get_move(state, player)
+            times.append(time.perf_counter() - start_time)
+            results.add((tuple(move), ai.minimax_ai.nodes_evaluated,
+                         ai.minimax_ai.completed_depth))
+        
+        move, nodes, depth = results.pop()
+        median = statistics.median(times)
+        print(f"{name:10s} move {list(move)} depth {depth} nodes {nodes}: "
+              f"median {median * 1000:.1f}ms ({nodes / median:.0f} nodes/s)"
+              f"{'' if not results else '  NOT REPRODUCIBLE'}")
+
+
+if __name__ == "__main__":
+    main()
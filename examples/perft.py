@@ -0,0 +1,44 @@
+"""
+Measure move-generation speed and check MillState against famnit.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.perft import (famnit_model, reference_lines, run_perft,
+                                compare_implementations)
+from src.game.mill_state import MillState
+
+
+def main():
+    """Run perft on both implementations and compare them."""
+    depth = 3
+    lines = reference_lines(famnit_model)
+    
+    print(f"Perft to depth {depth}:")
+    print("-" * 60)
+    for name, new_model in [('famnit', famnit_model), ('MillState', MillState)]:
+        results = run_perft(new_model, depth, lines)
+        for phase, result in results.items():
+            print(f"{name:10s} {phase:8s} "
+                  f"Nodes: {result['nodes']:8d}, "
+                  f"Time: {result['time']:.3f}s, "
+                  f"Nodes/sec: {result['nodes_per_sec']:.0f}")
+    
+    print(f"\nComparing MillState with famnit (depth {depth})...")
+    divergences = compare_implementations(MillState, famnit_model, depth, lines)
+    for phase, divergence in divergences.items():
+        if divergence is None:
+            print(f"{phase:8s} identical")
+        else:
+            print(f"{phase:8s} differs after {divergence['path']}")
+            print(f"         missing: {divergence['missing']}")
+            print(f"         extra:   {divergence['extra']}")
+
+
+if __name__ == "__main__":
+    main()
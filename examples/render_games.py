@@ -0,0 +1,42 @@
+"""
+Play headless AI vs AI games, save their records and render videos offline.
+Much faster than recording live games with a window and move delays.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.tournament import Tournament
+from src.analysis.replay import render_records
+from src.ai.difficulties import MillAI, Difficulty
+import os
+
+
+def main():
+    """Record games headlessly and render them in parallel."""
+    num_games = 4
+    os.makedirs('results/records', exist_ok=True)
+    os.makedirs('results/videos', exist_ok=True)
+    
+    print(f"Playing {num_games} games (EASY vs MEDIUM) without rendering...")
+    tournament = Tournament(record_games=True)
+    tournament.run_match(MillAI(difficulty=Difficulty.EASY),
+                         MillAI(difficulty=Difficulty.MEDIUM),
+                         num_games=num_games)
+    
+    jobs = []
+    for i, record in enumerate(tournament.records):
+        record.save(f'results/records/game_{i + 1}.json')
+        jobs.append((record, f'results/videos/game_{i + 1}.mp4'))
+    
+    print("\nRendering videos in parallel...")
+    for path in render_records(jobs, fps=2):
+        print(f"✅ Video saved to: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Search trace example - branching factors and cutoff positions per phase.
+
+Plays a game with a tracer attached to both engines, then reads the
+trace back and prints how many moves each phase searches and at which
+move the alpha-beta cutoffs happen.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+from src.ai.difficulties import MillAI, Difficulty
+from src.ai.search_trace import SearchTracer, read_trace, summarize_trace
+from src.game.mill_state import MillState
+
+
+def main():
+    """Trace one game and print the per-phase summary."""
+    os.makedirs('results/statistics', exist_ok=True)
+    path = 'results/statistics/search.trace'
+    
+    with SearchTracer(path, sample_rate=0.25, max_ply=6) as tracer:
+        ais = {1: MillAI(difficulty=Difficulty.MEDIUM, seed=1),
+               2: MillAI(difficulty=Difficulty.MEDIUM, seed=2)}
+        for ai in ais.values():
+            ai.minimax_ai.tracer = tracer
+        
+        state = MillState()
+        player = 1
+        for _ in range(200):
+            if state.game_over() or not state.legal_moves(player):
+                break
+            state.make_move(player, ais[player].get_move(state, player))
+            player = 2 if player == 1 else 1
+        records = tracer.records_written
+    
+    print(f"Traced {records} nodes ({os.path.getsize(path)} bytes) to {path}")
+    summary = summarize_trace(read_trace(path))
+    for phase, stats in summary.items():
+        print(f"\n{phase}: {stats['nodes']} interior nodes, "
+              f"{stats['leaves']} leaves, {stats['tt_hits']} TT hits")
+        print(f"  mean branching factor {stats['mean_branching']:.1f}, "
+              f"cutoff rate {stats['cutoff_rate']:.0%}, "
+              f"first move cutoffs {stats['first_move_cutoffs']:.0%}")
+        print(f"  branching:     {stats['branching']}")
+        print(f"  cutoff index:  {stats['cutoff_index']}")
+
+
+if __name__ == "__main__":
+    main()
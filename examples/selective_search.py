@@ -0,0 +1,59 @@
+"""
+Compare plain and selective (LMR + futility + PVS) Hard AI search.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import time
+from src.analysis.statistics import Statistics
+from src.analysis.tournament import Tournament
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def time_search(ai, positions):
+    """Average time and nodes per move over benchmark positions."""
+    total_time = 0.0
+    total_nodes = 0
+    for model, player in positions:
+        start_time = time.time()
+        ai.minimax_ai.get_best_move(model, player)
+        total_time += time.time() - start_time
+        total_nodes += ai.minimax_ai.nodes_evaluated
+    return total_time / len(positions), total_nodes / len(positions)
+
+
+def main():
+    """Measure selective search depth vs time, then check strength."""
+    positions = Statistics.benchmark_positions(num_positions=4)
+    
+    print("Time per move on benchmark positions:")
+    print("-" * 50)
+    configs = [(6, False), (6, True), (7, True), (8, True)]
+    for depth, selective in configs:
+        ai = MillAI(difficulty=Difficulty.HARD, custom_depth=depth,
+                    selective_search=selective)
+        avg_time, avg_nodes = time_search(ai, positions)
+        label = "selective" if selective else "plain"
+        print(f"Depth {depth} ({label}): "
+              f"Avg Time: {avg_time:.3f}s, Nodes: {int(avg_nodes)}")
+    
+    # Strength check: selective depth 8 against plain depth 6
+    print("\nMatch: selective depth 8 (AI1) vs plain depth 6 (AI2)")
+    tournament = Tournament()
+    ai1 = MillAI(difficulty=Difficulty.HARD, custom_depth=8,
+                 selective_search=True)
+    ai2 = MillAI(difficulty=Difficulty.HARD)
+    results = tournament.run_match(ai1, ai2, num_games=4)
+    
+    print(f"\nSelective wins: {results['ai1_wins']}, "
+          f"Plain wins: {results['ai2_wins']}, Draws: {results['draws']}")
+    print(f"Avg game time: {results['avg_game_time']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
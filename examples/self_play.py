@@ -9,7 +9,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import os
 from src.analysis.statistics import Statistics
+from src.ai.disk_cache import DiskSearchCache
 
 
 def main():
@@ -17,7 +19,11 @@ def main():
     print("Running self-play analysis (Hard AI vs Hard AI)...")
     print("This may take a while...\n")
     
-    results = Statistics.analyze_self_play(num_games=4)
+    # Deep search results are kept on disk, so later runs are faster
+    os.makedirs('results/cache', exist_ok=True)
+    with DiskSearchCache('results/cache/search.cache') as disk_cache:
+        results = Statistics.analyze_self_play(num_games=4,
+                                               disk_cache=disk_cache)
     
     print("\nSelf-Play Results:")
     print("-" * 50)
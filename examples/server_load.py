@@ -0,0 +1,58 @@
+"""
+Load test for the game server - measures throughput in moves/sec.
+
+Start the server first:
+    python examples/game_server.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import asyncio
+from src.server.client import GameClient, run_load_test
+
+
+async def fetch_server_stats():
+    """Get the server-side metrics."""
+    client = GameClient('127.0.0.1', 8765)
+    await client.connect()
+    try:
+        response = await client.request('stats')
+    finally:
+        await client.close()
+    return response['stats']
+
+
+def main():
+    """Run concurrent random-move clients against the server."""
+    print("Running load test (16 clients, 2 games each, Easy AI)...")
+    
+    results = asyncio.run(run_load_test(num_clients=16,
+                                        games_per_client=2,
+                                        difficulty='easy'))
+    
+    print("\nLoad Test Results:")
+    print("-" * 50)
+    print(f"Games: {results['games']}")
+    print(f"AI moves: {results['ai_moves']}")
+    print(f"Elapsed: {results['elapsed']:.2f}s")
+    print(f"Throughput: {results['moves_per_sec']:.1f} moves/sec")
+    latency = results['latency']
+    print(f"Request latency: p50 {latency['p50'] * 1000:.1f}ms, "
+          f"p95 {latency['p95'] * 1000:.1f}ms, "
+          f"p99 {latency['p99'] * 1000:.1f}ms, "
+          f"max {latency['max'] * 1000:.1f}ms")
+    
+    stats = asyncio.run(fetch_server_stats())
+    search = stats['search_latency']
+    print(f"\nServer search latency: p50 {search['p50'] * 1000:.1f}ms, "
+          f"p95 {search['p95'] * 1000:.1f}ms")
+    print(f"Budget fallbacks: {stats['budget_fallbacks']}")
+
+
+if __name__ == "__main__":
+    main()
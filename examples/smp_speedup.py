@@ -0,0 +1,41 @@
+"""
+Measure Lazy SMP speedup vs number of cores on benchmark positions.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.statistics import Statistics
+import os
+
+
+def main():
+    """Run Lazy SMP benchmark and plot speedup."""
+    print("Measuring Lazy SMP speedup (depth 5, 4 benchmark positions)...")
+    print("This may take a few minutes...\n")
+    
+    worker_counts = [1, 2, 4]
+    data = Statistics.analyze_smp_speedup(worker_counts, depth=5,
+                                          num_positions=4)
+    
+    # Print results
+    print("\nLazy SMP Results:")
+    print("-" * 50)
+    for i, workers in enumerate(data['workers']):
+        print(f"{workers} worker(s): "
+              f"Time: {data['total_times'][i]:.2f}s, "
+              f"Speedup: {data['speedups'][i]:.2f}x")
+    
+    # Create plot
+    os.makedirs('results/plots', exist_ok=True)
+    Statistics.plot_smp_speedup(data, 'results/plots/smp_speedup.png')
+    
+    print("\nPlot saved to results/plots/smp_speedup.png")
+
+
+if __name__ == "__main__":
+    main()
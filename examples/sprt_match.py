@@ -0,0 +1,34 @@
+"""
+Compare two AI strengths with a match that stops once SPRT decides.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.tournament import Tournament
+from src.analysis.elo import SPRT
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def main():
+    """Run an SPRT match between MEDIUM and EASY."""
+    # H0: MEDIUM is not stronger; H1: MEDIUM is 100 Elo stronger
+    sprt = SPRT(elo0=0, elo1=100, alpha=0.05, beta=0.05)
+    
+    print("SPRT match: MEDIUM vs EASY (at most 200 games)")
+    print("=" * 50)
+    
+    tournament = Tournament()
+    tournament.run_match(MillAI(difficulty=Difficulty.MEDIUM),
+                         MillAI(difficulty=Difficulty.EASY),
+                         num_games=200,
+                         sprt=sprt)
+    tournament.print_results()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 """
 Tournament example - run matches between different AI difficulties.
+
+Pass --memory to play the games in this process with memory profiling
+and write a memory report next to the timing stats. Pass --resume to
+continue an interrupted tournament from its database; otherwise a new
+tournament replaces it.
 """
 
 import sys
@@ -9,13 +14,32 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.analysis.memory import MemoryProfiler
 from src.analysis.tournament import Tournament
+from src.analysis.results_db import ResultsDatabase
 from src.ai.difficulties import Difficulty
+from src.ai.disk_cache import DiskSearchCache
 
 
 def main():
     """Run a tournament between different difficulties."""
-    tournament = Tournament()
+    import os
+    os.makedirs('results/statistics', exist_ok=True)
+    os.makedirs('results/cache', exist_ok=True)
+    profile_memory = '--memory' in sys.argv[1:]
+    resume = '--resume' in sys.argv[1:]
+    memory_profiler = MemoryProfiler() if profile_memory else None
+    
+    # Finished games are stored as they end; --resume continues an
+    # interrupted tournament (with the same settings) instead of starting over
+    database_path = 'results/statistics/tournament.db'
+    if not resume and os.path.exists(database_path):
+        os.remove(database_path)
+    database = ResultsDatabase(database_path)
+    # Deep search results are kept on disk, so later runs are faster
+    disk_cache = DiskSearchCache('results/cache/search.cache')
+    tournament = Tournament(database=database, memory_profiler=memory_profiler,
+                            disk_cache=disk_cache)
     
     # Run matches between all difficulty levels
     difficulties = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD]
@@ -23,19 +47,38 @@ def main():
     print("Starting tournament...")
     print("=" * 50)
     
-    results = tournament.run_tournament(difficulties, games_per_match=2)
+    # Games run in parallel, longest expected games first; memory is
+    # only profiled in this process
+    if profile_memory:
+        memory_profiler.start()
+    results = tournament.run_tournament(
+        difficulties, games_per_match=2, resume=resume,
+        num_workers=1 if profile_memory else os.cpu_count() or 1)
+    if profile_memory:
+        memory_profiler.stop()
     
     # Print results
     tournament.print_results()
+    tournament.print_latency_table()
+    if profile_memory:
+        tournament.print_memory_table()
     
     # Save results to file
     import json
-    import os
-    os.makedirs('results/statistics', exist_ok=True)
     with open('results/statistics/tournament_results.json', 'w') as f:
         json.dump(results, f, indent=2)
     
+    tournament.export_move_log('results/statistics/tournament_moves.jsonl')
+    if profile_memory:
+        tournament.export_memory_report('results/statistics/tournament_memory.json')
+    
     print("\nResults saved to results/statistics/tournament_results.json")
+    print("Per-move timings saved to results/statistics/tournament_moves.jsonl")
+    if profile_memory:
+        print("Memory report saved to results/statistics/tournament_memory.json")
+    print("Games saved to results/statistics/tournament.db")
+    database.close()
+    disk_cache.close()
 
 
 if __name__ == "__main__":
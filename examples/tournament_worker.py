@@ -0,0 +1,31 @@
+"""
+Worker process for distributed tournaments.
+
+Connects to a coordinator and plays the games it sends until the
+coordinator stops:
+    python examples/tournament_worker.py [host] [port]
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import asyncio
+from src.server.distributed import run_worker
+
+
+def main():
+    """Play games for the coordinator given on the command line."""
+    host = sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1'
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8766
+    
+    print(f"Worker connecting to {host}:{port}")
+    games = asyncio.run(run_worker(host, port))
+    print(f"Coordinator finished; played {games} games")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Vectorized games example - thousands of shallow AI games in lockstep.
+
+Plays EASY against EASY with all games advanced together on NumPy
+arrays, then prints the results and the simulation throughput.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ai.difficulties import MillAI, Difficulty
+from src.analysis.vector_match import run_vector_match
+
+
+def main():
+    """Run a lockstep EASY vs EASY match and print the results."""
+    num_games = 500
+    print(f"Playing {num_games} EASY vs EASY games in lockstep...")
+    results = run_vector_match(MillAI(difficulty=Difficulty.EASY),
+                               MillAI(difficulty=Difficulty.EASY),
+                               num_games, seed=1)
+    
+    print(f"\nPlayer 1 wins: {results['ai1_wins']}")
+    print(f"Player 2 wins: {results['ai2_wins']}")
+    print(f"Draws:         {results['draws']}")
+    print(f"Average length: {results['avg_plies']:.1f} plies")
+    print(f"Elo difference (player 1): {results['elo']['elo']:+.0f}")
+    print(f"\n{results['total_time']:.1f}s, "
+          f"{results['games_per_second']:.1f} games/s")
+
+
+if __name__ == "__main__":
+    main()
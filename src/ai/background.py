@@ -0,0 +1,180 @@
+"""
+Background AI search for interactive play.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from .minimax import SearchAborted
+from .transposition import SharedTranspositionTable
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+    from .difficulties import MillAI
+
+
+class CancellationToken:
+    """
+    Thread-safe flag asking a running search to stop.
+    """
+    
+    def __init__(self):
+        """Initialize token (not cancelled)."""
+        self._event = threading.Event()
+    
+    def cancel(self):
+        """Ask the search to stop."""
+        self._event.set()
+    
+    def is_cancelled(self) -> bool:
+        """
+        Check whether the search was asked to stop.
+        
+        Returns:
+            True after cancel()
+        """
+        return self._event.is_set()
+
+
+class BackgroundSearch:
+    """
+    Runs an AI move search in a worker thread.
+    
+    The search deepens one ply at a time, reporting the best move after
+    each completed depth, so it can be stopped at any time and still
+    return the best move found so far. With num_moves above 1 it searches
+    the best few moves with their principal variations instead (e.g. as
+    hints for a human), and never plays a random move.
+    """
+    
+    # Size of the table shared between iterations when the AI has none
+    TABLE_ENTRIES = 1 << 16
+    
+    def __init__(self,
+                 ai: 'MillAI',
+                 on_progress: Callable[[dict], None] = None,
+                 num_moves: int = 1):
+        """
+        Initialize background search.
+        
+        Args:
+            ai: AI whose search settings and depth are used (it must not
+                be used elsewhere while the search runs)
+            on_progress: Called from the worker thread after each
+                completed depth with a dictionary of depth, best_move,
+                score and nodes (and top_moves with num_moves above 1)
+            num_moves: Number of best moves to search (see
+                MinimaxAI.get_top_moves)
+        """
+        self.ai = ai
+        self.on_progress = on_progress
+        self.num_moves = num_moves
+        self.token = CancellationToken()
+        self.best_move = None
+        self.best_score = None
+        self.completed_depth = 0
+        # (move, score, principal_variation) tuples of the last completed
+        # depth, best first (num_moves above 1 only)
+        self.top_moves = []
+        self._thread = None
+        self._fallback_move = None
+    
+    def start(self, model: 'MillModel', player: int):
+        """
+        Start searching a position.
+        
+        Args:
+            model: Current game state (copied before searching)
+            player: Player to move
+        """
+        self._thread = threading.Thread(target=self._run,
+                                        args=(model.clone(), player),
+                                        daemon=True)
+        self._thread.start()
+    
+    @property
+    def done(self) -> bool:
+        """True once the search has finished or stopped."""
+        return self._thread is not None and not self._thread.is_alive()
+    
+    def move_now(self):
+        """Stop the search; result() returns the best move found so far."""
+        self.token.cancel()
+    
+    def cancel(self):
+        """Stop the search without waiting for it."""
+        self.token.cancel()
+    
+    def result(self, timeout: float = None) -> Optional[List[int]]:
+        """
+        Wait for the search and get its move.
+        
+        Args:
+            timeout: Seconds to wait (None waits until the search ends)
+        
+        Returns:
+            Best move found (a legal move even if no depth completed), or
+            None if there is no legal move
+        """
+        self._thread.join(timeout)
+        if self.best_move is not None:
+            return self.best_move
+        return self._fallback_move
+    
+    def _run(self, model: 'MillModel', player: int):
+        """Iteratively deepen until the target depth or cancellation."""
+        legal_moves = model.legal_moves(player)
+        if not legal_moves:
+            return
+        self._fallback_move = list(legal_moves[0])
+        
+        # Random move with probability based on difficulty
+        if self.num_moves == 1 and self.ai.rng.random() < self.ai.random_prob:
+            self.best_move = list(self.ai.rng.choice(legal_moves))
+            return
+        
+        minimax = self.ai.minimax_ai
+        saved = (minimax.max_depth, minimax.should_stop,
+                 minimax.transposition_table)
+        own_table = None
+        # Lazy SMP workers keep a shared table of their own (and stop on
+        # should_stop too); get_top_moves always searches in-process
+        smp = minimax.num_workers > 1 and self.num_moves == 1
+        if minimax.transposition_table is None and not smp:
+            # Earlier iterations order the moves of later ones
+            own_table = SharedTranspositionTable(self.TABLE_ENTRIES)
+            minimax.transposition_table = own_table
+        minimax.should_stop = self.token.is_cancelled
+        
+        try:
+            for depth in range(1, self.ai.max_depth + 1):
+                minimax.max_depth = depth
+                try:
+                    if self.num_moves > 1:
+                        top_moves = minimax.get_top_moves(model, player,
+                                                          self.num_moves)
+                        move, score = top_moves[0][:2] if top_moves else (None, None)
+                    else:
+                        move, score = minimax.get_best_move(model, player)
+                except SearchAborted:
+                    break
+                if move is not None:
+                    self.best_move, self.best_score = move, score
+                    if self.num_moves > 1:
+                        self.top_moves = top_moves
+                self.completed_depth = depth
+                if self.on_progress is not None:
+                    progress = {'depth': depth,
+                                'best_move': self.best_move,
+                                'score': self.best_score,
+                                'nodes': minimax.nodes_evaluated}
+                    if self.num_moves > 1:
+                        progress['top_moves'] = self.top_moves
+                    self.on_progress(progress)
+                if self.token.is_cancelled():
+                    break
+        finally:
+            (minimax.max_depth, minimax.should_stop,
+             minimax.transposition_table) = saved
+            if own_table is not None:
+                own_table.close()
@@ -0,0 +1,198 @@
+"""
+Search cost prediction from recorded moves.
+"""
+
+import json
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+
+
+def position_features(model: 'MillModel', player: int) -> Dict:
+    """
+    Get the position properties that drive search cost.
+    
+    Args:
+        model: Game state
+        player: Player to move
+    
+    Returns:
+        Dictionary with mobility and pieces of both players and the
+        phase of the player to move
+    """
+    opponent = 2 if player == 1 else 1
+    return {
+        'mobility': len(model.legal_moves(player)),
+        'opponent_mobility': len(model.legal_moves(opponent)),
+        'pieces': int(model.count_pieces(player)),
+        'opponent_pieces': int(model.count_pieces(opponent)),
+        'phase': model.get_phase(player)
+    }
+
+
+class CostModel:
+    """
+    Predicts the nodes and time of a search from position features.
+    
+    Two log-linear models are fitted by least squares, one for the node
+    count and one for the time. The depth enters both directly and
+    multiplied by the log mobility of each player, so the predicted
+    cost grows like an effective branching factor raised to the depth.
+    Training samples are move log entries as recorded by Tournament
+    (position features plus depth, nodes and seconds).
+    """
+    
+    PHASES = ('placing', 'moving', 'flying')
+    
+    # Regularization keeping rarely seen features (e.g. flying) near zero
+    RIDGE = 1e-3
+    
+    def __init__(self):
+        """Initialize an untrained model."""
+        self.node_weights = None
+        self.time_weights = None
+        self.num_samples = 0
+    
+    @classmethod
+    def _feature_vector(cls, features: Dict, depth: int) -> List[float]:
+        """Build the regression inputs of one position and depth."""
+        mobility = math.log1p(features['mobility'])
+        opponent_mobility = math.log1p(features['opponent_mobility'])
+        return [
+            1.0,
+            float(depth),
+            depth * mobility,
+            depth * opponent_mobility,
+            mobility,
+            float(features['pieces']),
+            float(features['opponent_pieces'])
+        ] + [1.0 if features['phase'] == phase else 0.0
+             for phase in cls.PHASES[1:]]
+    
+    def fit(self, entries: Iterable[Dict]) -> 'CostModel':
+        """
+        Train the model on recorded moves.
+        
+        Moves without a search (random moves, zero nodes) are skipped.
+        
+        Args:
+            entries: Move log entries with mobility, opponent_mobility,
+                pieces, opponent_pieces, phase, depth, nodes and seconds
+        
+        Returns:
+            This model
+        
+        Raises:
+            ValueError: If there are no usable entries
+        """
+        import numpy as np
+        
+        rows, nodes, seconds = [], [], []
+        for entry in entries:
+            if entry.get('nodes', 0) <= 0 or entry.get('depth', 0) <= 0:
+                continue
+            rows.append(self._feature_vector(entry, entry['depth']))
+            nodes.append(math.log(entry['nodes']))
+            seconds.append(math.log(max(entry['seconds'], 1e-6)))
+        if not rows:
+            raise ValueError("No searched moves to train on")
+        
+        x = np.array(rows)
+        gram = x.T @ x + self.RIDGE * np.eye(x.shape[1])
+        self.node_weights = np.linalg.solve(gram, x.T @ np.array(nodes))
+        self.time_weights = np.linalg.solve(gram, x.T @ np.array(seconds))
+        self.num_samples = len(rows)
+        return self
+    
+    def predict_features(self, features: Dict, depth: int) -> Tuple[float, float]:
+        """
+        Predict the cost of a search from position features.
+        
+        Args:
+            features: Position features (see position_features)
+            depth: Search depth
+        
+        Returns:
+            Tuple of (expected nodes, expected seconds)
+        
+        Raises:
+            ValueError: If the model is not trained
+        """
+        import numpy as np
+        
+        if self.node_weights is None:
+            raise ValueError("Cost model is not trained")
+        x = np.array(self._feature_vector(features, depth))
+        return float(np.exp(x @ self.node_weights)), float(np.exp(x @ self.time_weights))
+    
+    def predict(self, model: 'MillModel', player: int, depth: int) -> Tuple[float, float]:
+        """
+        Predict the cost of searching a position.
+        
+        Args:
+            model: Game state
+            player: Player to move
+            depth: Search depth
+        
+        Returns:
+            Tuple of (expected nodes, expected seconds)
+        """
+        return self.predict_features(position_features(model, player), depth)
+    
+    def to_dict(self) -> Dict:
+        """
+        Serialize the trained weights.
+        
+        Returns:
+            JSON-compatible dictionary
+        """
+        return {
+            'node_weights': [float(w) for w in self.node_weights],
+            'time_weights': [float(w) for w in self.time_weights],
+            'num_samples': self.num_samples
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CostModel':
+        """
+        Deserialize trained weights.
+        
+        Args:
+            data: Dictionary created by to_dict
+        
+        Returns:
+            Trained cost model
+        """
+        import numpy as np
+        
+        model = cls()
+        model.node_weights = np.array(data['node_weights'])
+        model.time_weights = np.array(data['time_weights'])
+        model.num_samples = data['num_samples']
+        return model
+    
+    def save(self, path: str):
+        """
+        Write the trained weights to a JSON file.
+        
+        Args:
+            path: Output file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+    
+    @classmethod
+    def load(cls, path: str) -> 'CostModel':
+        """
+        Read trained weights from a JSON file.
+        
+        Args:
+            path: Weights file
+        
+        Returns:
+            Trained cost model
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
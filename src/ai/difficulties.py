@@ -4,10 +4,13 @@ Different AI difficulty levels for Mill game.
 
 import random
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from famnit_gym.envs.mill.mill_model import MillModel
+    from src.game.game_record import GameRecord
+    from .cost_model import CostModel
+    from .disk_cache import DiskSearchCache
     from .utility import UtilityFunction
     from .minimax import MinimaxAI
 
@@ -24,10 +27,20 @@ class MillAI:
     Mill AI agent with different difficulty levels.
     """
     
+    # Capacity of the search's leaf evaluation cache
+    EVAL_CACHE_SIZE = 1 << 16
+    
     def __init__(self, 
                  difficulty: Difficulty = Difficulty.HARD,
                  utility_function: 'UtilityFunction' = None,
-                 custom_depth: int = None):
+                 custom_depth: int = None,
+                 num_workers: int = 1,
+                 selective_search: bool = False,
+                 seed: int = None,
+                 node_budget: int = None,
+                 cost_model: 'CostModel' = None,
+                 latency_target: float = None,
+                 disk_cache: 'DiskSearchCache' = None):
         """
         Initialize Mill AI agent.
         
@@ -35,8 +48,24 @@ class MillAI:
             difficulty: AI difficulty level
             utility_function: Custom utility function
             custom_depth: Custom search depth
+            num_workers: Number of Lazy SMP search processes
+            selective_search: Enable late move reductions, futility
+                pruning and null-window re-searches
+            seed: Seed for the random moves (None uses the module-level
+                random generator)
+            node_budget: Search exactly this many nodes per move (see
+                MinimaxAI); with a seed, moves are then reproducible
+            cost_model: Trained predictor of search nodes and time
+            latency_target: Seconds a move should take; with a cost model,
+                each move is searched at the deepest depth (up to
+                max_depth) predicted to meet it
+            disk_cache: Persistent search cache shared between runs (see
+                MinimaxAI)
         """
         self.difficulty = difficulty
+        self.rng = random.Random(seed) if seed is not None else random
+        self.cost_model = cost_model
+        self.latency_target = latency_target
         
         # Configure based on difficulty
         if difficulty == Difficulty.EASY:
@@ -86,7 +115,16 @@ class MillAI:
         self.minimax_ai = MinimaxAI(
             utility_function=self.utility_function,
             max_depth=self.max_depth,
-            use_alpha_beta=True
+            use_alpha_beta=True,
+            num_workers=num_workers,
+            use_lmr=selective_search,
+            use_futility=selective_search,
+            use_pvs=selective_search,
+            eval_cache_size=self.EVAL_CACHE_SIZE,
+            split_captures=True,
+            use_flying_search=True,
+            node_budget=node_budget,
+            disk_cache=disk_cache
         )
     
     def get_move(self, model: 'MillModel', player: int) -> list:
@@ -106,14 +144,136 @@ class MillAI:
             return None
         
         # Random move with probability based on difficulty
-        if random.random() < self.random_prob:
-            return random.choice(legal_moves)
+        if self.rng.random() < self.random_prob:
+            # No search ran for this move
+            self.minimax_ai._reset_statistics()
+            return self.rng.choice(legal_moves)
         
         # Use minimax to find best move
-        best_move, _ = self.minimax_ai.get_best_move(model, player)
+        if self.cost_model is None or self.latency_target is None:
+            best_move, _ = self.minimax_ai.get_best_move(model, player)
+            return best_move
+        
+        depth = self.choose_depth(model, player)
+        try:
+            self.minimax_ai.max_depth = depth
+            best_move, _ = self.minimax_ai.get_best_move(model, player)
+        finally:
+            self.minimax_ai.max_depth = self.max_depth
         
         return best_move
     
+    def _search_depth(self, model: 'MillModel', depth: int) -> int:
+        """Get the depth actually searched for a depth setting."""
+        self.minimax_ai.max_depth = depth
+        try:
+            return self.minimax_ai._search_depth(model)
+        finally:
+            self.minimax_ai.max_depth = self.max_depth
+    
+    def predict_cost(self, model: 'MillModel', player: int,
+                     depth: int = None) -> tuple:
+        """
+        Predict the cost of searching a position.
+        
+        Args:
+            model: Current game state (transition model)
+            player: Current player (1 or 2)
+            depth: Depth setting (None: max_depth)
+        
+        Returns:
+            Tuple of (expected nodes, expected seconds)
+        
+        Raises:
+            ValueError: If the AI has no trained cost model
+        """
+        if self.cost_model is None:
+            raise ValueError("No cost model set")
+        depth = self.max_depth if depth is None else depth
+        return self.cost_model.predict(model, player,
+                                       self._search_depth(model, depth))
+    
+    def choose_depth(self, model: 'MillModel', player: int) -> int:
+        """
+        Pick the search depth for a position.
+        
+        Args:
+            model: Current game state (transition model)
+            player: Current player (1 or 2)
+        
+        Returns:
+            Deepest depth up to max_depth predicted to meet the latency
+            target (at least 1), or max_depth without a target or model
+        """
+        if self.cost_model is None or self.latency_target is None:
+            return self.max_depth
+        
+        from .cost_model import position_features
+        features = position_features(model, player)
+        for depth in range(self.max_depth, 1, -1):
+            _, seconds = self.cost_model.predict_features(
+                features, self._search_depth(model, depth))
+            if seconds <= self.latency_target:
+                return depth
+        return 1
+    
+    def expected_game_cost(self, records: Iterable['GameRecord']) -> dict:
+        """
+        Predict this AI's search cost per game.
+        
+        The AI is assumed to play one side of games like the recorded
+        ones; every recorded position counts half, and random moves cost
+        nothing.
+        
+        Args:
+            records: Sample games
+        
+        Returns:
+            Dictionary with the average moves, nodes and seconds per game
+        
+        Raises:
+            ValueError: If the AI has no cost model or no records are given
+        """
+        if self.cost_model is None:
+            raise ValueError("No cost model set")
+        
+        games = 0
+        moves = nodes = seconds = 0.0
+        for record in records:
+            games += 1
+            for state, player, _ in record.states():
+                if state.game_over() or not state.legal_moves(player):
+                    continue
+                move_nodes, move_seconds = self.predict_cost(
+                    state, player, self.choose_depth(state, player))
+                moves += 0.5
+                nodes += 0.5 * (1 - self.random_prob) * move_nodes
+                seconds += 0.5 * (1 - self.random_prob) * move_seconds
+        if games == 0:
+            raise ValueError("No games to estimate from")
+        
+        return {
+            'moves': moves / games,
+            'nodes': nodes / games,
+            'seconds': seconds / games
+        }
+    
+    def get_hints(self, model: 'MillModel', player: int,
+                  num_moves: int = 3) -> list:
+        """
+        Get the best moves for a player, e.g. as hints for a human.
+        
+        Args:
+            model: Current game state (transition model)
+            player: Player to give hints for (1 or 2)
+            num_moves: Number of moves
+        
+        Returns:
+            List of (move, evaluation_score, principal_variation) tuples,
+            best first
+        """
+        return self.minimax_ai.get_top_moves(model, player, num_moves)
+    
     def get_statistics(self) -> dict:
         """
         Get AI statistics from last move.
@@ -126,3 +286,48 @@ class MillAI:
         stats['max_depth'] = self.max_depth
         stats['random_prob'] = self.random_prob
         return stats
+    
+    def get_config(self) -> dict:
+        """
+        Get the settings needed to rebuild this AI elsewhere.
+        
+        Returns:
+            JSON-compatible dictionary (see from_config)
+        """
+        return {
+            'difficulty': self.difficulty.value,
+            'max_depth': self.max_depth,
+            'random_prob': self.random_prob,
+            'utility_weights': dict(self.utility_weights),
+            'node_budget': self.minimax_ai.node_budget,
+            'search_options': self.minimax_ai.search_options()
+        }
+    
+    @classmethod
+    def from_config(cls, config: dict) -> 'MillAI':
+        """
+        Build an AI from settings created by get_config.
+        
+        Args:
+            config: AI settings
+        
+        Returns:
+            New AI agent
+        """
+        from .utility import UtilityFunction
+        ai = cls(difficulty=Difficulty(config['difficulty']),
+                 utility_function=UtilityFunction(**config['utility_weights']),
+                 custom_depth=config['max_depth'],
+                 node_budget=config.get('node_budget'))
+        ai.utility_weights = dict(config['utility_weights'])
+        ai.random_prob = config['random_prob']
+        
+        # Selective search switches and other engine options
+        options = dict(config.get('search_options', {}))
+        if 'eval_cache_size' in options:
+            from .eval_cache import EvalCache
+            size = options.pop('eval_cache_size')
+            ai.minimax_ai.eval_cache = EvalCache(size) if size else None
+        for name, value in options.items():
+            setattr(ai.minimax_ai, name, value)
+        return ai
@@ -0,0 +1,219 @@
+"""
+Persistent search cache in a memory-mapped file.
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple
+
+from .transposition import _pack, _unpack
+
+MAGIC = b'MSRC'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+HEADER_BYTES = 64
+
+_VALID = 1 << 63
+_REFERENCED = 1 << 62  # Clock bit, set when an entry is used
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_ENTRY = struct.Struct('<QQ')
+
+
+class DiskSearchCache:
+    """
+    Fixed-size cache of search results that persists between runs.
+    
+    Results are keyed by canonical position hash (see
+    GameUtils.canonical_hash) and search profile (utility weights and the
+    search settings that change scores), so symmetric positions share
+    entries and different evaluations or search modes never mix. The
+    file is split into buckets of WAYS entries; when a bucket is full,
+    a clock hand sweeps it, giving recently used entries a second chance
+    before evicting the first one that was not used since the last
+    sweep. Entries use the (key XOR data, data) layout of
+    SharedTranspositionTable, so several processes may share the file.
+    """
+    
+    WAYS = 8
+    ENTRY_BYTES = 16
+    
+    def __init__(self,
+                 path: str,
+                 num_entries: int = 1 << 20,
+                 min_depth: int = 4):
+        """
+        Open (and create if needed) a cache file.
+        
+        Args:
+            path: Cache file
+            num_entries: Number of entries of a new file (rounded up to a
+                power of two); an existing file keeps its size
+            min_depth: Smallest remaining depth the search stores and
+                probes (shallower results are cheaper to search again)
+        
+        Raises:
+            ValueError: If the file exists but is not a search cache
+        """
+        self.path = path
+        self.min_depth = min_depth
+        
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER_BYTES:
+            self._file = open(path, 'r+b')
+            magic, version, ways, num_buckets = HEADER.unpack(
+                self._file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or ways != self.WAYS:
+                self._file.close()
+                raise ValueError(f"Not a version {VERSION} search cache: {path}")
+        else:
+            num_buckets = 1
+            while num_buckets * self.WAYS < num_entries:
+                num_buckets <<= 1
+            self._file = open(path, 'w+b')
+            self._file.truncate(HEADER_BYTES + num_buckets
+                                + num_buckets * self.WAYS * self.ENTRY_BYTES)
+            self._file.write(HEADER.pack(MAGIC, VERSION, self.WAYS, num_buckets))
+            self._file.flush()
+        
+        self.num_buckets = num_buckets
+        self.num_entries = num_buckets * self.WAYS
+        self._mask = num_buckets - 1
+        # Clock hands (one byte per bucket) follow the header
+        self._entries_offset = HEADER_BYTES + num_buckets
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _key(position_hash: int, profile_id: int) -> int:
+        """Combine a canonical position hash and a search profile id."""
+        return (position_hash ^ profile_id) & _MASK64
+    
+    def _slot_offset(self, bucket: int, way: int) -> int:
+        """Get the file offset of an entry."""
+        return (self._entries_offset
+                + (bucket * self.WAYS + way) * self.ENTRY_BYTES)
+    
+    def _find(self, key: int) -> Tuple[int, Optional[int]]:
+        """Find the bucket of a key and the offset of its entry, if any."""
+        bucket = key & self._mask
+        for way in range(self.WAYS):
+            offset = self._slot_offset(bucket, way)
+            check, data = _ENTRY.unpack_from(self._map, offset)
+            if data & _VALID and check ^ data == key:
+                return bucket, offset
+        return bucket, None
+    
+    def probe(self,
+              position_hash: int,
+              profile_id: int) -> Optional[Tuple[int, float, int, Optional[List[int]]]]:
+        """
+        Look up a position.
+        
+        Args:
+            position_hash: Canonical position hash
+            profile_id: Id of the utility weights and search settings
+        
+        Returns:
+            Tuple of (depth, score, bound, best_move) with the move on the
+            canonical board, or None on a miss
+        """
+        self.probes += 1
+        key = self._key(position_hash, profile_id)
+        _, offset = self._find(key)
+        if offset is None:
+            return None
+        
+        _, data = _ENTRY.unpack_from(self._map, offset)
+        if not data & _REFERENCED:
+            data |= _REFERENCED
+            _ENTRY.pack_into(self._map, offset, key ^ data, data)
+        self.hits += 1
+        return _unpack(data)
+    
+    def store(self,
+              position_hash: int,
+              profile_id: int,
+              depth: int,
+              score: float,
+              bound: int,
+              move: Optional[List[int]] = None):
+        """
+        Store a search result, keeping deeper results for the same position.
+        
+        Args:
+            position_hash: Canonical position hash
+            profile_id: Id of the utility weights and search settings
+            depth: Remaining depth the score was searched to
+            score: Search score
+            bound: EXACT, LOWER or UPPER
+            move: Best move on the canonical board, if any
+        """
+        key = self._key(position_hash, profile_id)
+        bucket, offset = self._find(key)
+        data = _pack(depth, score, bound, move)
+        if offset is not None:
+            _, old_data = _ENTRY.unpack_from(self._map, offset)
+            if ((old_data >> 32) & 0xFF) > depth:
+                return
+            data |= _REFERENCED
+        else:
+            # New entries are only kept past the next sweep if used
+            offset = self._victim(bucket)
+        
+        _ENTRY.pack_into(self._map, offset, key ^ data, data)
+        self.stores += 1
+    
+    def _victim(self, bucket: int) -> int:
+        """Choose the entry of a bucket that a new result replaces."""
+        for way in range(self.WAYS):
+            offset = self._slot_offset(bucket, way)
+            if not _ENTRY.unpack_from(self._map, offset)[1] & _VALID:
+                return offset
+        
+        # Clock sweep: clear reference bits until an unused entry comes up
+        # (at most one full turn, after which every bit is clear)
+        hand_offset = HEADER_BYTES + bucket
+        hand = self._map[hand_offset] % self.WAYS
+        while True:
+            offset = self._slot_offset(bucket, hand)
+            check, data = _ENTRY.unpack_from(self._map, offset)
+            hand = (hand + 1) % self.WAYS
+            if data & _REFERENCED:
+                # Only the clock bit changes, in the check word as well
+                _ENTRY.pack_into(self._map, offset, check ^ _REFERENCED,
+                                 data & ~_REFERENCED)
+                continue
+            self._map[hand_offset] = hand
+            self.evictions += 1
+            return offset
+    
+    def clear(self):
+        """Remove all entries."""
+        self._map[HEADER_BYTES:] = bytes(len(self._map) - HEADER_BYTES)
+    
+    def flush(self):
+        """Write changed entries to the file."""
+        if self._map is not None:
+            self._map.flush()
+    
+    def close(self):
+        """Flush and close the cache file."""
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+        self._map = None
+    
+    def __enter__(self) -> 'DiskSearchCache':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __getstate__(self):
+        raise TypeError("Open the cache by path instead of pickling it")
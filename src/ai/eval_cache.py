@@ -0,0 +1,81 @@
+"""
+Bounded cache of position evaluations.
+"""
+
+from typing import Optional
+
+
+class EvalCache:
+    """
+    Fixed-capacity, direct-mapped cache of utility function results.
+    
+    Entries are keyed by position hash plus the utility function's weight
+    profile id, and both are compared on lookup, so evaluations made with
+    different weights never answer each other's queries. A new entry
+    always replaces the one in its slot.
+    """
+    
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Initialize evaluation cache.
+        
+        Args:
+            capacity: Number of entries (rounded up to a power of two)
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self.clear()
+    
+    def clear(self):
+        """Remove all entries and reset the hit counters."""
+        self._hashes = [None] * self.capacity
+        self._profiles = [None] * self.capacity
+        self._values = [0.0] * self.capacity
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, position_hash: int, profile_id: int) -> Optional[float]:
+        """
+        Look up an evaluation.
+        
+        Args:
+            position_hash: 64-bit position hash
+            profile_id: Weight profile id of the utility function
+        
+        Returns:
+            Cached evaluation, or None on a miss
+        """
+        index = (position_hash ^ profile_id) & self._mask
+        if (self._hashes[index] == position_hash
+                and self._profiles[index] == profile_id):
+            self.hits += 1
+            return self._values[index]
+        self.misses += 1
+        return None
+    
+    def put(self, position_hash: int, profile_id: int, value: float):
+        """
+        Store an evaluation.
+        
+        Args:
+            position_hash: 64-bit position hash
+            profile_id: Weight profile id of the utility function
+            value: Evaluation score
+        """
+        index = (position_hash ^ profile_id) & self._mask
+        self._hashes[index] = position_hash
+        self._profiles[index] = profile_id
+        self._values[index] = value
+    
+    def hit_rate(self) -> float:
+        """
+        Get the fraction of lookups answered from the cache.
+        
+        Returns:
+            Hit rate between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
@@ -0,0 +1,220 @@
+"""
+Lazy SMP parallel search for Mill game.
+
+Worker processes search the same root position with iterative deepening.
+Helpers use other root move orders and alternate between the target depth
+and one ply deeper; all of them share one transposition table, so results
+found by any worker speed up the others.
+"""
+
+import math
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, List, Tuple
+
+from .minimax import MinimaxAI, SearchAborted
+from .transposition import SharedTranspositionTable, attach_shared_memory
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+    from .utility import UtilityFunction
+
+
+# Shared memory attached by the current worker process, keyed by name
+_worker_tables = {}
+_worker_controls = {}
+
+# Layout of the control block: the generation of the running search
+_CONTROL = struct.Struct('<Q')
+
+
+def _smp_worker(utility_function: 'UtilityFunction',
+                options: dict,
+                table_name: str,
+                table_entries: int,
+                control_name: str,
+                generation: int,
+                model: 'MillModel',
+                player: int,
+                depth: int,
+                move_order_seed: int) -> Tuple[int, List[int], float, int]:
+    """
+    Search one root position inside a worker process.
+    
+    Args:
+        utility_function: Evaluation function
+        options: Search settings (MinimaxAI keyword arguments)
+        table_name: Name of the shared transposition table
+        table_entries: Number of entries in the table
+        control_name: Name of the shared control word
+        generation: Search generation; the worker stops once the control
+            word no longer holds this value
+        model: Root position
+        player: Player to move
+        depth: Deepest iteration to search
+        move_order_seed: Seed for the root move order (None: unchanged)
+    
+    Returns:
+        Tuple of (completed_depth, best_move, score, nodes)
+    """
+    table = _worker_tables.get(table_name)
+    if table is None:
+        table = SharedTranspositionTable(table_entries, name=table_name)
+        _worker_tables[table_name] = table
+    
+    control = _worker_controls.get(control_name)
+    if control is None:
+        control = attach_shared_memory(control_name)
+        _worker_controls[control_name] = control
+    
+    def stopped() -> bool:
+        return _CONTROL.unpack_from(control.buf)[0] != generation
+    
+    ai = MinimaxAI(utility_function,
+                   max_depth=1,
+                   transposition_table=table,
+                   move_order_seed=move_order_seed,
+                   should_stop=stopped,
+                   **options)
+    
+    result = (0, None, 0.0)
+    nodes = 0
+    for iteration_depth in range(1, depth + 1):
+        ai.max_depth = iteration_depth
+        try:
+            move, score = ai.get_best_move(model, player)
+        except SearchAborted:
+            nodes += ai.nodes_evaluated
+            break
+        nodes += ai.nodes_evaluated
+        result = (iteration_depth, move, score)
+        if move is None or stopped():
+            break
+    
+    return result + (nodes,)
+
+
+class LazySMPSearch:
+    """
+    Lazy SMP search over a pool of worker processes.
+    """
+    
+    # Seconds between two checks of the search's stop condition
+    STOP_POLL_INTERVAL = 0.05
+    
+    def __init__(self,
+                 minimax_ai: MinimaxAI,
+                 num_workers: int,
+                 table_entries: int = 1 << 18,
+                 time_limit: float = None):
+        """
+        Initialize Lazy SMP search.
+        
+        Args:
+            minimax_ai: Search whose settings and depth the workers use
+            num_workers: Number of worker processes
+            table_entries: Size of the shared transposition table
+            time_limit: Seconds after which all workers are stopped and the
+                deepest completed result is used (None: no limit)
+        """
+        self.minimax_ai = minimax_ai
+        self.num_workers = num_workers
+        self.time_limit = time_limit
+        self.table = SharedTranspositionTable(table_entries)
+        self._control = shared_memory.SharedMemory(create=True,
+                                                   size=_CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, 0)
+        self._generation = 0
+        self._executor = ProcessPoolExecutor(max_workers=num_workers)
+    
+    def search(self, model: 'MillModel', player: int) -> Tuple[List[int], float]:
+        """
+        Search a position with all workers.
+        
+        The search ends when the main worker completes the target depth
+        (or the time limit expires); the result of the deepest completed
+        iteration over all workers is returned.
+        
+        Args:
+            model: Current game state
+            player: Current player (1 or 2)
+        
+        Returns:
+            Tuple of (best_move, evaluation_score)
+        
+        Raises:
+            SearchAborted: If the should_stop callback of the MinimaxAI
+                asks to stop (the workers are stopped first)
+        """
+        ai = self.minimax_ai
+        self._generation += 1
+        _CONTROL.pack_into(self._control.buf, 0, self._generation)
+        
+        # Workers search the already adjusted depth as given
+        depth = ai._search_depth(model)
+        options = dict(ai.search_options(), flying_depth_reduction=0)
+        futures = []
+        for index in range(self.num_workers):
+            # Worker 0 keeps the normal move order at the target depth;
+            # helpers diversify the tree they explore
+            futures.append(self._executor.submit(
+                _smp_worker,
+                ai.utility_function,
+                options,
+                self.table.name,
+                self.table.num_entries,
+                self._control.name,
+                self._generation,
+                model,
+                player,
+                depth + index % 2,
+                None if index == 0 else index))
+        
+        deadline = (time.monotonic() + self.time_limit
+                    if self.time_limit is not None else None)
+        pending = set(futures)
+        aborted = False
+        while futures[0] in pending:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            if ai.should_stop is not None:
+                timeout = min(timeout if timeout is not None else math.inf,
+                              self.STOP_POLL_INTERVAL)
+            done, pending = wait(pending, timeout=timeout,
+                                 return_when=FIRST_COMPLETED)
+            if ai.should_stop is not None and ai.should_stop():
+                aborted = True
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break  # Time limit reached
+        
+        # Stop the helpers and collect every worker's deepest iteration
+        _CONTROL.pack_into(self._control.buf, 0, 0)
+        results = [future.result() for future in futures]
+        ai.nodes_evaluated = sum(result[3] for result in results)
+        if aborted:
+            raise SearchAborted()
+        
+        best_depth, best_move, best_score = 0, None, (
+            -math.inf if player == 1 else math.inf)
+        for depth, move, score, _ in results:
+            # Ties go to the lowest worker index (the main worker first)
+            if move is not None and depth > best_depth:
+                best_depth, best_move, best_score = depth, move, score
+        
+        ai.completed_depth = best_depth
+        return best_move, best_score
+    
+    def close(self):
+        """Shut down the workers and free shared memory."""
+        if self._executor is None:
+            return
+        _CONTROL.pack_into(self._control.buf, 0, 0)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._control.close()
+        self._control.unlink()
+        self.table.close()
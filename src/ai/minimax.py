@@ -2,12 +2,26 @@
 Minimax algorithm with alpha-beta pruning for Mill game.
 """
 
+import hashlib
 import math
-from typing import TYPE_CHECKING, List, Tuple, Optional
+import random
+from typing import TYPE_CHECKING, Callable, List, Tuple, Optional, Set
+
+from src.game.game_utils import GameUtils
+from .transposition import EXACT, LOWER, UPPER, SharedTranspositionTable
+from .eval_cache import EvalCache
+from .node_context import NodeContext
+from .search_trace import FLAG_CUTOFF, FLAG_LEAF, FLAG_TT_HIT, SearchTracer
 
 if TYPE_CHECKING:
     from famnit_gym.envs.mill.mill_model import MillModel
     from .utility import UtilityFunction
+    from .lazy_smp import LazySMPSearch
+    from .disk_cache import DiskSearchCache
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when its stop condition becomes true."""
 
 
 class MinimaxAI:
@@ -15,10 +29,40 @@ class MinimaxAI:
     Minimax AI with alpha-beta pruning for Mill game.
     """
     
+    # Score of a position repeated along the search path
+    DRAW_SCORE = 0.0
+    
+    # Nodes between two calls of the stop condition
+    STOP_CHECK_INTERVAL = 256
+    
+    # Width of the window used for null-window (scout) searches
+    NULL_WINDOW = 1e-3
+    
+    # Size of the table created for Multi-PV searches without one
+    MULTI_PV_TABLE_ENTRIES = 1 << 16
+    
     def __init__(self, 
                  utility_function: 'UtilityFunction',
                  max_depth: int = 5,
-                 use_alpha_beta: bool = True):
+                 use_alpha_beta: bool = True,
+                 detect_repetitions: bool = True,
+                 transposition_table: 'SharedTranspositionTable' = None,
+                 num_workers: int = 1,
+                 move_order_seed: int = None,
+                 should_stop: Callable[[], bool] = None,
+                 use_lmr: bool = False,
+                 lmr_min_depth: int = 3,
+                 lmr_move_index: int = 3,
+                 use_futility: bool = False,
+                 futility_margin: float = 50.0,
+                 use_pvs: bool = False,
+                 eval_cache_size: int = 0,
+                 split_captures: bool = False,
+                 use_flying_search: bool = False,
+                 flying_depth_reduction: int = 1,
+                 node_budget: int = None,
+                 tracer: SearchTracer = None,
+                 disk_cache: 'DiskSearchCache' = None):
         """
         Initialize Minimax AI.
         
@@ -26,12 +70,162 @@ class MinimaxAI:
             utility_function: Function to evaluate board positions
             max_depth: Maximum search depth
             use_alpha_beta: Whether to use alpha-beta pruning
+            detect_repetitions: Whether to score cycles along the search
+                path as draws (alpha-beta search only)
+            transposition_table: Table for storing search results
+                (alpha-beta search only)
+            num_workers: Number of Lazy SMP worker processes (1 searches
+                in the calling process)
+            move_order_seed: Seed for shuffling root moves (None keeps
+                the generated order)
+            should_stop: Callable polled during the search; the search
+                raises SearchAborted once it returns True
+            use_lmr: Whether to search late quiet moves one ply shallower
+                (re-searched at full depth if they beat the bound)
+            lmr_min_depth: Minimum remaining depth for late move reductions
+            lmr_move_index: Index in the ordered move list from which
+                quiet moves are reduced
+            use_futility: Whether to skip quiet moves at frontier nodes
+                whose material score is too far below the window
+            futility_margin: Largest positional gain assumed possible for
+                one quiet move
+            use_pvs: Whether to search moves after the first one with a
+                null window, re-searching the ones that beat the bound
+            eval_cache_size: Capacity of the leaf evaluation cache
+                (0 disables it; alpha-beta search only)
+            split_captures: Whether to search a mill-forming move as one
+                move, followed by a separate choice of the captured piece
+                (alpha-beta search only)
+            use_flying_search: Whether to search only relevant flights of a
+                flying player (forming, opening or blocking mills, or
+                creating threats), most forcing first (alpha-beta only)
+            flying_depth_reduction: Plies removed from the search depth
+                while either player is flying (with use_flying_search)
+            node_budget: Search exactly this many nodes per move,
+                deepening iteratively up to max_depth, and play the best
+                move of the deepest completed iteration (None searches to
+                max_depth; always runs in the calling process)
+            tracer: Records sampled nodes of the searches run in the
+                calling process (alpha-beta search only)
+            disk_cache: Persistent cache of results of earlier runs,
+                consulted and filled at nodes with at least its min_depth
+                remaining plies (alpha-beta search in the calling process
+                only; node counts then depend on the cache contents)
+        
+        Raises:
+            ValueError: If lmr_min_depth is below 2 (a reduced move must
+                still be searched at least one ply deep)
         """
+        if lmr_min_depth < 2:
+            raise ValueError("lmr_min_depth must be at least 2")
         self.utility_function = utility_function
         self.max_depth = max_depth
         self.use_alpha_beta = use_alpha_beta
+        self.detect_repetitions = detect_repetitions
+        self.transposition_table = transposition_table
+        self.num_workers = num_workers
+        self.move_order_seed = move_order_seed
+        self.should_stop = should_stop
+        self.use_lmr = use_lmr
+        self.lmr_min_depth = lmr_min_depth
+        self.lmr_move_index = lmr_move_index
+        self.use_futility = use_futility
+        self.futility_margin = futility_margin
+        self.use_pvs = use_pvs
+        self.eval_cache = EvalCache(eval_cache_size) if eval_cache_size else None
+        self.split_captures = split_captures
+        self.use_flying_search = use_flying_search
+        self.flying_depth_reduction = flying_depth_reduction
+        self.node_budget = node_budget
+        self.tracer = tracer
+        self.disk_cache = disk_cache
+        self.completed_depth = 0
+        self._ply = 0
+        self._node_limit = None
+        self._smp = None
+        self._disk_profile = (None, None)
+        self._reset_statistics()
+    
+    def _reset_statistics(self):
+        """Reset the per-search counters."""
         self.nodes_evaluated = 0
         self.pruning_count = 0
+        self.repetition_count = 0
+        self.tt_cutoffs = 0
+        self.disk_cache_cutoffs = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.futility_prunes = 0
+        self.pvs_researches = 0
+        self.eval_cache_hits = 0
+        self.eval_cache_misses = 0
+        self.capture_cutoffs = 0
+        self.flying_prunes = 0
+    
+    def search_options(self) -> dict:
+        """
+        Get the settings that define search behaviour.
+        
+        Used to configure copies of this search in worker processes.
+        
+        Returns:
+            Keyword arguments for the MinimaxAI constructor
+        """
+        return {
+            'use_alpha_beta': self.use_alpha_beta,
+            'detect_repetitions': self.detect_repetitions,
+            'use_lmr': self.use_lmr,
+            'lmr_min_depth': self.lmr_min_depth,
+            'lmr_move_index': self.lmr_move_index,
+            'use_futility': self.use_futility,
+            'futility_margin': self.futility_margin,
+            'use_pvs': self.use_pvs,
+            'eval_cache_size': (self.eval_cache.capacity
+                                if self.eval_cache is not None else 0),
+            'split_captures': self.split_captures,
+            'use_flying_search': self.use_flying_search,
+            'flying_depth_reduction': self.flying_depth_reduction
+        }
+    
+    def _disk_profile_id(self) -> int:
+        """
+        Get the disk cache profile of this search.
+        
+        Besides the utility weights, it covers the settings that change
+        search scores (selective search, flying search, repetitions), so
+        selective and full-width results never mix across runs.
+        """
+        settings = (self.utility_function.profile_id, self.detect_repetitions,
+                    self.use_lmr, self.lmr_min_depth, self.lmr_move_index,
+                    self.use_futility, self.futility_margin, self.use_pvs,
+                    self.use_flying_search, self.flying_depth_reduction)
+        if settings != self._disk_profile[0]:
+            digest = hashlib.blake2b(repr(settings).encode(),
+                                     digest_size=8).digest()
+            self._disk_profile = (settings, int.from_bytes(digest, 'little'))
+        return self._disk_profile[1]
+    
+    @staticmethod
+    def _disk_position(model: 'MillModel',
+                       player: int) -> Tuple[Optional[int], Tuple[int, ...]]:
+        """
+        Get the disk cache hash of a position and its symmetry.
+        
+        While a player is placing, the pieces in hand are part of the
+        position (see GameUtils.placing_hash); if the model does not
+        expose them, the position is not cached (hash None).
+        """
+        position_hash, symmetry = GameUtils.canonical_hash(model, player)
+        if ((model.get_phase(1) == 'placing' or model.get_phase(2) == 'placing')
+                and GameUtils.pieces_in_hand(model) is None):
+            return None, symmetry
+        return position_hash, symmetry
+    
+    def close(self):
+        """Shut down Lazy SMP workers and free their shared table."""
+        if self._smp is not None:
+            self._smp.close()
+            self._smp = None
     
     def get_best_move(self, 
                      model: 'MillModel', 
@@ -46,51 +240,463 @@ class MinimaxAI:
         Returns:
             Tuple of (best_move, evaluation_score)
         """
-        self.nodes_evaluated = 0
-        self.pruning_count = 0
+        if self.node_budget is not None:
+            return self._search_node_budget(model, player)
         
-        legal_moves = model.legal_moves(player)
+        if self.num_workers > 1 and self.use_alpha_beta:
+            return self._lazy_smp().search(model, player)
         
+        top_moves = self._search_root(model, player, 1)
+        if not top_moves:
+            return None, -math.inf if player == 1 else math.inf
+        return top_moves[0]
+    
+    def _search_node_budget(self,
+                            model: 'MillModel',
+                            player: int) -> Tuple[List[int], float]:
+        """
+        Deepen iteratively until exactly node_budget nodes are searched.
+        
+        The work done depends only on the position and the settings, so
+        the chosen move and node count are the same on every run.
+        
+        Args:
+            model: Current game state (transition model)
+            player: Current player (1 or 2)
+        
+        Returns:
+            Tuple of (best_move, evaluation_score) of the deepest completed
+            iteration (the first legal move if none completed)
+        """
+        legal_moves = model.legal_moves(player)
         if not legal_moves:
+            self._reset_statistics()
             return None, -math.inf if player == 1 else math.inf
         
-        best_move = None
+        best_move = list(legal_moves[0])
         best_value = -math.inf if player == 1 else math.inf
+        nodes_used = 0
+        completed_depth = 0
+        max_depth = self.max_depth
+        
+        try:
+            for depth in range(1, max_depth + 1):
+                self.max_depth = depth
+                if self._search_depth(model) <= completed_depth:
+                    continue  # Same depth after the flying reduction
+                self._node_limit = self.node_budget - nodes_used
+                try:
+                    top_moves = self._search_root(model, player, 1)
+                except SearchAborted:
+                    nodes_used = self.node_budget
+                    break
+                nodes_used += self.nodes_evaluated
+                completed_depth = self.completed_depth
+                if top_moves:
+                    best_move, best_value = top_moves[0]
+        finally:
+            self.max_depth = max_depth
+            self._node_limit = None
+        
+        self.nodes_evaluated = nodes_used
+        self.completed_depth = completed_depth
+        return best_move, best_value
+    
+    def get_top_moves(self,
+                      model: 'MillModel',
+                      player: int,
+                      num_moves: int = 3) -> List[Tuple[List[int], float, List[List[int]]]]:
+        """
+        Find the best moves and their principal variations in one search.
+        
+        Each root move only has to beat the current k-th best score, so
+        the cost stays close to that of a single search. Runs in the
+        calling process even when Lazy SMP is enabled.
+        
+        Args:
+            model: Current game state (transition model)
+            player: Current player (1 or 2)
+            num_moves: Number of moves to return
+        
+        Returns:
+            List of (move, evaluation_score, principal_variation) tuples,
+            best first; the variation starts with the move itself
+        """
+        # Principal variations are read back from the transposition table
+        own_table = None
+        if self.transposition_table is None:
+            own_table = SharedTranspositionTable(self.MULTI_PV_TABLE_ENTRIES)
+            self.transposition_table = own_table
+        try:
+            top_moves = self._search_root(model, player, num_moves)
+            return [(move, value,
+                     self._principal_variation(model, player, move,
+                                               self.completed_depth))
+                    for move, value in top_moves]
+        finally:
+            if own_table is not None:
+                self.transposition_table = None
+                own_table.close()
+    
+    def _search_root(self,
+                     model: 'MillModel',
+                     player: int,
+                     num_moves: int) -> List[Tuple[List[int], float]]:
+        """
+        Search the root position for its best moves.
+        
+        Args:
+            model: Current game state
+            player: Current player (1 or 2)
+            num_moves: Number of moves that get exact scores
+        
+        Returns:
+            List of up to num_moves (move, evaluation_score) tuples, best
+            first (moves that cannot beat a lost position are left out)
+        """
+        self._reset_statistics()
+        self.completed_depth = 0
+        
+        legal_moves = model.legal_moves(player)
+        
+        if not legal_moves:
+            return []
+        
+        worst_value = -math.inf if player == 1 else math.inf
+        top_moves = []
+        opponent = 2 if player == 1 else 1
+        depth = self._search_depth(model)
+        
+        # Positions since the last irreversible move, for cycle detection
+        root_path = set()
+        key = None
+        if self.detect_repetitions or self.transposition_table is not None:
+            key = GameUtils.position_hash(model, player)
+        if self.detect_repetitions:
+            root_path.add(key)
+        
+        tt_move = None
+        if self.transposition_table is not None:
+            entry = self.transposition_table.probe(key)
+            if entry is not None:
+                tt_move = entry[3]
+        
+        # A root searched deep enough in an earlier run needs no search
+        disk_key = None
+        if (self.use_alpha_beta and self.disk_cache is not None
+                and depth >= self.disk_cache.min_depth):
+            disk_key, symmetry = self._disk_position(model, player)
+        if disk_key is not None:
+            entry = self.disk_cache.probe(disk_key, self._disk_profile_id())
+            if entry is not None and entry[3] is not None:
+                entry_depth, entry_score, bound, entry_move = entry
+                entry_move = GameUtils.transform_move(entry_move, symmetry,
+                                                      inverse=True)
+                if (num_moves == 1 and bound == EXACT and entry_depth >= depth
+                        and entry_move in [[int(x) for x in move]
+                                           for move in legal_moves]):
+                    self.disk_cache_cutoffs += 1
+                    self.completed_depth = depth
+                    return [(entry_move, entry_score)]
+                if tt_move is None:
+                    tt_move = entry_move
+        
+        legal_moves = list(legal_moves)
+        if self.move_order_seed is not None:
+            random.Random(self.move_order_seed).shuffle(legal_moves)
+        legal_moves = self._order_moves(legal_moves, tt_move)
+        self._ply = 1
         
         for move in legal_moves:
             # Clone model and make move
             new_model = model.clone()
             new_model.make_move(player, move)
             
-            # Evaluate position
+            # Score a move has to beat to enter the top moves
+            bound = (top_moves[-1][1] if len(top_moves) == num_moves
+                     else worst_value)
+            
+            # Evaluate position (the opponent moves next)
             if self.use_alpha_beta:
+                # Only moves that beat the bound need an exact score
+                alpha = bound if player == 1 else -math.inf
+                beta = bound if player == 2 else math.inf
                 value = self._minimax_ab(
                     new_model,
-                    self.max_depth - 1,
-                    -math.inf,
-                    math.inf,
-                    player == 1,  # True if maximizing
-                    2 if player == 1 else 1  # Opponent
+                    depth - 1,
+                    alpha,
+                    beta,
+                    opponent == 1,  # True if opponent is maximizing
+                    opponent,
+                    set() if GameUtils.is_irreversible(move) else root_path
                 )
             else:
                 value = self._minimax(
                     new_model,
-                    self.max_depth - 1,
-                    player == 1,
-                    2 if player == 1 else 1
+                    depth - 1,
+                    opponent == 1,
+                    opponent
                 )
             
-            # Update best move
-            if player == 1:  # Maximizing
-                if value > best_value:
-                    best_value = value
-                    best_move = move
-            else:  # Minimizing
-                if value < best_value:
-                    best_value = value
-                    best_move = move
+            # Update top moves (player 1 maximizes)
+            better = value > bound if player == 1 else value < bound
+            if better:
+                top_moves.append((move, value))
+                top_moves.sort(key=lambda item: -item[1] if player == 1
+                               else item[1])
+                del top_moves[num_moves:]
         
-        return best_move, best_value
+        # Scores that include repetition draws depend on the game history
+        if top_moves and self.repetition_count == 0:
+            if self.transposition_table is not None:
+                self.transposition_table.store(key, depth, top_moves[0][1],
+                                               EXACT, top_moves[0][0])
+            if disk_key is not None:
+                self.disk_cache.store(disk_key, self._disk_profile_id(),
+                                      depth, top_moves[0][1], EXACT,
+                                      GameUtils.transform_move(top_moves[0][0],
+                                                               symmetry))
+        
+        self.completed_depth = depth
+        return top_moves
+    
+    def _principal_variation(self,
+                             model: 'MillModel',
+                             player: int,
+                             move: List[int],
+                             length: int) -> List[List[int]]:
+        """
+        Follow the stored best moves after a root move.
+        
+        Args:
+            model: Root position
+            player: Player making the root move
+            move: Root move
+            length: Maximum number of moves
+        
+        Returns:
+            Moves of the variation, starting with the root move
+        """
+        variation = [[int(x) for x in move]]
+        model = model.clone()
+        model.make_move(player, move)
+        player = 2 if player == 1 else 1
+        seen = set()
+        
+        while len(variation) < length and not model.game_over():
+            key = GameUtils.position_hash(model, player)
+            if key in seen:
+                break
+            seen.add(key)
+            
+            entry = self.transposition_table.probe(key)
+            if entry is None or entry[3] is None:
+                break
+            next_move = entry[3]
+            if next_move not in [[int(x) for x in legal_move]
+                                 for legal_move in model.legal_moves(player)]:
+                break
+            
+            variation.append(next_move)
+            model.make_move(player, next_move)
+            player = 2 if player == 1 else 1
+        
+        return variation
+    
+    def _search_depth(self, model: 'MillModel') -> int:
+        """
+        Get the depth for searching a root position.
+        
+        Flying multiplies the number of moves, so the depth is reduced
+        while either player flies.
+        
+        Args:
+            model: Root position
+        
+        Returns:
+            Search depth
+        """
+        if (self.use_alpha_beta and self.use_flying_search
+                and self.flying_depth_reduction > 0
+                and 'flying' in (model.get_phase(1), model.get_phase(2))):
+            return max(1, self.max_depth - self.flying_depth_reduction)
+        return self.max_depth
+    
+    def _lazy_smp(self) -> 'LazySMPSearch':
+        """Get the Lazy SMP search, starting its workers on first use."""
+        if self._smp is None:
+            from .lazy_smp import LazySMPSearch
+            self._smp = LazySMPSearch(self, self.num_workers)
+        return self._smp
+    
+    def _order_moves(self,
+                     legal_moves: List[List[int]],
+                     tt_move: Optional[List[int]]) -> List[List[int]]:
+        """
+        Order moves for search.
+        
+        The stored best move comes first, then captures, then quiet moves,
+        each group in generation order.
+        
+        Args:
+            legal_moves: Moves to order
+            tt_move: Best move from the transposition table, if any
+        
+        Returns:
+            Ordered list of moves
+        """
+        first = []
+        captures = []
+        quiet = []
+        for move in legal_moves:
+            if tt_move is not None and not first and list(move) == tt_move:
+                first.append(move)
+            elif move[2] > 0:
+                captures.append(move)
+            else:
+                quiet.append(move)
+        return first + captures + quiet
+    
+    def _flying_moves(self,
+                      model: 'MillModel',
+                      legal_moves: List[List[int]],
+                      current_player: int,
+                      context: NodeContext = None) -> List[List[int]]:
+        """
+        Select and order the relevant moves of a flying player.
+        
+        Mill-forming moves come first, then flights that block an opponent
+        threat, then flights that open one of the mover's mills or create a
+        new threat. Other flights are pruned, unless no move is relevant.
+        
+        Args:
+            model: Game state
+            legal_moves: Legal moves of the flying player
+            current_player: Player to move
+            context: Search node context of the position
+        
+        Returns:
+            Relevant moves, most forcing first
+        """
+        board = context.board if context is not None else model.get_state()
+        opponent = 2 if current_player == 1 else 1
+        
+        # Empty points that complete an opponent mill
+        blocking_points = set()
+        for mill in GameUtils.MILL_TRIPLETS:
+            owners = [board[pos - 1] for pos in mill]
+            if owners.count(opponent) == 2 and owners.count(0) == 1:
+                blocking_points.add(mill[owners.index(0)])
+        
+        def creates_threat(src: int, dst: int) -> bool:
+            for mill in GameUtils.MILL_TRIPLETS:
+                if src in mill and dst not in mill:
+                    # Leaving a mill threatens to close it again
+                    if all(board[pos - 1] == current_player for pos in mill):
+                        return True
+                elif dst in mill:
+                    own = sum(1 for pos in mill if pos != dst and pos != src
+                              and board[pos - 1] == current_player)
+                    empty = sum(1 for pos in mill if pos != dst
+                                and (pos == src or board[pos - 1] == 0))
+                    if own == 1 and empty == 1:
+                        return True
+            return False
+        
+        captures = []
+        blocks = []
+        threats = []
+        for move in legal_moves:
+            src, dst, capture = move
+            if capture > 0:
+                captures.append(move)
+            elif dst in blocking_points:
+                blocks.append(move)
+            elif creates_threat(src, dst):
+                threats.append(move)
+        
+        relevant = captures + blocks + threats
+        if not relevant:
+            return list(legal_moves)
+        self.flying_prunes += len(legal_moves) - len(relevant)
+        return relevant
+    
+    def _group_captures(self, legal_moves: List[List[int]]) -> List[List[List[int]]]:
+        """
+        Split ordered moves into search stages.
+        
+        With split_captures, all captures after the same mill-forming move
+        share one stage; otherwise every move is a stage of its own.
+        Stages keep the order of their first move.
+        
+        Args:
+            legal_moves: Ordered moves
+        
+        Returns:
+            List of stages (lists of moves)
+        """
+        if not self.split_captures:
+            return [[move] for move in legal_moves]
+        
+        stages = []
+        groups = {}
+        for move in legal_moves:
+            if move[2] > 0:
+                step = (move[0], move[1])
+                if step in groups:
+                    groups[step].append(move)
+                    continue
+                groups[step] = [move]
+                stages.append(groups[step])
+            else:
+                stages.append([move])
+        return stages
+    
+    def _order_captures(self,
+                        model: 'MillModel',
+                        captures: List[List[int]],
+                        current_player: int,
+                        tt_move: Optional[List[int]]) -> List[List[int]]:
+        """
+        Order the capture choices of one mill-forming move.
+        
+        The stored best move comes first. Other captures are ordered by how
+        many opponent threats (two pieces and an empty point on a line) the
+        captured piece belongs to, then by how many of the mover's lines
+        it blocks.
+        
+        Args:
+            model: Game state before the move
+            captures: Moves sharing source and destination
+            current_player: Player forming the mill
+            tt_move: Best move from the transposition table, if any
+        
+        Returns:
+            Ordered list of moves
+        """
+        board = list(model.get_state())
+        src, dst = captures[0][0], captures[0][1]
+        if src:
+            board[src - 1] = 0
+        board[dst - 1] = current_player
+        opponent = 2 if current_player == 1 else 1
+        
+        def priority(move: List[int]) -> Tuple[int, int, int]:
+            if tt_move is not None and list(move) == tt_move:
+                return (1, 0, 0)
+            threats = 0
+            blocks = 0
+            for mill in GameUtils.MILL_TRIPLETS:
+                if move[2] not in mill:
+                    continue
+                owners = [board[pos - 1] for pos in mill]
+                if owners.count(opponent) == 2 and owners.count(0) == 1:
+                    threats += 1
+                elif owners.count(current_player) == 2:
+                    blocks += 1
+            return (0, threats, blocks)
+        
+        return sorted(captures, key=priority, reverse=True)
     
     def _minimax(self, 
                 model: 'MillModel',
@@ -109,6 +715,8 @@ class MinimaxAI:
         Returns:
             Evaluation score
         """
+        if self._node_limit is not None and self.nodes_evaluated >= self._node_limit:
+            raise SearchAborted()
         self.nodes_evaluated += 1
         
         # Terminal conditions
@@ -116,11 +724,12 @@ class MinimaxAI:
             # Evaluate from perspective of player 1
             return self.utility_function.evaluate(model, 1)
         
-        legal_moves = model.legal_moves(current_player)
+        context = NodeContext(model)
+        legal_moves = context.legal_moves(current_player)
         
         if not legal_moves:
             # No legal moves - evaluate current position
-            return self.utility_function.evaluate(model, 1)
+            return self.utility_function.evaluate(model, 1, context)
         
         opponent = 2 if current_player == 1 else 1
         
@@ -157,7 +766,8 @@ class MinimaxAI:
                    alpha: float,
                    beta: float,
                    maximizing: bool,
-                   current_player: int) -> float:
+                   current_player: int,
+                   path: Optional[Set[int]] = None) -> float:
         """
         Minimax with alpha-beta pruning.
         
@@ -168,67 +778,338 @@ class MinimaxAI:
             beta: Best value for minimizing player
             maximizing: True if maximizing player's turn
             current_player: Current player (1 or 2)
+            path: Hashes of the positions on the search path since the
+                last irreversible move
         
         Returns:
             Evaluation score
         """
+        if self._node_limit is not None and self.nodes_evaluated >= self._node_limit:
+            raise SearchAborted()
         self.nodes_evaluated += 1
         
+        if (self.should_stop is not None
+                and self.nodes_evaluated % self.STOP_CHECK_INTERVAL == 0
+                and self.should_stop()):
+            raise SearchAborted()
+        
         # Terminal conditions
-        if depth == 0 or model.game_over():
+        if model.game_over():
             return self.utility_function.evaluate(model, 1)
         
-        legal_moves = model.legal_moves(current_player)
+        key = None
+        if (self.detect_repetitions or self.transposition_table is not None
+                or self.eval_cache is not None or self.tracer is not None):
+            key = GameUtils.position_hash(model, current_player)
+        node_alpha, node_beta = alpha, beta
+        
+        # A position repeated on the current path is a draw
+        if self.detect_repetitions:
+            if path is None:
+                path = set()
+            if key in path:
+                self.repetition_count += 1
+                return self.DRAW_SCORE
+        
+        # Move lists and board of this node, shared with the evaluation
+        context = NodeContext(model)
+        
+        if depth <= 0:
+            value = self._evaluate(model, key, current_player, context)
+            if self.tracer is not None:
+                self._trace(model, key, depth, current_player, FLAG_LEAF, 0,
+                            -1, node_alpha, node_beta, value)
+            return value
+        
+        # Reuse stored results that were searched at least as deep
+        tt_move = None
+        if self.transposition_table is not None:
+            entry = self.transposition_table.probe(key)
+            if entry is not None:
+                entry_depth, entry_score, bound, tt_move = entry
+                if entry_depth >= depth:
+                    if bound == LOWER:
+                        alpha = max(alpha, entry_score)
+                    elif bound == UPPER:
+                        beta = min(beta, entry_score)
+                    if bound == EXACT or beta <= alpha:
+                        self.tt_cutoffs += 1
+                        if self.tracer is not None:
+                            self._trace(model, key, depth, current_player,
+                                        FLAG_TT_HIT, 0, -1, node_alpha,
+                                        node_beta, entry_score)
+                        return entry_score
+        
+        # Results of earlier runs, shared between symmetric positions
+        disk_key = None
+        if self.disk_cache is not None and depth >= self.disk_cache.min_depth:
+            disk_key, symmetry = self._disk_position(model, current_player)
+        if disk_key is not None:
+            entry = self.disk_cache.probe(disk_key, self._disk_profile_id())
+            if entry is not None:
+                entry_depth, entry_score, bound, entry_move = entry
+                if tt_move is None and entry_move is not None:
+                    tt_move = GameUtils.transform_move(entry_move, symmetry,
+                                                       inverse=True)
+                if entry_depth >= depth:
+                    if bound == LOWER:
+                        alpha = max(alpha, entry_score)
+                    elif bound == UPPER:
+                        beta = min(beta, entry_score)
+                    if bound == EXACT or beta <= alpha:
+                        self.disk_cache_cutoffs += 1
+                        if self.tracer is not None:
+                            self._trace(model, key, depth, current_player,
+                                        FLAG_TT_HIT, 0, -1, node_alpha,
+                                        node_beta, entry_score)
+                        return entry_score
+        alpha_orig, beta_orig = alpha, beta
+        
+        legal_moves = context.legal_moves(current_player)
         
         if not legal_moves:
-            return self.utility_function.evaluate(model, 1)
+            value = self.utility_function.evaluate(model, 1, context)
+            if self.tracer is not None:
+                self._trace(model, key, depth, current_player, FLAG_LEAF, 0,
+                            -1, node_alpha, node_beta, value)
+            return value
         
-        opponent = 2 if current_player == 1 else 1
+        if (self.use_flying_search
+                and model.get_phase(current_player) == 'flying'):
+            legal_moves = self._flying_moves(model, legal_moves, current_player,
+                                             context)
         
-        if maximizing:
-            max_eval = -math.inf
-            for move in legal_moves:
-                new_model = model.clone()
-                new_model.make_move(current_player, move)
-                eval_score = self._minimax_ab(
-                    new_model,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    False,
-                    opponent
-                )
-                max_eval = max(max_eval, eval_score)
+        legal_moves = self._order_moves(list(legal_moves), tt_move)
+        stages = self._group_captures(legal_moves)
+        
+        # Futility pruning: at frontier nodes far outside the window, a
+        # quiet move cannot make up the difference
+        futility_value = None
+        if self.use_futility and depth == 1:
+            material = self.utility_function.material_score(model, 1, context)
+            if maximizing and material + self.futility_margin <= alpha:
+                futility_value = material + self.futility_margin
+            elif not maximizing and material - self.futility_margin >= beta:
+                futility_value = material - self.futility_margin
+        
+        if self.detect_repetitions:
+            path.add(key)
+        # Repetition draws found below this node (see the stores below)
+        repetitions = self.repetition_count
+        
+        best_move = None
+        best_eval = -math.inf if maximizing else math.inf
+        searched = 0
+        cutoff_index = -1
+        
+        for index, stage in enumerate(stages):
+            quiet = stage[0][2] == 0 and index > 0
+            
+            if futility_value is not None and quiet:
+                self.futility_prunes += 1
+                if maximizing:
+                    best_eval = max(best_eval, futility_value)
+                else:
+                    best_eval = min(best_eval, futility_value)
+                continue
+            
+            # Null window just around the bound this move has to beat
+            if maximizing:
+                scout_alpha, scout_beta = alpha, alpha + self.NULL_WINDOW
+            else:
+                scout_alpha, scout_beta = beta - self.NULL_WINDOW, beta
+            
+            full_depth = True
+            if (self.use_lmr and quiet and depth >= self.lmr_min_depth
+                    and index >= self.lmr_move_index):
+                # Late move reduction: verify with a shallower scout search
+                # (two plies for the latest moves when depth allows)
+                reduction = 2 if (index >= 3 * self.lmr_move_index
+                                  and depth > self.lmr_min_depth) else 1
+                self.lmr_reductions += 1
+                eval_score, move = self._search_stage(
+                    model, stage, max(0, depth - 1 - reduction), scout_alpha,
+                    scout_beta, maximizing, current_player, path, tt_move)
+                full_depth = (eval_score > alpha if maximizing
+                              else eval_score < beta)
+                if full_depth:
+                    self.lmr_researches += 1
+            
+            if full_depth:
+                if self.use_pvs and searched > 0:
+                    eval_score, move = self._search_stage(
+                        model, stage, depth - 1, scout_alpha, scout_beta,
+                        maximizing, current_player, path, tt_move)
+                    if alpha < eval_score < beta:
+                        self.pvs_researches += 1
+                        eval_score, move = self._search_stage(
+                            model, stage, depth - 1, alpha, beta,
+                            maximizing, current_player, path, tt_move)
+                else:
+                    eval_score, move = self._search_stage(
+                        model, stage, depth - 1, alpha, beta,
+                        maximizing, current_player, path, tt_move)
+            searched += 1
+            
+            if maximizing:
+                if eval_score > best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 alpha = max(alpha, eval_score)
-                
-                # Alpha-beta pruning
-                if beta <= alpha:
-                    self.pruning_count += 1
-                    break
+            else:
+                if eval_score < best_eval:
+                    best_eval = eval_score
+                    best_move = move
+                beta = min(beta, eval_score)
             
-            return max_eval
-        else:
-            min_eval = math.inf
-            for move in legal_moves:
-                new_model = model.clone()
-                new_model.make_move(current_player, move)
-                eval_score = self._minimax_ab(
-                    new_model,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    True,
-                    opponent
-                )
-                min_eval = min(min_eval, eval_score)
+            # Alpha-beta pruning
+            if beta <= alpha:
+                self.pruning_count += 1
+                cutoff_index = index
+                break
+        
+        if self.detect_repetitions:
+            path.discard(key)
+        
+        if self.tracer is not None:
+            self._trace(model, key, depth, current_player,
+                        FLAG_CUTOFF if cutoff_index >= 0 else 0, len(stages),
+                        cutoff_index, node_alpha, node_beta, best_eval)
+        
+        # A score that includes a repetition draw depends on the path that
+        # led here, so it is not reused elsewhere in the tree or later runs
+        if ((self.transposition_table is not None or disk_key is not None)
+                and self.repetition_count == repetitions):
+            if best_eval <= alpha_orig:
+                bound = UPPER
+            elif best_eval >= beta_orig:
+                bound = LOWER
+            else:
+                bound = EXACT
+            if self.transposition_table is not None:
+                self.transposition_table.store(key, depth, best_eval, bound,
+                                               best_move)
+            if disk_key is not None:
+                self.disk_cache.store(
+                    disk_key, self._disk_profile_id(), depth,
+                    best_eval, bound,
+                    (GameUtils.transform_move(best_move, symmetry)
+                     if best_move is not None else None))
+        
+        return best_eval
+    
+    def _search_stage(self,
+                      model: 'MillModel',
+                      stage: List[List[int]],
+                      depth: int,
+                      alpha: float,
+                      beta: float,
+                      maximizing: bool,
+                      current_player: int,
+                      path: Optional[Set[int]],
+                      tt_move: Optional[List[int]]) -> Tuple[float, List[int]]:
+        """
+        Search one stage: a single move, or the capture choices of a
+        mill-forming move with their own ordering and cutoffs.
+        
+        Args:
+            model: Game state before the move
+            stage: Moves of the stage
+            depth: Remaining depth below the move
+            alpha: Best value for maximizing player
+            beta: Best value for minimizing player
+            maximizing: True if the mover is the maximizing player
+            current_player: Player making the move
+            path: Hashes of the positions on the search path
+            tt_move: Best move from the transposition table, if any
+        
+        Returns:
+            Tuple of (score, best move of the stage)
+        """
+        if len(stage) > 1:
+            stage = self._order_captures(model, stage, current_player, tt_move)
+        opponent = 2 if current_player == 1 else 1
+        
+        best_move = None
+        best_eval = -math.inf if maximizing else math.inf
+        for index, move in enumerate(stage):
+            new_model = model.clone()
+            new_model.make_move(current_player, move)
+            child_path = set() if GameUtils.is_irreversible(move) else path
+            self._ply += 1
+            eval_score = self._minimax_ab(new_model, depth, alpha, beta,
+                                          not maximizing, opponent, child_path)
+            self._ply -= 1
+            
+            if maximizing:
+                if eval_score > best_eval:
+                    best_eval = eval_score
+                    best_move = move
+                alpha = max(alpha, eval_score)
+            else:
+                if eval_score < best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 beta = min(beta, eval_score)
-                
-                # Alpha-beta pruning
-                if beta <= alpha:
-                    self.pruning_count += 1
-                    break
             
-            return min_eval
+            # The remaining captures cannot change the result
+            if beta <= alpha and index < len(stage) - 1:
+                self.capture_cutoffs += 1
+                break
+        
+        return best_eval, best_move
+    
+    def _trace(self,
+               model: 'MillModel',
+               key: int,
+               depth: int,
+               current_player: int,
+               flags: int,
+               moves: int,
+               cutoff_index: int,
+               alpha: float,
+               beta: float,
+               value: float):
+        """Record a node in the trace if it is sampled."""
+        if self.tracer.wants(key, self._ply):
+            self.tracer.record(key, self._ply, depth,
+                               model.get_phase(current_player), flags, moves,
+                               cutoff_index, alpha, beta, value)
+    
+    def _evaluate(self,
+                  model: 'MillModel',
+                  key: Optional[int],
+                  current_player: int,
+                  context: NodeContext = None) -> float:
+        """
+        Evaluate a leaf position for player 1, using the evaluation cache.
+        
+        Args:
+            model: Game state
+            key: Position hash (with current_player to move), if computed
+            current_player: Player to move
+            context: Search node context of the position
+        
+        Returns:
+            Evaluation score
+        """
+        if self.eval_cache is None or key is None:
+            return self.utility_function.evaluate(model, 1, context)
+        
+        # The evaluation does not depend on the side to move
+        if current_player == 2:
+            key ^= GameUtils.ZOBRIST_SIDE
+        profile_id = self.utility_function.profile_id
+        
+        value = self.eval_cache.get(key, profile_id)
+        if value is not None:
+            self.eval_cache_hits += 1
+            return value
+        
+        self.eval_cache_misses += 1
+        value = self.utility_function.evaluate(model, 1, context)
+        self.eval_cache.put(key, profile_id, value)
+        return value
     
     def get_statistics(self) -> dict:
         """
@@ -240,6 +1121,22 @@ class MinimaxAI:
         return {
             'nodes_evaluated': self.nodes_evaluated,
             'pruning_count': self.pruning_count,
+            'repetitions_detected': self.repetition_count,
+            'tt_cutoffs': self.tt_cutoffs,
+            'disk_cache_cutoffs': self.disk_cache_cutoffs,
+            'completed_depth': self.completed_depth,
+            'lmr_reductions': self.lmr_reductions,
+            'lmr_researches': self.lmr_researches,
+            'futility_prunes': self.futility_prunes,
+            'pvs_researches': self.pvs_researches,
+            'capture_cutoffs': self.capture_cutoffs,
+            'flying_prunes': self.flying_prunes,
+            'eval_cache_hits': self.eval_cache_hits,
+            'eval_cache_misses': self.eval_cache_misses,
+            'eval_cache_hit_rate': (
+                self.eval_cache_hits
+                / (self.eval_cache_hits + self.eval_cache_misses)
+                if self.eval_cache_hits + self.eval_cache_misses > 0 else 0),
             'pruning_ratio': (self.pruning_count / self.nodes_evaluated 
                             if self.nodes_evaluated > 0 else 0)
         }
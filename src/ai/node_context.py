@@ -0,0 +1,55 @@
+"""
+Per-node cache shared by the search and the evaluation.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+
+
+class NodeContext:
+    """
+    Move lists and board of one search node, each computed at most once.
+    
+    The search creates one context per node and passes it to the
+    evaluation, so mobility reuses the moves the search generated (and
+    the other way round) instead of generating them again.
+    """
+    
+    __slots__ = ('model', '_moves', '_board')
+    
+    def __init__(self, model: 'MillModel'):
+        """
+        Initialize context.
+        
+        Args:
+            model: Position of the node (must not change while the
+                context is used)
+        """
+        self.model = model
+        self._moves: Dict[int, List[List[int]]] = {}
+        self._board = None
+    
+    def legal_moves(self, player: int) -> List[List[int]]:
+        """
+        Get a player's legal moves.
+        
+        Args:
+            player: Player (1 or 2)
+        
+        Returns:
+            Legal moves [src, dst, capture]
+        """
+        moves = self._moves.get(player)
+        if moves is None:
+            moves = self.model.legal_moves(player)
+            self._moves[player] = moves
+        return moves
+    
+    @property
+    def board(self) -> Sequence[int]:
+        """The 24 board cells (0 empty, 1 or 2 for the owner)."""
+        if self._board is None:
+            self._board = self.model.get_state()
+        return self._board
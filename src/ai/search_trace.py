@@ -0,0 +1,209 @@
+"""
+Compact binary traces of search trees.
+
+A trace file starts with a short header followed by fixed-size node
+records (see RECORD). Nodes are sampled by position hash, so a sampled
+position is traced every time the search visits it, and only nodes up to
+a maximum distance from the root are considered.
+"""
+
+import math
+import struct
+from collections import namedtuple
+from typing import BinaryIO, Dict, Iterable, Iterator, Union
+
+MAGIC = b'MTRC'
+VERSION = 1
+HEADER = struct.Struct('<4sH')
+
+# key, ply, remaining depth, phase, flags, moves, cutoff index, alpha,
+# beta, eval
+RECORD = struct.Struct('<QBbBBhhfff')
+
+PHASES = ('placing', 'moving', 'flying', 'lost')
+
+FLAG_LEAF = 1
+FLAG_CUTOFF = 2
+FLAG_TT_HIT = 4
+
+TraceRecord = namedtuple('TraceRecord', ['key', 'ply', 'depth', 'phase', 'flags',
+                                         'moves', 'cutoff_index', 'alpha',
+                                         'beta', 'eval'])
+
+_MASK = (1 << 64) - 1
+_SAMPLE_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+class SearchTracer:
+    """
+    Writes sampled search nodes to a binary trace file.
+    """
+    
+    # Records buffered before writing to the file
+    BUFFER_RECORDS = 4096
+    
+    def __init__(self,
+                 output: Union[str, BinaryIO],
+                 sample_rate: float = 1.0,
+                 max_ply: int = None):
+        """
+        Initialize tracer.
+        
+        Args:
+            output: Trace file path, or a binary file object
+            sample_rate: Fraction of positions traced (chosen by hash)
+            max_ply: Only trace nodes at most this many plies below the
+                root (None: all nodes)
+        """
+        if isinstance(output, str):
+            self._file = open(output, 'wb')
+            self._owns_file = True
+        else:
+            self._file = output
+            self._owns_file = False
+        self.sample_rate = sample_rate
+        self.max_ply = max_ply
+        self._threshold = min(int(sample_rate * (1 << 64)), 1 << 64)
+        self._buffer = bytearray()
+        self._buffered = 0
+        self.records_written = 0
+        self._file.write(HEADER.pack(MAGIC, VERSION))
+    
+    def wants(self, key: int, ply: int) -> bool:
+        """
+        Check whether a node is traced.
+        
+        Args:
+            key: Position hash
+            ply: Distance from the root
+        
+        Returns:
+            True if the node passes the depth limit and the sampling
+        """
+        if self.max_ply is not None and ply > self.max_ply:
+            return False
+        return (key * _SAMPLE_MULTIPLIER) & _MASK < self._threshold
+    
+    def record(self, key: int, ply: int, depth: int, phase: str, flags: int,
+               moves: int, cutoff_index: int, alpha: float, beta: float,
+               value: float):
+        """
+        Append one node record.
+        
+        Args:
+            key: Position hash
+            ply: Distance from the root
+            depth: Remaining search depth
+            phase: Phase of the player to move
+            flags: Combination of FLAG_LEAF, FLAG_CUTOFF and FLAG_TT_HIT
+            moves: Number of moves (stages) searched from the node
+            cutoff_index: Index of the move that caused a cutoff, or -1
+            alpha: Lower bound of the node's window
+            beta: Upper bound of the node's window
+            value: Score returned by the node
+        """
+        self._buffer += RECORD.pack(key & _MASK, min(ply, 255),
+                                    max(-128, min(depth, 127)),
+                                    PHASES.index(phase), flags,
+                                    min(moves, 32767), cutoff_index,
+                                    alpha, beta, value)
+        self._buffered += 1
+        self.records_written += 1
+        if self._buffered >= self.BUFFER_RECORDS:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+            self._buffered = 0
+        self._file.flush()
+    
+    def close(self):
+        """Flush and close the trace (the file object if opened here)."""
+        if self._file is None:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+    
+    def __enter__(self) -> 'SearchTracer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_trace(path: str) -> Iterator[TraceRecord]:
+    """
+    Read the node records of a trace file.
+    
+    Args:
+        path: Trace file
+    
+    Yields:
+        Node records in the order they were written (children before
+        their parents)
+    
+    Raises:
+        ValueError: If the file is not a supported trace
+    """
+    with open(path, 'rb') as f:
+        magic, version = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} search trace: {path}")
+        while True:
+            data = f.read(RECORD.size * 1024)
+            if not data:
+                break
+            for fields in RECORD.iter_unpack(data):
+                fields = list(fields)
+                fields[3] = PHASES[fields[3]]
+                yield TraceRecord(*fields)
+
+
+def summarize_trace(records: Iterable[TraceRecord]) -> Dict[str, Dict]:
+    """
+    Aggregate node records into per-phase histograms.
+    
+    Args:
+        records: Node records (e.g. from read_trace)
+    
+    Returns:
+        Dictionary mapping each phase to its interior and leaf node
+        counts, branching histogram (moves -> nodes), cutoff position
+        histogram (move index -> cutoffs), mean branching factor, and the
+        fraction of cutoffs caused by the first move
+    """
+    summary = {}
+    for record in records:
+        phase = summary.setdefault(record.phase, {
+            'nodes': 0, 'leaves': 0, 'tt_hits': 0,
+            'branching': {}, 'cutoff_index': {}
+        })
+        if record.flags & FLAG_LEAF:
+            phase['leaves'] += 1
+            continue
+        if record.flags & FLAG_TT_HIT:
+            phase['tt_hits'] += 1
+            continue
+        phase['nodes'] += 1
+        phase['branching'][record.moves] = phase['branching'].get(record.moves, 0) + 1
+        if record.flags & FLAG_CUTOFF:
+            index = record.cutoff_index
+            phase['cutoff_index'][index] = phase['cutoff_index'].get(index, 0) + 1
+    
+    for phase in summary.values():
+        nodes = phase['nodes']
+        cutoffs = sum(phase['cutoff_index'].values())
+        phase['branching'] = dict(sorted(phase['branching'].items()))
+        phase['cutoff_index'] = dict(sorted(phase['cutoff_index'].items()))
+        phase['mean_branching'] = (sum(moves * count for moves, count
+                                       in phase['branching'].items()) / nodes
+                                   if nodes else math.nan)
+        phase['cutoff_rate'] = cutoffs / nodes if nodes else 0.0
+        phase['first_move_cutoffs'] = (phase['cutoff_index'].get(0, 0) / cutoffs
+                                       if cutoffs else 0.0)
+    return summary
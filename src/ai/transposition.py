@@ -0,0 +1,177 @@
+"""
+Lock-free transposition table in shared memory.
+"""
+
+import struct
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+
+# Bound types of stored scores
+EXACT = 0
+LOWER = 1  # Score is a lower bound (search failed high)
+UPPER = 2  # Score is an upper bound (search failed low)
+
+_SCORE_SCALE = 1024  # Fixed-point scale for stored scores
+_SCORE_LIMIT = ((1 << 31) - 1) / _SCORE_SCALE
+_VALID = 1 << 63  # Set in every stored data word
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_ENTRY = struct.Struct('<QQ')
+
+
+def _pack(depth: int, score: float, bound: int, move: Optional[List[int]]) -> int:
+    """Pack an entry into a 64-bit data word."""
+    score = max(-_SCORE_LIMIT, min(_SCORE_LIMIT, score))
+    fixed = int(round(score * _SCORE_SCALE)) & _MASK32
+    move_bits = 0
+    if move is not None:
+        src, dst, capture = move
+        move_bits = (int(src) << 10) | (int(dst) << 5) | int(capture)
+    return (fixed
+            | (min(depth, 255) << 32)
+            | (bound << 40)
+            | ((1 if move is not None else 0) << 42)
+            | (move_bits << 43)
+            | _VALID)
+
+
+def _unpack(data: int) -> Tuple[int, float, int, Optional[List[int]]]:
+    """Unpack a 64-bit data word into (depth, score, bound, move)."""
+    fixed = data & _MASK32
+    if fixed >= 1 << 31:
+        fixed -= 1 << 32
+    depth = (data >> 32) & 0xFF
+    bound = (data >> 40) & 0x3
+    move = None
+    if (data >> 42) & 0x1:
+        move_bits = (data >> 43) & 0x7FFF
+        move = [(move_bits >> 10) & 0x1F, (move_bits >> 5) & 0x1F,
+                move_bits & 0x1F]
+    return depth, fixed / _SCORE_SCALE, bound, move
+
+
+class SharedTranspositionTable:
+    """
+    Fixed-size transposition table in a shared memory block.
+    
+    Each entry is two 64-bit words: (key XOR data, data). Processes read
+    and write entries without locks; a torn or overwritten entry fails the
+    XOR check on probe and is treated as a miss, so concurrent writers can
+    never make a probe return data for the wrong position.
+    """
+    
+    ENTRY_BYTES = 16
+    
+    def __init__(self,
+                 num_entries: int = 1 << 18,
+                 name: str = None):
+        """
+        Create a new table or attach to an existing one.
+        
+        Args:
+            num_entries: Number of entries (rounded up to a power of two)
+            name: Name of an existing shared memory block to attach to
+                (None creates a new block)
+        """
+        size = 1
+        while size < num_entries:
+            size <<= 1
+        self.num_entries = size
+        self._mask = size - 1
+        self._owner = name is None
+        
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=size * self.ENTRY_BYTES)
+        else:
+            self._shm = attach_shared_memory(name)
+        
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        if self._owner:
+            self.clear()
+        
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+    
+    def clear(self):
+        """Remove all entries."""
+        self._shm.buf[:self.num_entries * self.ENTRY_BYTES] = (
+            bytes(self.num_entries * self.ENTRY_BYTES))
+    
+    def probe(self, key: int) -> Optional[Tuple[int, float, int, Optional[List[int]]]]:
+        """
+        Look up a position.
+        
+        Args:
+            key: 64-bit position hash
+        
+        Returns:
+            Tuple of (depth, score, bound, best_move), or None on a miss
+        """
+        self.probes += 1
+        check, data = _ENTRY.unpack_from(
+            self._buf, (key & self._mask) * self.ENTRY_BYTES)
+        if not data & _VALID or check ^ data != key:
+            return None
+        self.hits += 1
+        return _unpack(data)
+    
+    def store(self,
+              key: int,
+              depth: int,
+              score: float,
+              bound: int,
+              move: Optional[List[int]] = None):
+        """
+        Store a search result, keeping deeper results for the same position.
+        
+        Args:
+            key: 64-bit position hash
+            depth: Remaining depth the score was searched to
+            score: Search score
+            bound: EXACT, LOWER or UPPER
+            move: Best move found, if any
+        """
+        offset = (key & self._mask) * self.ENTRY_BYTES
+        old_check, old_data = _ENTRY.unpack_from(self._buf, offset)
+        if (old_data & _VALID and old_check ^ old_data == key
+                and ((old_data >> 32) & 0xFF) > depth):
+            return
+        
+        data = _pack(depth, score, bound, move)
+        _ENTRY.pack_into(self._buf, offset, (key ^ data) & _MASK64, data)
+        self.stores += 1
+    
+    def close(self):
+        """Detach from the shared memory block (and free it if owned)."""
+        if self._shm is None:
+            return
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+    
+    def __getstate__(self):
+        raise TypeError("Attach to the table by name instead of pickling it")
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a shared memory block owned by another process.
+    
+    Args:
+        name: Name of the block
+    
+    Returns:
+        Attached block (the owner remains responsible for unlinking it)
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: child processes report to their parent's resource
+        # tracker, where a second registration of the name is harmless
+        return shared_memory.SharedMemory(name=name)
@@ -2,9 +2,14 @@
 Utility function for evaluating Mill game states.
 """
 
-from typing import TYPE_CHECKING
+import hashlib
+import struct
+from typing import TYPE_CHECKING, Sequence
+
+from .node_context import NodeContext
 
 if TYPE_CHECKING:
+    import numpy as np
     from famnit_gym.envs.mill.mill_model import MillModel
 
 
@@ -41,19 +46,45 @@ class UtilityFunction:
         self.mobility_weight = mobility_weight
         self.phase_bonus = phase_bonus
         self.threat_weight = threat_weight
+        self._profile_weights = None
+        self._profile_id = None
     
-    def evaluate(self, model: 'MillModel', player: int) -> float:
+    @property
+    def profile_id(self) -> int:
+        """
+        Stable 64-bit id of this evaluation's class and weights.
+        
+        Equal weights give equal ids in every process and run, so cached
+        evaluations can be shared exactly where they would be identical.
+        """
+        weights = (self.piece_weight, self.mill_weight, self.mobility_weight,
+                   self.phase_bonus, self.threat_weight)
+        if weights != self._profile_weights:
+            digest = hashlib.blake2b(type(self).__qualname__.encode()
+                                     + struct.pack('<5d', *weights),
+                                     digest_size=8).digest()
+            self._profile_id = int.from_bytes(digest, 'little')
+            self._profile_weights = weights
+        return self._profile_id
+    
+    def evaluate(self, model: 'MillModel', player: int,
+                 context: NodeContext = None) -> float:
         """
         Evaluate the board position for the given player.
         
         Args:
             model: The game state (transition model)
             player: Player to evaluate for (1 or 2)
+            context: Search node context of the position, whose move
+                lists and board are reused
         
         Returns:
             Evaluation score (higher is better for player)
         """
         opponent = 2 if player == 1 else 1
+        if context is None:
+            context = NodeContext(model)
+        board = context.board
         
         # Component 1: Piece count
         my_pieces = model.count_pieces(player)
@@ -61,13 +92,13 @@ class UtilityFunction:
         piece_score = (my_pieces - opp_pieces) * self.piece_weight
         
         # Component 2: Mills
-        my_mills = self._count_mills(model, player)
-        opp_mills = self._count_mills(model, opponent)
+        my_mills = self._count_mills(model, player, board)
+        opp_mills = self._count_mills(model, opponent, board)
         mill_score = (my_mills - opp_mills) * self.mill_weight
         
         # Component 3: Mobility
-        my_moves = len(model.legal_moves(player))
-        opp_moves = len(model.legal_moves(opponent))
+        my_moves = len(context.legal_moves(player))
+        opp_moves = len(context.legal_moves(opponent))
         mobility_score = (my_moves - opp_moves) * self.mobility_weight
         
         # Component 4: Phase bonus
@@ -77,8 +108,8 @@ class UtilityFunction:
             phase_score = self.phase_bonus
         
         # Component 5: Threats (potential mills)
-        my_threats = self._count_threats(model, player)
-        opp_threats = self._count_threats(model, opponent)
+        my_threats = self._count_threats(model, player, board)
+        opp_threats = self._count_threats(model, opponent, board)
         threat_score = (my_threats - opp_threats) * self.threat_weight
         
         # Total score
@@ -87,13 +118,75 @@ class UtilityFunction:
         
         return total_score
     
-    def _count_mills(self, model: 'MillModel', player: int) -> int:
+    def evaluate_batch(self, boards: 'np.ndarray', in_hand: 'np.ndarray',
+                       player: int) -> 'np.ndarray':
+        """
+        Evaluate many positions at once, as evaluate would.
+        
+        Args:
+            boards: Boards (M, 24) with 0 for empty and 1 or 2 for the owner
+            in_hand: Pieces left to place (M, 3), indexed by player
+            player: Player to evaluate for (1 or 2)
+        
+        Returns:
+            Evaluation scores (M,)
+        """
+        import numpy as np
+        from src.game import vector_env
+        
+        opponent = 2 if player == 1 else 1
+        mine = np.full(len(boards), player, dtype=np.int8)
+        theirs = np.full(len(boards), opponent, dtype=np.int8)
+        
+        piece_score = ((boards == player).sum(axis=1)
+                       - (boards == opponent).sum(axis=1)) * self.piece_weight
+        mill_score = (vector_env.count_mills(boards, player)
+                      - vector_env.count_mills(boards, opponent)) * self.mill_weight
+        mobility_score = (vector_env.count_moves(boards, in_hand, mine)
+                          - vector_env.count_moves(boards, in_hand, theirs)
+                          ) * self.mobility_weight
+        phase_score = np.where(in_hand[:, player] > 0, self.phase_bonus, 0.0)
+        threat_score = (vector_env.count_threats(boards, player)
+                        - vector_env.count_threats(boards, opponent)
+                        ) * self.threat_weight
+        
+        return (piece_score + mill_score + mobility_score + phase_score
+                + threat_score).astype(float)
+    
+    def material_score(self, model: 'MillModel', player: int,
+                       context: NodeContext = None) -> float:
+        """
+        Fast evaluation from material only (pieces and closed mills).
+        
+        Needs no move generation, so it is cheap enough for pruning
+        decisions inside the search.
+        
+        Args:
+            model: The game state
+            player: Player to evaluate for (1 or 2)
+            context: Search node context of the position
+        
+        Returns:
+            Material score (higher is better for player)
+        """
+        opponent = 2 if player == 1 else 1
+        board = context.board if context is not None else model.get_state()
+        piece_score = ((model.count_pieces(player) - model.count_pieces(opponent))
+                       * self.piece_weight)
+        mill_score = ((self._count_mills(model, player, board)
+                       - self._count_mills(model, opponent, board))
+                      * self.mill_weight)
+        return piece_score + mill_score
+    
+    def _count_mills(self, model: 'MillModel', player: int,
+                     board: Sequence[int] = None) -> int:
         """
         Count the number of mills formed by the player.
         
         Args:
             model: The game state
             player: Player to count mills for
+            board: Board cells of model, if already known
         
         Returns:
             Number of mills
@@ -102,7 +195,8 @@ class UtilityFunction:
         mills = GameUtils.MILL_TRIPLETS
         
         count = 0
-        board = model.get_state()
+        if board is None:
+            board = model.get_state()
         
         for mill in mills:
             # Check if all three positions in mill are occupied by player
@@ -111,13 +205,15 @@ class UtilityFunction:
         
         return count
     
-    def _count_threats(self, model: 'MillModel', player: int) -> int:
+    def _count_threats(self, model: 'MillModel', player: int,
+                       board: Sequence[int] = None) -> int:
         """
         Count potential mills (two pieces, one empty spot).
         
         Args:
             model: The game state
             player: Player to count threats for
+            board: Board cells of model, if already known
         
         Returns:
             Number of potential mills
@@ -125,7 +221,8 @@ class UtilityFunction:
         from src.game.game_utils import GameUtils
         mills = GameUtils.MILL_TRIPLETS
         threats = 0
-        board = model.get_state()
+        if board is None:
+            board = model.get_state()
         
         for mill in mills:
             player_count = sum(1 for pos in mill 
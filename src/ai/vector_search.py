@@ -0,0 +1,103 @@
+"""
+Batched minimax search over many positions at once.
+
+Every level of the search tree is expanded for all root positions
+together with the vectorized rules of src.game.vector_env, and all leaves
+are scored in one call to UtilityFunction.evaluate_batch. The search is
+full-width plain minimax, so it is only practical for shallow depths.
+"""
+
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+
+from src.game.vector_env import apply_moves, generate_moves
+
+if TYPE_CHECKING:
+    from .utility import UtilityFunction
+
+
+def _group_starts(position: np.ndarray) -> np.ndarray:
+    """Get the first index of each run of equal, sorted position indices."""
+    return np.flatnonzero(np.diff(position, prepend=-1))
+
+
+def search_values(boards: np.ndarray,
+                  in_hand: np.ndarray,
+                  players: np.ndarray,
+                  depth: int,
+                  utility_function: 'UtilityFunction') -> np.ndarray:
+    """
+    Compute minimax values of many positions.
+    
+    Like MinimaxAI._minimax, positions at depth 0 or without legal moves
+    are scored by the utility function for player 1.
+    
+    Args:
+        boards: Boards (M, 24)
+        in_hand: Pieces left to place (M, 3)
+        players: Player to move in each position (M,)
+        depth: Remaining search depth
+        utility_function: Evaluation of the leaves
+    
+    Returns:
+        Values for player 1 (M,)
+    """
+    if depth == 0:
+        return utility_function.evaluate_batch(boards, in_hand, 1)
+    
+    position, moves = generate_moves(boards, in_hand, players)
+    values = np.empty(len(boards))
+    has_moves = np.zeros(len(boards), dtype=bool)
+    has_moves[position] = True
+    if not has_moves.all():
+        values[~has_moves] = utility_function.evaluate_batch(
+            boards[~has_moves], in_hand[~has_moves], 1)
+    if len(position) == 0:
+        return values
+    
+    child_values = search_values(*apply_moves(boards[position],
+                                              in_hand[position],
+                                              players[position], moves),
+                                 depth - 1, utility_function)
+    starts = _group_starts(position)
+    parents = position[starts]
+    values[parents] = np.where(players[parents] == 1,
+                               np.maximum.reduceat(child_values, starts),
+                               np.minimum.reduceat(child_values, starts))
+    return values
+
+
+def best_moves(boards: np.ndarray,
+               in_hand: np.ndarray,
+               players: np.ndarray,
+               depth: int,
+               utility_function: 'UtilityFunction') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the minimax move of many positions.
+    
+    Ties go to the first move in MillState.legal_moves order.
+    
+    Args:
+        boards: Boards (M, 24), each with at least one legal move
+        in_hand: Pieces left to place (M, 3)
+        players: Player to move in each position (M,)
+        depth: Search depth (at least 1)
+        utility_function: Evaluation of the leaves
+    
+    Returns:
+        Tuple of (moves [src, dst, capture] (M, 3), values for player 1
+        (M,))
+    """
+    position, moves = generate_moves(boards, in_hand, players)
+    child_values = search_values(*apply_moves(boards[position],
+                                              in_hand[position],
+                                              players[position], moves),
+                                 depth - 1, utility_function)
+    
+    # Best first within each position; lexsort is stable, keeping ties in
+    # move order
+    signed = np.where(players[position] == 1, -child_values, child_values)
+    order = np.lexsort((signed, position))
+    best = order[_group_starts(position[order])]
+    return moves[best], child_values[best]
@@ -2,8 +2,16 @@
 Analysis and statistics tools.
 """
 
-from .tournament import Tournament
-from .statistics import Statistics
-
 __all__ = ['Tournament', 'Statistics']
 
+
+def __getattr__(name: str):
+    # Loaded on first use, so importing a single analysis module (e.g. in
+    # a pool worker) does not load the tournament and statistics tools
+    if name == 'Tournament':
+        from .tournament import Tournament
+        return Tournament
+    if name == 'Statistics':
+        from .statistics import Statistics
+        return Statistics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,148 @@
+"""
+Batch position analysis over a pool of worker processes.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.ai.difficulties import MillAI, Difficulty
+from src.game.mill_state import MillState
+
+
+# Warm engines of the current worker process, keyed by (difficulty, depth)
+_worker_engines = {}
+
+
+def _analyze_position(difficulty: str,
+                      depth: Optional[int],
+                      board: Sequence[int],
+                      player: int,
+                      pieces_in_hand: Sequence[int]) -> Tuple:
+    """
+    Search one position inside a pool worker.
+    
+    Args:
+        difficulty: Difficulty value ('easy', 'medium' or 'hard')
+        depth: Search depth override (None for the difficulty default)
+        board: 24 board cells
+        player: Player to move
+        pieces_in_hand: Pieces players 1 and 2 still have to place
+    
+    Returns:
+        Tuple of (best_move, score, nodes, seconds)
+    """
+    key = (difficulty, depth)
+    ai = _worker_engines.get(key)
+    if ai is None:
+        ai = MillAI(difficulty=Difficulty(difficulty), custom_depth=depth)
+        _worker_engines[key] = ai
+    
+    state = MillState.from_position(board, pieces_in_hand)
+    start_time = time.perf_counter()
+    # Search directly: analysis never wants the difficulty's random moves
+    move, score = ai.minimax_ai.get_best_move(state, player)
+    elapsed = time.perf_counter() - start_time
+    
+    if move is not None:
+        move = [int(x) for x in move]
+    return move, score, ai.minimax_ai.nodes_evaluated, elapsed
+
+
+class BatchAnalyzer:
+    """
+    Analyse many positions on a pool of warm engines.
+    
+    A position is a tuple (board, player, pieces_in_hand): the 24 board
+    cells, the player to move, and the pieces players 1 and 2 still have
+    to place.
+    """
+    
+    def __init__(self,
+                 difficulty: Difficulty = Difficulty.HARD,
+                 depth: int = None,
+                 max_workers: int = None,
+                 max_in_flight: int = None):
+        """
+        Initialize batch analyzer.
+        
+        Args:
+            difficulty: Difficulty whose search settings are used
+            depth: Search depth override (None for the difficulty default)
+            max_workers: Number of worker processes (None: CPU count)
+            max_in_flight: Maximum number of submitted, unfinished
+                positions (None: twice the number of workers)
+        """
+        self.difficulty = difficulty
+        self.depth = depth
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.max_workers
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+    
+    def analyze(self, positions: Iterable[Tuple]) -> Iterator[Tuple]:
+        """
+        Analyse positions, yielding results in completion order.
+        
+        Positions are read from the iterable only as workers become free,
+        so memory use does not grow with the number of positions.
+        
+        Args:
+            positions: Iterable of (board, player, pieces_in_hand) tuples
+        
+        Yields:
+            Tuples of (position, best_move, score, nodes, seconds)
+        """
+        positions = iter(positions)
+        pending = {}
+        exhausted = False
+        
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    position = next(positions, None)
+                    if position is None:
+                        exhausted = True
+                        break
+                    board, player, pieces_in_hand = position
+                    future = self._executor.submit(
+                        _analyze_position, self.difficulty.value, self.depth,
+                        list(board), player, tuple(pieces_in_hand))
+                    pending[future] = position
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position = pending.pop(future)
+                    yield (position,) + future.result()
+        finally:
+            # Stopping early drops the positions still queued
+            for future in pending:
+                future.cancel()
+    
+    def analyze_all(self, positions: Iterable[Tuple]) -> List[Tuple]:
+        """
+        Analyse positions and collect all results.
+        
+        Args:
+            positions: Iterable of (board, player, pieces_in_hand) tuples
+        
+        Returns:
+            List of (position, best_move, score, nodes, seconds) tuples in
+            completion order
+        """
+        return list(self.analyze(positions))
+    
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+    
+    def __enter__(self) -> 'BatchAnalyzer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,159 @@
+"""
+Elo estimation and sequential probability ratio test (SPRT) for matches.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, Tuple
+
+# Largest Elo difference elo_estimate reports: a one-sided result (score
+# 0 or 1) has no finite Elo, and infinity is not valid JSON
+ELO_LIMIT = 1000.0
+
+
+def elo_from_score(score: float) -> float:
+    """
+    Convert an expected score into an Elo difference.
+    
+    Args:
+        score: Expected score between 0 and 1 (draws count one half)
+    
+    Returns:
+        Elo difference (infinite for a score of 0 or 1)
+    """
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def score_from_elo(elo: float) -> float:
+    """
+    Convert an Elo difference into an expected score.
+    
+    Args:
+        elo: Elo difference
+    
+    Returns:
+        Expected score between 0 and 1
+    """
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+def _score_stats(wins: int, draws: int, losses: int) -> Tuple[int, float, float]:
+    """Get game count, mean score and per-game score variance."""
+    games = wins + draws + losses
+    if games == 0:
+        return 0, 0.5, 0.0
+    score = (wins + 0.5 * draws) / games
+    variance = (wins + 0.25 * draws) / games - score ** 2
+    return games, score, variance
+
+
+def elo_estimate(wins: int,
+                 draws: int,
+                 losses: int,
+                 confidence: float = 0.95) -> Dict:
+    """
+    Estimate the Elo difference of a match result.
+    
+    Args:
+        wins: Games won by the first player
+        draws: Drawn games
+        losses: Games lost by the first player
+        confidence: Confidence level of the interval
+    
+    Returns:
+        Dictionary with score, elo, and the elo_lower / elo_upper bounds
+        of the confidence interval (normal approximation of the mean score);
+        Elo values are clamped to +-ELO_LIMIT
+    """
+    games, score, variance = _score_stats(wins, draws, losses)
+    margin = 0.0
+    if games > 0:
+        z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+        margin = z * math.sqrt(variance / games)
+    
+    def clamp(elo: float) -> float:
+        return max(-ELO_LIMIT, min(ELO_LIMIT, elo))
+    
+    return {
+        'score': score,
+        'elo': clamp(elo_from_score(score)),
+        'elo_lower': clamp(elo_from_score(score - margin)),
+        'elo_upper': clamp(elo_from_score(score + margin))
+    }
+
+
+class SPRT:
+    """
+    Sequential probability ratio test between two Elo hypotheses.
+    
+    H0: the Elo difference is elo0; H1: it is elo1. After every game the
+    log-likelihood ratio is compared with bounds derived from the error
+    rates; the match can stop as soon as it leaves them. Uses the
+    normal approximation of the generalized SPRT on game scores.
+    """
+    
+    def __init__(self,
+                 elo0: float = 0.0,
+                 elo1: float = 50.0,
+                 alpha: float = 0.05,
+                 beta: float = 0.05):
+        """
+        Initialize test.
+        
+        Args:
+            elo0: Elo difference of the null hypothesis
+            elo1: Elo difference of the alternative hypothesis
+            alpha: Probability of accepting H1 when H0 is true
+            beta: Probability of accepting H0 when H1 is true
+        """
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+        self.lower_bound = math.log(beta / (1.0 - alpha))
+        self.upper_bound = math.log((1.0 - beta) / alpha)
+    
+    def llr(self, wins: int, draws: int, losses: int) -> float:
+        """
+        Compute the log-likelihood ratio of H1 against H0.
+        
+        Args:
+            wins: Games won by the first player
+            draws: Drawn games
+            losses: Games lost by the first player
+        
+        Returns:
+            Log-likelihood ratio (0 before the first game)
+        """
+        if wins + draws + losses == 0:
+            return 0.0
+        # Half a game of each outcome keeps one-sided results from having
+        # zero variance
+        games, score, variance = _score_stats(wins + 0.5, draws + 0.5,
+                                              losses + 0.5)
+        s0 = score_from_elo(self.elo0)
+        s1 = score_from_elo(self.elo1)
+        return games * (s1 - s0) * (2.0 * score - s0 - s1) / (2.0 * variance)
+    
+    def status(self, wins: int, draws: int, losses: int) -> str:
+        """
+        Decide whether the match can stop.
+        
+        Args:
+            wins: Games won by the first player
+            draws: Drawn games
+            losses: Games lost by the first player
+        
+        Returns:
+            'H1' (accepted elo1), 'H0' (accepted elo0) or 'continue'
+        """
+        llr = self.llr(wins, draws, losses)
+        if llr >= self.upper_bound:
+            return 'H1'
+        if llr <= self.lower_bound:
+            return 'H0'
+        return 'continue'
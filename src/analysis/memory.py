@@ -0,0 +1,182 @@
+"""
+Opt-in memory instrumentation for searches and games.
+"""
+
+import gc
+import tracemalloc
+from collections import Counter
+from typing import Dict
+
+
+class MemoryProfiler:
+    """
+    Measures the memory used by AI moves and retained by games.
+    
+    Memory is traced with tracemalloc, which slows allocation down
+    considerably, so tracing only runs between start and stop. A move
+    reports its peak traced memory above the memory in use when it
+    started, that peak per searched node, and the bytes it left
+    allocated. A game reports the objects (by type, after a full garbage
+    collection) and traced bytes that outlive it, with the source lines
+    that allocated the retained bytes.
+    """
+    
+    def __init__(self, frames: int = 1, top: int = 10):
+        """
+        Initialize profiler.
+        
+        Args:
+            frames: Stack frames stored per allocation (more frames locate
+                the callers of allocating lines, at more overhead)
+            top: Number of object types and allocation sites kept per game
+        """
+        self.frames = frames
+        self.top = top
+        # One entry per profiled game (see finish_game)
+        self.games = []
+        self._started = False
+        self._move_start = 0
+        self._start_snapshot = None
+        self._start_counts = None
+        # Allocations of tracemalloc and of this module are not counted
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                         tracemalloc.Filter(False, __file__)]
+    
+    @property
+    def tracing(self) -> bool:
+        """Whether memory is being traced."""
+        return tracemalloc.is_tracing()
+    
+    def start(self):
+        """Start tracing memory (unless something else already does)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+    
+    def stop(self):
+        """Stop tracing memory if this profiler started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+    
+    def __enter__(self) -> 'MemoryProfiler':
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+    
+    def start_move(self):
+        """Mark the start of an AI move."""
+        tracemalloc.reset_peak()
+        self._move_start = tracemalloc.get_traced_memory()[0]
+    
+    def finish_move(self, nodes: int) -> Dict:
+        """
+        Measure the AI move started by start_move.
+        
+        Args:
+            nodes: Nodes searched for the move
+        
+        Returns:
+            Dictionary with peak_bytes, bytes_per_node and retained_bytes
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        peak_bytes = max(peak - self._move_start, 0)
+        return {
+            'peak_bytes': peak_bytes,
+            'bytes_per_node': peak_bytes / nodes if nodes else 0.0,
+            'retained_bytes': current - self._move_start
+        }
+    
+    def start_game(self):
+        """
+        Mark the start of a game.
+        
+        Raises:
+            RuntimeError: If memory is not being traced
+        """
+        gc.collect()
+        # The start snapshot is alive at both counts, so its objects cancel
+        self._start_snapshot = self._snapshot()
+        self._start_counts = self._object_counts()
+    
+    def finish_game(self, fields: Dict = None) -> Dict:
+        """
+        Measure what the game started by start_game left behind.
+        
+        Args:
+            fields: Fields added to the game's entry (e.g. match and game)
+        
+        Returns:
+            Game entry (also appended to self.games) with retained_objects,
+            retained_bytes, the types with most new objects
+            (object_growth) and the allocation sites of the most retained
+            bytes (top_sites)
+        """
+        gc.collect()
+        counts = self._object_counts()
+        stats = self._snapshot().compare_to(self._start_snapshot, 'lineno')
+        start_counts = self._start_counts
+        self._start_snapshot = self._start_counts = None
+        growth = Counter()
+        for name, count in counts.items():
+            if count > start_counts.get(name, 0):
+                growth[name] = count - start_counts.get(name, 0)
+        
+        entry = dict(fields or {})
+        entry.update({
+            'retained_objects': sum(counts.values()) - sum(start_counts.values()),
+            'retained_bytes': sum(stat.size_diff for stat in stats),
+            'object_growth': dict(growth.most_common(self.top)),
+            'top_sites': [{'site': str(stat.traceback),
+                           'bytes': stat.size_diff,
+                           'blocks': stat.count_diff}
+                          for stat in sorted(stats, key=lambda stat: -stat.size_diff)
+                          if stat.size_diff > 0][:self.top]
+        })
+        self.games.append(entry)
+        return entry
+    
+    def summary(self) -> Dict:
+        """
+        Summarize the profiled games.
+        
+        Returns:
+            Dictionary with the number of games, total and mean retained
+            objects and bytes per game, and the object types and
+            allocation sites retaining most over all games
+        """
+        games = len(self.games)
+        growth = Counter()
+        sites = Counter()
+        for game in self.games:
+            growth.update(game['object_growth'])
+            for site in game['top_sites']:
+                sites[site['site']] += site['bytes']
+        retained_objects = sum(game['retained_objects'] for game in self.games)
+        retained_bytes = sum(game['retained_bytes'] for game in self.games)
+        return {
+            'games': games,
+            'retained_objects': retained_objects,
+            'retained_bytes': retained_bytes,
+            'objects_per_game': retained_objects / games if games else 0.0,
+            'bytes_per_game': retained_bytes / games if games else 0.0,
+            'object_growth': dict(growth.most_common(self.top)),
+            'top_sites': dict(sites.most_common(self.top))
+        }
+    
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot of the traced allocations, without our own."""
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+    
+    @staticmethod
+    def _object_counts() -> Dict[str, int]:
+        """Count the objects tracked by the garbage collector by type."""
+        # A plain dict of names and counts is not tracked itself, so the
+        # start counts do not show up in the end counts
+        counts = {}
+        for obj in gc.get_objects():
+            name = type(obj).__qualname__
+            counts[name] = counts.get(name, 0) + 1
+        return counts
@@ -0,0 +1,143 @@
+"""
+Latency and throughput metrics.
+"""
+
+import math
+from typing import Dict, Iterable, List, Sequence
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Compute a percentile using linear interpolation.
+    
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile in the range 0-100
+    
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    
+    if lower == upper:
+        return ordered[int(rank)]
+    
+    fraction = rank - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+class LatencyStats:
+    """
+    Collects latency samples and summarizes them as percentiles.
+    """
+    
+    def __init__(self, samples: Iterable[float] = ()):
+        """
+        Initialize latency statistics.
+        
+        Args:
+            samples: Initial latency samples in seconds
+        """
+        self.samples = list(samples)
+    
+    def add(self, seconds: float):
+        """
+        Record one latency sample.
+        
+        Args:
+            seconds: Latency in seconds
+        """
+        self.samples.append(seconds)
+    
+    def summary(self) -> Dict:
+        """
+        Summarize the recorded samples.
+        
+        Returns:
+            Dictionary with count, mean, p50, p95, p99 and max (seconds)
+        """
+        count = len(self.samples)
+        return {
+            'count': count,
+            'mean': sum(self.samples) / count if count else 0.0,
+            'p50': percentile(self.samples, 50),
+            'p95': percentile(self.samples, 95),
+            'p99': percentile(self.samples, 99),
+            'max': max(self.samples) if count else 0.0
+        }
+
+
+def summarize_moves(entries: Iterable[Dict],
+                    group_by: Sequence[str] = ()) -> Dict[str, Dict]:
+    """
+    Summarize per-move timings, optionally grouped by entry fields.
+    
+    Args:
+        entries: Move entries with 'seconds' and 'nodes' fields
+        group_by: Entry fields to group by (empty: one group 'all')
+    
+    Returns:
+        Dictionary mapping each group name (field values joined by '/')
+        to its latency summary plus total nodes and nodes/sec
+    """
+    groups = {}
+    for entry in entries:
+        name = '/'.join(str(entry[field]) for field in group_by) or 'all'
+        groups.setdefault(name, []).append(entry)
+    
+    summaries = {}
+    for name in sorted(groups):
+        group = groups[name]
+        seconds = sum(entry['seconds'] for entry in group)
+        nodes = sum(entry['nodes'] for entry in group)
+        summary = LatencyStats(entry['seconds'] for entry in group).summary()
+        summary['nodes'] = nodes
+        summary['nodes_per_sec'] = nodes / seconds if seconds > 0 else 0.0
+        summaries[name] = summary
+    return summaries
+
+
+def summarize_memory(entries: Iterable[Dict],
+                     group_by: Sequence[str] = ()) -> Dict[str, Dict]:
+    """
+    Summarize per-move memory measurements, optionally grouped.
+    
+    Entries without memory fields (moves played without a
+    MemoryProfiler) are skipped.
+    
+    Args:
+        entries: Move entries with 'peak_bytes', 'bytes_per_node' and
+            'retained_bytes' fields (see MemoryProfiler.finish_move)
+        group_by: Entry fields to group by (empty: one group 'all')
+    
+    Returns:
+        Dictionary mapping each group name to its move count, p50/p95/max
+        peak bytes, mean peak bytes per node and total retained bytes
+    """
+    groups = {}
+    for entry in entries:
+        if 'peak_bytes' not in entry:
+            continue
+        name = '/'.join(str(entry[field]) for field in group_by) or 'all'
+        groups.setdefault(name, []).append(entry)
+    
+    summaries = {}
+    for name in sorted(groups):
+        group = groups[name]
+        peaks = [entry['peak_bytes'] for entry in group]
+        summaries[name] = {
+            'count': len(group),
+            'peak_p50': percentile(peaks, 50),
+            'peak_p95': percentile(peaks, 95),
+            'peak_max': max(peaks),
+            'bytes_per_node': (sum(entry['bytes_per_node'] for entry in group)
+                               / len(group)),
+            'retained_bytes': sum(entry['retained_bytes'] for entry in group)
+        }
+    return summaries
@@ -0,0 +1,280 @@
+"""
+Perft move-generation harness.
+
+Perft counts the leaf nodes of the full game tree to a fixed depth. The
+counts measure raw move-generation speed, and because they depend on
+every legal move, comparing them between two implementations (for
+example famnit's MillModel and src.game.mill_state.MillState) checks a
+new move generator for correctness.
+
+Implementations are given as factories returning the initial position, and
+reference positions as move lines from it, so every implementation can
+replay the same positions.
+"""
+
+import random
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+
+
+def famnit_model() -> 'MillModel':
+    """
+    Create famnit's model in the initial position.
+    
+    Returns:
+        Mill transition model
+    """
+    from famnit_gym.envs import mill
+    
+    env = mill.env(render_mode=None)
+    env.reset()
+    return mill.transition_model(env)
+
+
+def play_line(new_model: Callable, moves: List[List[int]]) -> Tuple:
+    """
+    Replay a move line from the initial position.
+    
+    Args:
+        new_model: Factory returning a model in the initial position
+        moves: Moves [src, dst, capture], starting with player 1
+    
+    Returns:
+        Tuple of (model, player to move)
+    """
+    model = new_model()
+    player = 1
+    for move in moves:
+        model.make_move(player, move)
+        player = 2 if player == 1 else 1
+    return model, player
+
+
+def perft(model, player: int, depth: int) -> int:
+    """
+    Count the leaf nodes of the game tree to a fixed depth.
+    
+    Args:
+        model: Game state (not modified)
+        player: Player to move
+        depth: Number of plies
+    
+    Returns:
+        Number of move sequences of exactly depth plies
+    """
+    if depth == 0:
+        return 1
+    if model.game_over():
+        return 0
+    
+    legal_moves = model.legal_moves(player)
+    if depth == 1:
+        return len(legal_moves)
+    
+    opponent = 2 if player == 1 else 1
+    nodes = 0
+    for move in legal_moves:
+        child = model.clone()
+        child.make_move(player, move)
+        nodes += perft(child, opponent, depth - 1)
+    return nodes
+
+
+def divide(model, player: int, depth: int) -> Dict[Tuple[int, int, int], int]:
+    """
+    Count leaf nodes separately below each root move.
+    
+    Args:
+        model: Game state (not modified)
+        player: Player to move
+        depth: Number of plies including the root move
+    
+    Returns:
+        Dictionary mapping each root move (as a tuple) to its leaf count
+    """
+    opponent = 2 if player == 1 else 1
+    counts = {}
+    for move in model.legal_moves(player):
+        child = model.clone()
+        child.make_move(player, move)
+        counts[tuple(int(x) for x in move)] = perft(child, opponent, depth - 1)
+    return counts
+
+
+def find_divergence(reference,
+                    candidate,
+                    player: int,
+                    depth: int,
+                    path: Tuple = ()) -> Optional[Dict]:
+    """
+    Walk two implementations in lockstep and report the first difference.
+    
+    At every node to the given depth, the boards, the game-over flags and
+    the sets of legal moves must be equal.
+    
+    Args:
+        reference: Trusted game state (e.g. famnit's model)
+        candidate: State of the implementation under test, in the same
+            position
+        player: Player to move
+        depth: Number of plies to check
+        path: Moves leading to this node (used in the report)
+    
+    Returns:
+        None if both agree, otherwise a dictionary with the move path,
+        player to move, both boards, and the legal moves missing from and
+        extra in the candidate
+    """
+    ref_board = [int(x) for x in reference.get_state()]
+    cand_board = [int(x) for x in candidate.get_state()]
+    ref_over = bool(reference.game_over())
+    
+    ref_moves = set()
+    cand_moves = set()
+    if not ref_over:
+        ref_moves = {tuple(int(x) for x in m)
+                     for m in reference.legal_moves(player)}
+    if not candidate.game_over():
+        cand_moves = {tuple(int(x) for x in m)
+                      for m in candidate.legal_moves(player)}
+    
+    if (ref_board != cand_board or ref_over != bool(candidate.game_over())
+            or ref_moves != cand_moves):
+        return {
+            'path': [list(move) for move in path],
+            'player': player,
+            'reference_board': ref_board,
+            'candidate_board': cand_board,
+            'missing': sorted(ref_moves - cand_moves),
+            'extra': sorted(cand_moves - ref_moves)
+        }
+    
+    if depth == 0:
+        return None
+    
+    opponent = 2 if player == 1 else 1
+    for move in sorted(ref_moves):
+        ref_child = reference.clone()
+        ref_child.make_move(player, list(move))
+        cand_child = candidate.clone()
+        cand_child.make_move(player, list(move))
+        divergence = find_divergence(ref_child, cand_child, opponent,
+                                     depth - 1, path + (move,))
+        if divergence is not None:
+            return divergence
+    return None
+
+
+def reference_lines(new_model: Callable = famnit_model,
+                    seed: int = 0,
+                    max_games: int = 200,
+                    max_plies: int = 300) -> Dict[str, List[List[int]]]:
+    """
+    Find reproducible positions for each game phase by random play.
+    
+    Args:
+        new_model: Factory returning a model in the initial position
+        seed: Random seed for the played moves
+        max_games: Number of games to try before giving up on a phase
+        max_plies: Maximum length of each game
+    
+    Returns:
+        Dictionary mapping phase ('placing', 'moving', 'flying') of the
+        player to move to the move line reaching such a position
+    """
+    rng = random.Random(seed)
+    lines = {}
+    
+    for _ in range(max_games):
+        model = new_model()
+        player = 1
+        moves = []
+        for _ in range(max_plies):
+            if model.game_over():
+                break
+            legal_moves = model.legal_moves(player)
+            if not legal_moves:
+                break
+            
+            phase = model.get_phase(player)
+            # Skip the near-empty opening, whose tree is tiny
+            if phase not in lines and (phase != 'placing' or len(moves) >= 6):
+                lines[phase] = [list(move) for move in moves]
+            
+            move = [int(x) for x in rng.choice(legal_moves)]
+            model.make_move(player, move)
+            moves.append(move)
+            player = 2 if player == 1 else 1
+        
+        if all(phase in lines for phase in ('placing', 'moving', 'flying')):
+            break
+    
+    return lines
+
+
+def run_perft(new_model: Callable = famnit_model,
+              depth: int = 3,
+              lines: Dict[str, List[List[int]]] = None) -> Dict:
+    """
+    Measure move-generation throughput on the reference positions.
+    
+    Args:
+        new_model: Factory returning a model in the initial position
+        depth: Perft depth
+        lines: Phase to move line mapping (default: reference_lines())
+    
+    Returns:
+        Dictionary mapping each phase to its node count, elapsed time and
+        nodes per second
+    """
+    if lines is None:
+        lines = reference_lines()
+    
+    results = {}
+    for phase, moves in lines.items():
+        model, player = play_line(new_model, moves)
+        start_time = time.perf_counter()
+        nodes = perft(model, player, depth)
+        elapsed = time.perf_counter() - start_time
+        results[phase] = {
+            'nodes': nodes,
+            'time': elapsed,
+            'nodes_per_sec': nodes / elapsed if elapsed > 0 else 0.0
+        }
+    return results
+
+
+def compare_implementations(new_candidate: Callable,
+                            new_reference: Callable = famnit_model,
+                            depth: int = 3,
+                            lines: Dict[str, List[List[int]]] = None) -> Dict:
+    """
+    Check an alternative implementation against the reference one.
+    
+    Args:
+        new_candidate: Factory for the implementation under test
+        new_reference: Factory for the trusted implementation
+        depth: Number of plies to compare from each position
+        lines: Phase to move line mapping (default: reference_lines()
+            of the reference implementation)
+    
+    Returns:
+        Dictionary mapping each phase to None (identical move generation)
+        or the first divergence found (see find_divergence), with the
+        path given from the initial position
+    """
+    if lines is None:
+        lines = reference_lines(new_reference)
+    
+    results = {}
+    for phase, moves in lines.items():
+        reference, player = play_line(new_reference, moves)
+        candidate, _ = play_line(new_candidate, moves)
+        divergence = find_divergence(reference, candidate, player, depth)
+        if divergence is not None:
+            divergence['path'] = [list(move) for move in moves] + divergence['path']
+        results[phase] = divergence
+    return results
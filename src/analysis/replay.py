@@ -0,0 +1,161 @@
+"""
+Offscreen video rendering of recorded games.
+
+Frames are drawn with matplotlib's Agg canvas straight from a GameRecord
+and piped to ffmpeg (imageio-ffmpeg), so a video takes as long as its
+frames take to draw, not as long as the game took to play.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.game.game_record import GameRecord
+from src.game.game_utils import GameUtils
+
+
+# Board coordinates of points 1..24 on a 7x7 grid
+POINT_COORDS = [
+    (0, 6), (3, 6), (6, 6),
+    (1, 5), (3, 5), (5, 5),
+    (2, 4), (3, 4), (4, 4),
+    (0, 3), (1, 3), (2, 3), (4, 3), (5, 3), (6, 3),
+    (2, 2), (3, 2), (4, 2),
+    (1, 1), (3, 1), (5, 1),
+    (0, 0), (3, 0), (6, 0)
+]
+
+PLAYER_COLORS = {0: '#d9c7a0', 1: '#f5f5f5', 2: '#202020'}
+HIGHLIGHT_COLOR = '#d62728'
+
+
+class BoardRenderer:
+    """
+    Draws board positions into RGB frames without opening a window.
+    
+    The board lines are drawn once; each frame only updates piece colors.
+    """
+    
+    def __init__(self, size: int = 480):
+        """
+        Initialize renderer.
+        
+        Args:
+            size: Frame width and height in pixels (multiple of 16 keeps
+                video encoders happy)
+        """
+        self.size = size
+        dpi = 100
+        self.figure = Figure(figsize=(size / dpi, size / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_axes([0, 0, 1, 1])
+        ax.set_xlim(-0.6, 6.6)
+        ax.set_ylim(-0.9, 6.6)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        self.figure.set_facecolor('#e8d5a9')
+        
+        for mill in GameUtils.MILL_TRIPLETS:
+            xs = [POINT_COORDS[pos - 1][0] for pos in mill]
+            ys = [POINT_COORDS[pos - 1][1] for pos in mill]
+            ax.plot(xs, ys, color='#5a4630', linewidth=2, zorder=1)
+        
+        xs, ys = zip(*POINT_COORDS)
+        self._piece_size = (size / 14) ** 2
+        self._pieces = ax.scatter(xs, ys, s=self._piece_size, zorder=2,
+                                  c=[PLAYER_COLORS[0]] * 24,
+                                  edgecolors=['#5a4630'] * 24, linewidths=1.5)
+        self._caption = ax.text(3, -0.6, '', ha='center', va='center',
+                                fontsize=max(8, size // 40), zorder=3)
+    
+    def render(self,
+               board: Sequence[int],
+               last_move: Optional[List[int]] = None,
+               caption: str = '') -> np.ndarray:
+        """
+        Draw one position.
+        
+        Args:
+            board: 24 board cells (0 empty, 1 or 2 for the owner)
+            last_move: Move leading to the position (its points are
+                highlighted)
+            caption: Text shown below the board
+        
+        Returns:
+            Frame as a (size, size, 3) uint8 array
+        """
+        highlight = set()
+        if last_move is not None:
+            highlight = {pos for pos in last_move if pos > 0}
+        
+        # Empty points are drawn as small dots
+        self._pieces.set_sizes([self._piece_size if owner else self._piece_size / 5
+                                for owner in board])
+        self._pieces.set_facecolor([PLAYER_COLORS[int(owner)] for owner in board])
+        self._pieces.set_edgecolor([HIGHLIGHT_COLOR if pos + 1 in highlight
+                                    else '#5a4630' for pos in range(24)])
+        self._caption.set_text(caption)
+        
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+def render_record(record: GameRecord,
+                  output_file: str,
+                  fps: float = 2.0,
+                  frames_per_move: int = 1,
+                  size: int = 480) -> str:
+    """
+    Render a recorded game to a video file.
+    
+    Args:
+        record: Game record
+        output_file: Video file to write (format from the extension)
+        fps: Frames per second of the video
+        frames_per_move: Frames showing each position
+        size: Frame width and height in pixels
+    
+    Returns:
+        Path of the written video
+    """
+    import imageio_ffmpeg
+    
+    renderer = BoardRenderer(size)
+    writer = imageio_ffmpeg.write_frames(output_file, (size, size), fps=fps,
+                                         macro_block_size=16)
+    writer.send(None)  # Start the encoder
+    try:
+        for index, (board, player, last_move) in enumerate(record.positions()):
+            caption = f"Move {index}"
+            if last_move is not None:
+                caption += f": {GameUtils.format_move(last_move)}"
+            frame = renderer.render(board, last_move, caption)
+            for _ in range(frames_per_move):
+                writer.send(frame)
+    finally:
+        writer.close()
+    return output_file
+
+
+def render_records(jobs: List[Tuple[GameRecord, str]],
+                   max_workers: int = None,
+                   **render_options) -> List[str]:
+    """
+    Render many recorded games in parallel.
+    
+    Args:
+        jobs: List of (record, output_file) pairs
+        max_workers: Number of worker processes (None: CPU count)
+        **render_options: Options passed to render_record
+    
+    Returns:
+        Paths of the written videos, in job order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(render_record, record, output_file,
+                                   **render_options)
+                   for record, output_file in jobs]
+        return [future.result() for future in futures]
@@ -0,0 +1,149 @@
+"""
+SQLite storage of finished tournament games.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_key TEXT NOT NULL,
+    game_index INTEGER NOT NULL,
+    player_1 TEXT NOT NULL,
+    player_2 TEXT NOT NULL,
+    config TEXT NOT NULL,
+    seed INTEGER,
+    winner INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    moves TEXT NOT NULL,
+    timings TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    UNIQUE (match_key, game_index)
+)
+"""
+
+
+class ResultsDatabase:
+    """
+    Finished games of tournaments, one row per game.
+    
+    Every game is committed as soon as it ends, so an interrupted run
+    loses at most the game in progress. The database uses write-ahead
+    logging so several processes can write results to the same file.
+    """
+    
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Open (and create if needed) a results database.
+        
+        Args:
+            path: Database file (':memory:' for a temporary database)
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, timeout=timeout)
+        self._connection.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(SCHEMA)
+    
+    def add_game(self,
+                 match_key: str,
+                 game_index: int,
+                 player_1: str,
+                 player_2: str,
+                 config: Dict,
+                 seed: Optional[int],
+                 winner: int,
+                 duration: float,
+                 moves: List,
+                 timings: List[Dict]) -> bool:
+        """
+        Store a finished game.
+        
+        Args:
+            match_key: Name of the match the game belongs to
+            game_index: Number of the game within the match
+            player_1: Name of player 1
+            player_2: Name of player 2
+            config: Settings of both players
+            seed: Random seed the game was played with
+            winner: 1, 2, or 0 for draw
+            duration: Game time in seconds
+            moves: Moves played ([src, dst, capture], or None for a pass)
+            timings: Move log entries of the game
+        
+        Returns:
+            True if stored, False if the game was already in the database
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO games (match_key, game_index, player_1, "
+                "player_2, config, seed, winner, duration, moves, timings, "
+                "finished_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (match_key, game_index, player_1, player_2,
+                 json.dumps(config, sort_keys=True), seed, winner, duration,
+                 json.dumps(moves), json.dumps(timings), time.time()))
+        return cursor.rowcount == 1
+    
+    def games(self, match_key: str = None) -> List[Dict]:
+        """
+        Get stored games.
+        
+        Args:
+            match_key: Only return games of this match (None: all games)
+        
+        Returns:
+            List of game dictionaries ordered by match and game index, with
+            config, moves and timings decoded
+        """
+        query = "SELECT * FROM games"
+        params = ()
+        if match_key is not None:
+            query += " WHERE match_key = ?"
+            params = (match_key,)
+        query += " ORDER BY match_key, game_index"
+        
+        games = []
+        for row in self._connection.execute(query, params):
+            game = dict(row)
+            for field in ('config', 'moves', 'timings'):
+                game[field] = json.loads(game[field])
+            games.append(game)
+        return games
+    
+    def match_results(self) -> Dict[str, Dict]:
+        """
+        Aggregate the stored games of every match.
+        
+        Returns:
+            Dictionary mapping each match key to player names, wins of
+            each player, draws, total games and average game time
+        """
+        rows = self._connection.execute(
+            "SELECT match_key, player_1, player_2, "
+            "SUM(winner = 1) AS ai1_wins, SUM(winner = 2) AS ai2_wins, "
+            "SUM(winner = 0) AS draws, COUNT(*) AS total_games, "
+            "AVG(duration) AS avg_game_time "
+            "FROM games GROUP BY match_key, player_1, player_2 "
+            "ORDER BY MIN(id)")
+        return {row['match_key']: {key: row[key] for key in row.keys()
+                                   if key != 'match_key'}
+                for row in rows}
+    
+    def close(self):
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    def __enter__(self) -> 'ResultsDatabase':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
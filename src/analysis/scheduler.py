@@ -0,0 +1,230 @@
+"""
+Parallel scheduling of round-robin tournament games.
+
+The round robin is split into single games, which are handed out
+longest-expected-first to a pool of worker processes. Idle workers take
+the next game from the shared queue, so the short games fill the gaps
+left by the long ones at the end of the tournament.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.ai.difficulties import MillAI, Difficulty
+from src.ai.disk_cache import DiskSearchCache
+from src.game.game_record import GameRecord
+
+if TYPE_CHECKING:
+    from .tournament import Tournament
+
+
+# Warm engines of the current worker process, keyed by (player,
+# difficulty, disk cache path), and the disk caches it opened by path
+_worker_engines = {}
+_worker_caches = {}
+
+
+def _play_scheduled_game(difficulty1: str,
+                         difficulty2: str,
+                         game_num: int,
+                         seed: int,
+                         repetition_limit: Optional[int],
+                         disk_cache: Optional[Tuple[str, int]] = None) -> Tuple:
+    """
+    Play one game inside a pool worker.
+    
+    Args:
+        difficulty1: Difficulty value of player 1
+        difficulty2: Difficulty value of player 2
+        game_num: Number of the game within its match
+        seed: Random seed of the game
+        repetition_limit: Repetition draw limit of the tournament
+        disk_cache: Path and minimum depth of the tournament's disk
+            cache (None: no cache)
+    
+    Returns:
+        Tuple of (record dictionary, game time, move log entries)
+    """
+    from .tournament import Tournament
+    
+    cache = None
+    if disk_cache is not None:
+        path, min_depth = disk_cache
+        cache = _worker_caches.get(path)
+        if cache is None:
+            cache = DiskSearchCache(path, min_depth=min_depth)
+            _worker_caches[path] = cache
+    
+    ais = []
+    for player, difficulty in ((1, difficulty1), (2, difficulty2)):
+        key = (player, difficulty, disk_cache)
+        if key not in _worker_engines:
+            _worker_engines[key] = MillAI(difficulty=Difficulty(difficulty),
+                                          disk_cache=cache)
+        ais.append(_worker_engines[key])
+    
+    tournament = Tournament(repetition_limit=repetition_limit)
+    record, game_time = tournament._play_seeded_game(ais[0], ais[1], seed,
+                                                     {'game': game_num})
+    return record.to_dict(), game_time, tournament.move_log
+
+
+class TournamentScheduler:
+    """
+    Plays the games of a round-robin tournament on worker processes.
+    
+    Results, records and the move log are collected into the given
+    Tournament exactly as Tournament.run_tournament would produce them.
+    """
+    
+    def __init__(self, tournament: 'Tournament', max_workers: int = None):
+        """
+        Initialize scheduler.
+        
+        Args:
+            tournament: Tournament receiving the results (its database,
+                seed, repetition limit and disk cache are used)
+            max_workers: Number of worker processes (None: CPU count)
+        """
+        self.tournament = tournament
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def expected_costs(self, pairings: List[Tuple[Difficulty, Difficulty]]) -> Dict:
+        """
+        Estimate the relative time of one game of each pairing.
+        
+        Average game times stored in the database are used when every
+        pairing has some; otherwise the cost grows with each player's
+        search tree (3^depth).
+        
+        Args:
+            pairings: List of (difficulty1, difficulty2) pairs
+        
+        Returns:
+            Dictionary mapping each pairing to its expected cost
+        """
+        database = self.tournament.database
+        if database is not None:
+            history = database.match_results()
+            keys = {pairing: f"{pairing[0].value}_vs_{pairing[1].value}"
+                    for pairing in pairings}
+            if all(key in history for key in keys.values()):
+                return {pairing: history[key]['avg_game_time']
+                        for pairing, key in keys.items()}
+        
+        return {(diff1, diff2): (3 ** MillAI(difficulty=diff1).max_depth
+                                 + 3 ** MillAI(difficulty=diff2).max_depth)
+                for diff1, diff2 in pairings}
+    
+    def run(self,
+            difficulties: List[Difficulty],
+            games_per_match: int = 2,
+            resume: bool = False,
+            verbose: bool = True) -> Dict:
+        """
+        Run a round-robin tournament in parallel.
+        
+        Args:
+            difficulties: List of difficulties to include
+            games_per_match: Number of games per match
+            resume: Skip games already stored in the database
+            verbose: Whether to print progress
+        
+        Returns:
+            Tournament results keyed by "<ai1>_vs_<ai2>"
+        
+        Raises:
+            ValueError: If resuming without a database, or the stored games
+                were played with different AI settings
+        """
+        tournament = self.tournament
+        if resume and tournament.database is None:
+            raise ValueError("Resuming a tournament needs a results database")
+        
+        pairings = [(diff1, diff2)
+                    for i, diff1 in enumerate(difficulties)
+                    for diff2 in difficulties[i + 1:]
+                    if diff1 != diff2]
+        costs = self.expected_costs(pairings)
+        
+        # Per match: key, config and finished games by number
+        matches = []
+        jobs = []
+        for diff1, diff2 in pairings:
+            key = f"{diff1.value}_vs_{diff2.value}"
+            config = {'player_1': tournament._ai_config(MillAI(difficulty=diff1)),
+                      'player_2': tournament._ai_config(MillAI(difficulty=diff2))}
+            finished = {}
+            if resume:
+                for game in tournament.database.games(key):
+                    if game['game_index'] >= games_per_match:
+                        continue
+                    if game['config'] != config:
+                        raise ValueError(f"Game {game['game_index']} of {key} "
+                                         f"was played with different settings")
+                    finished[game['game_index']] = (game['winner'],
+                                                    game['duration'],
+                                                    game['timings'])
+            matches.append((diff1, diff2, key, config, finished))
+            
+            for game_num in range(games_per_match):
+                if game_num not in finished:
+                    jobs.append((costs[(diff1, diff2)], len(matches) - 1,
+                                 game_num, tournament._game_seed(key, game_num)))
+        
+        # Longest expected games first
+        jobs.sort(key=lambda job: -job[0])
+        
+        if verbose:
+            print(f"Scheduling {len(jobs)} games on {self.max_workers} workers")
+        
+        # Workers open the tournament's cache file themselves
+        disk_cache = None
+        if tournament.disk_cache is not None:
+            disk_cache = (tournament.disk_cache.path,
+                          tournament.disk_cache.min_depth)
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for _, match_num, game_num, seed in jobs:
+                diff1, diff2 = matches[match_num][:2]
+                future = executor.submit(_play_scheduled_game, diff1.value,
+                                         diff2.value, game_num, seed,
+                                         tournament.repetition_limit,
+                                         disk_cache)
+                futures[future] = (match_num, game_num)
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                match_num, game_num = futures[future]
+                record_data, game_time, move_entries = future.result()
+                record = GameRecord.from_dict(record_data)
+                diff1, diff2, key, config, finished = matches[match_num]
+                tournament._finish_game(key, game_num, config, record,
+                                        game_time, move_entries)
+                finished[game_num] = (record.winner, game_time, move_entries)
+                if verbose:
+                    print(f"[{done}/{len(jobs)}] {key} game {game_num + 1}: "
+                          f"winner {record.winner} ({game_time:.2f}s)")
+        
+        results = {}
+        for diff1, diff2, key, config, finished in matches:
+            match_index = len(tournament.match_history)
+            first_entry = len(tournament.move_log)
+            wins = {0: 0, 1: 0, 2: 0}
+            game_times = []
+            for game_num in range(games_per_match):
+                winner, game_time, move_entries = finished[game_num]
+                wins[winner] += 1
+                game_times.append(game_time)
+                for entry in move_entries:
+                    entry['match'] = match_index
+                    tournament.move_log.append(entry)
+            
+            match_result = tournament._match_results(
+                diff1.value, diff2.value, wins[1], wins[2], wins[0],
+                game_times, tournament.move_log[first_entry:])
+            tournament.match_history.append(match_result)
+            results[key] = match_result
+        
+        return results
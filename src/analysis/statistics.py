@@ -2,11 +2,16 @@
 Statistics and analysis tools.
 """
 
+import random
 import time
-import matplotlib.pyplot as plt
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 from src.ai.difficulties import MillAI, Difficulty
 from src.ai.minimax import MinimaxAI
+from src.ai.lazy_smp import LazySMPSearch
+from src.game.hand_tracking import HandTrackingModel
+
+if TYPE_CHECKING:
+    from src.ai.disk_cache import DiskSearchCache
 
 
 class Statistics:
@@ -16,13 +21,16 @@ class Statistics:
     
     @staticmethod
     def analyze_depth_performance(max_depth: int = 6, 
-                                  num_tests: int = 3) -> Dict:
+                                  num_tests: int = 3,
+                                  disk_cache: 'DiskSearchCache' = None) -> Dict:
         """
         Analyze search performance vs depth.
         
         Args:
             max_depth: Maximum depth to test (recommended: 6 or less)
             num_tests: Number of test positions per depth (recommended: 3 or less)
+            disk_cache: Persistent search cache (searches it already holds
+                are answered from it, so they take less time and nodes)
         
         Returns:
             Dictionary with depth vs time data
@@ -45,10 +53,10 @@ class Statistics:
             total_nodes = 0
             
             for test_num in range(num_tests):
-                model = mill.transition_model(env)
+                model = HandTrackingModel(mill.transition_model(env))
                 player = 1
                 
-                ai = MillAI(difficulty=Difficulty.HARD)
+                ai = MillAI(difficulty=Difficulty.HARD, disk_cache=disk_cache)
                 ai.minimax_ai.max_depth = depth
                 
                 start_time = time.time()
@@ -80,6 +88,8 @@ class Statistics:
             data: Data from analyze_depth_performance
             save_path: Path to save plot (optional)
         """
+        import matplotlib.pyplot as plt
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
         
         # Plot 1: Time vs Depth
@@ -104,12 +114,14 @@ class Statistics:
             plt.show()
     
     @staticmethod
-    def analyze_self_play(num_games: int = 20) -> Dict:
+    def analyze_self_play(num_games: int = 20,
+                          disk_cache: 'DiskSearchCache' = None) -> Dict:
         """
         Analyze self-play (perfect AI vs perfect AI).
         
         Args:
             num_games: Number of games to play
+            disk_cache: Persistent search cache used by both players
         
         Returns:
             Statistics dictionary
@@ -117,8 +129,8 @@ class Statistics:
         from src.analysis.tournament import Tournament
         
         tournament = Tournament()
-        ai1 = MillAI(difficulty=Difficulty.HARD)
-        ai2 = MillAI(difficulty=Difficulty.HARD)
+        ai1 = MillAI(difficulty=Difficulty.HARD, disk_cache=disk_cache)
+        ai2 = MillAI(difficulty=Difficulty.HARD, disk_cache=disk_cache)
         
         results = tournament.run_match(ai1, ai2, num_games, verbose=False)
         
@@ -128,4 +140,114 @@ class Statistics:
             'draw_rate': results['draws'] / results['total_games'],
             'avg_game_time': results['avg_game_time']
         }
-
+    
+    @staticmethod
+    def benchmark_positions(num_positions: int = 4,
+                            seed: int = 0) -> List:
+        """
+        Create reproducible benchmark positions from random play.
+        
+        Args:
+            num_positions: Number of positions (each one 2 plies deeper
+                into the game than the previous one, starting at ply 6)
+            seed: Random seed for the played moves
+        
+        Returns:
+            List of (model, player) tuples
+        """
+        from famnit_gym.envs import mill
+        
+        rng = random.Random(seed)
+        positions = []
+        
+        for i in range(num_positions):
+            env = mill.env(render_mode=None)
+            env.reset()
+            model = HandTrackingModel(mill.transition_model(env))
+            player = 1
+            
+            for _ in range(6 + 2 * i):
+                legal_moves = model.legal_moves(player)
+                if not legal_moves or model.game_over():
+                    break
+                model.make_move(player, rng.choice(legal_moves))
+                player = 2 if player == 1 else 1
+            
+            positions.append((model, player))
+        
+        return positions
+    
+    @staticmethod
+    def analyze_smp_speedup(worker_counts: List[int] = (1, 2, 4),
+                            depth: int = 5,
+                            num_positions: int = 4) -> Dict:
+        """
+        Measure Lazy SMP speedup vs number of worker processes.
+        
+        Args:
+            worker_counts: Worker counts to test (the first one is the
+                baseline for the speedup)
+            depth: Search depth
+            num_positions: Number of benchmark positions
+        
+        Returns:
+            Dictionary with workers, total times and speedups
+        """
+        positions = Statistics.benchmark_positions(num_positions)
+        total_times = []
+        
+        for workers in worker_counts:
+            print(f"{workers} worker(s)... ", end="", flush=True)
+            ai = MillAI(difficulty=Difficulty.HARD, custom_depth=depth)
+            smp = LazySMPSearch(ai.minimax_ai, workers)
+            
+            # Start the worker processes before timing
+            smp.search(*positions[0])
+            
+            elapsed = 0.0
+            for model, player in positions:
+                smp.table.clear()
+                start_time = time.time()
+                smp.search(model, player)
+                elapsed += time.time() - start_time
+            smp.close()
+            
+            total_times.append(elapsed)
+            print(f"Done ({elapsed:.2f}s)", flush=True)
+        
+        return {
+            'workers': list(worker_counts),
+            'total_times': total_times,
+            'speedups': [total_times[0] / t if t > 0 else 0.0
+                         for t in total_times]
+        }
+    
+    @staticmethod
+    def plot_smp_speedup(data: Dict, save_path: str = None):
+        """
+        Plot Lazy SMP speedup vs number of workers.
+        
+        Args:
+            data: Data from analyze_smp_speedup
+            save_path: Path to save plot (optional)
+        """
+        import matplotlib.pyplot as plt
+        
+        fig, ax = plt.subplots(figsize=(6, 5))
+        
+        ax.plot(data['workers'], data['speedups'], 'b-o', label='Lazy SMP')
+        ax.plot(data['workers'],
+                [w / data['workers'][0] for w in data['workers']],
+                'k--', label='Linear')
+        ax.set_xlabel('Worker Processes')
+        ax.set_ylabel('Speedup')
+        ax.set_title('Lazy SMP Speedup vs Cores')
+        ax.legend()
+        ax.grid(True)
+        
+        plt.tight_layout()
+        
+        if save_path:
+            plt.savefig(save_path)
+        else:
+            plt.show()
@@ -2,10 +2,24 @@
 Tournament system for testing different AI difficulties.
 """
 
+import json
+import random
 import time
-from typing import List, Dict
-from famnit_gym.envs import mill
+from typing import TYPE_CHECKING, List, Dict, Sequence, Tuple
 from src.ai.difficulties import MillAI, Difficulty
+from src.ai.cost_model import position_features
+from src.game.game_utils import GameUtils
+from src.game.game_record import GameRecord
+from src.game.hand_tracking import HandTrackingModel
+from src.analysis.memory import MemoryProfiler
+from src.analysis.metrics import summarize_memory, summarize_moves
+from src.analysis.elo import SPRT, elo_estimate
+from src.analysis.results_db import ResultsDatabase
+from src.analysis.scheduler import TournamentScheduler
+
+if TYPE_CHECKING:
+    from src.ai.disk_cache import DiskSearchCache
+    from src.server.distributed import GameCoordinator
 
 
 class Tournament:
@@ -13,41 +27,129 @@ class Tournament:
     Tournament system for running matches between AI agents.
     """
     
-    def __init__(self):
-        """Initialize tournament."""
+    def __init__(self,
+                 repetition_limit: int = 3,
+                 record_games: bool = False,
+                 database: ResultsDatabase = None,
+                 seed: int = None,
+                 memory_profiler: MemoryProfiler = None,
+                 disk_cache: 'DiskSearchCache' = None):
+        """
+        Initialize tournament.
+        
+        Args:
+            repetition_limit: Number of occurrences of the same position
+                that ends a game as a draw (None or 0 disables the check)
+            record_games: Whether to keep a GameRecord of every game
+                (in self.records)
+            database: Database every finished game is written to (needed
+                to resume interrupted matches)
+            seed: Base seed of the per-game random seeds (None: random)
+            memory_profiler: Profiler measuring the memory of every AI
+                move and game played in this process (parallel and remote
+                games are not profiled); it must be started by the caller
+            disk_cache: Persistent search cache used by the AIs of
+                run_tournament (parallel workers open the same file)
+        """
         self.results = []
         self.match_history = []
+        self.repetition_limit = repetition_limit
+        self.record_games = record_games
+        self.records = []
+        self.database = database
+        self.seed = seed
+        self.memory_profiler = memory_profiler
+        self.disk_cache = disk_cache
+        # One entry per AI move: match, game, ply, player, difficulty,
+        # seconds, nodes, completed depth and the position features of
+        # position_features (phase, mobility and pieces), plus the fields of
+        # MemoryProfiler.finish_move when memory is profiled
+        self.move_log = []
     
     def run_match(self, 
                   ai1: MillAI, 
                   ai2: MillAI,
                   num_games: int = 10,
-                  verbose: bool = True) -> Dict:
+                  verbose: bool = True,
+                  sprt: SPRT = None,
+                  match_key: str = None,
+                  resume: bool = False,
+                  coordinator: 'GameCoordinator' = None) -> Dict:
         """
         Run a match between two AI agents.
         
         Args:
             ai1: First AI agent
             ai2: Second AI agent
-            num_games: Number of games to play
+            num_games: Number of games to play (the maximum with sprt)
             verbose: Whether to print progress
+            sprt: Test that stops the match as soon as it accepts one of
+                its Elo hypotheses for AI1 against AI2
+            match_key: Name of the match in the database (default:
+                "<ai1>_vs_<ai2>" difficulties)
+            resume: Count games of this match already in the database
+                instead of playing them again
+            coordinator: Play the games on its (possibly remote) workers
+                instead of in this process; all games are dispatched at
+                once, so sprt is only applied to the finished results
         
         Returns:
-            Dictionary with match results
+            Dictionary with match results, including AI1's Elo difference
+            with a 95% confidence interval
+        
+        Raises:
+            ValueError: If resuming without a database, or the stored games
+                were played with different AI settings
         """
         wins_ai1 = 0
         wins_ai2 = 0
         draws = 0
         game_times = []
+        match_index = len(self.match_history)
+        first_entry = len(self.move_log)
+        if match_key is None:
+            match_key = f"{ai1.difficulty.value}_vs_{ai2.difficulty.value}"
+        config = {'player_1': self._ai_config(ai1),
+                  'player_2': self._ai_config(ai2)}
+        
+        finished = {}
+        if resume:
+            if self.database is None:
+                raise ValueError("Resuming a match needs a results database")
+            finished = {game['game_index']: game
+                        for game in self.database.games(match_key)}
+        resumed = set(finished)
+        
+        if coordinator is not None:
+            remaining = [game_num for game_num in range(num_games)
+                         if game_num not in finished]
+            if verbose:
+                print(f"Dispatching {len(remaining)} games to "
+                      f"{len(coordinator.workers)} workers...")
+            finished.update(self._play_remote_games(
+                ai1, ai2, coordinator, match_key, remaining, config))
         
         for game_num in range(num_games):
             if verbose:
                 print(f"Game {game_num + 1}/{num_games}...", end=" ")
             
-            start_time = time.time()
-            result = self._play_game(ai1, ai2)
-            game_time = time.time() - start_time
-            game_times.append(game_time)
+            if game_num in finished:
+                game = finished[game_num]
+                if game['config'] != config:
+                    raise ValueError(f"Game {game_num} of {match_key} was "
+                                     f"played with different settings")
+                result = game['winner']
+                game_times.append(game['duration'])
+                for entry in game['timings']:
+                    entry['match'] = match_index
+                    self.move_log.append(entry)
+                if verbose and game_num in resumed:
+                    print("(resumed)", end=" ")
+            else:
+                result, game_time = self._run_game(ai1, ai2, match_key,
+                                                   match_index, game_num,
+                                                   config)
+                game_times.append(game_time)
             
             if result == 1:
                 wins_ai1 += 1
@@ -61,35 +163,215 @@ class Tournament:
                 draws += 1
                 if verbose:
                     print("Draw")
+            
+            if sprt is not None:
+                sprt_result = sprt.status(wins_ai1, draws, wins_ai2)
+                if sprt_result != 'continue':
+                    if verbose:
+                        print(f"SPRT accepted {sprt_result} after "
+                              f"{game_num + 1} games")
+                    break
+        
+        results = self._match_results(ai1.difficulty.value,
+                                      ai2.difficulty.value,
+                                      wins_ai1, wins_ai2, draws, game_times,
+                                      self.move_log[first_entry:])
+        
+        if sprt is not None:
+            results['sprt'] = {
+                'elo0': sprt.elo0,
+                'elo1': sprt.elo1,
+                'llr': sprt.llr(wins_ai1, draws, wins_ai2),
+                'lower_bound': sprt.lower_bound,
+                'upper_bound': sprt.upper_bound,
+                'result': sprt.status(wins_ai1, draws, wins_ai2)
+            }
+        
+        self.match_history.append(results)
+        return results
+    
+    def _play_remote_games(self, ai1: MillAI, ai2: MillAI,
+                           coordinator: 'GameCoordinator', match_key: str,
+                           game_nums: List[int], config: Dict) -> Dict:
+        """
+        Play games of a match on a coordinator's workers and store them.
+        
+        Args:
+            ai1: First AI (plays as player 1)
+            ai2: Second AI (plays as player 2)
+            coordinator: Coordinator with connected workers
+            match_key: Name of the match in the database
+            game_nums: Numbers of the games to play
+            config: Settings of both AIs
+        
+        Returns:
+            Dictionary mapping each game number to a finished game in the
+            form returned by ResultsDatabase.games
+        """
+        games = [{'player_1': ai1.get_config(),
+                  'player_2': ai2.get_config(),
+                  'seed': self._game_seed(match_key, game_num),
+                  'game': game_num,
+                  'repetition_limit': self.repetition_limit}
+                 for game_num in game_nums]
         
-        results = {
-            'ai1_difficulty': ai1.difficulty.value,
-            'ai2_difficulty': ai2.difficulty.value,
+        finished = {}
+        for index, result in coordinator.play_games(games):
+            game_num = game_nums[index]
+            record = GameRecord.from_dict(result['record'])
+            self._finish_game(match_key, game_num, config, record,
+                              result['game_time'], result['move_log'])
+            finished[game_num] = {'config': config,
+                                  'winner': record.winner,
+                                  'duration': result['game_time'],
+                                  'timings': result['move_log']}
+        return finished
+    
+    @staticmethod
+    def _match_results(ai1_difficulty: str, ai2_difficulty: str,
+                       wins_ai1: int, wins_ai2: int, draws: int,
+                       game_times: List[float],
+                       move_entries: List[Dict]) -> Dict:
+        """Build the result dictionary of a finished match."""
+        return {
+            'ai1_difficulty': ai1_difficulty,
+            'ai2_difficulty': ai2_difficulty,
             'ai1_wins': wins_ai1,
             'ai2_wins': wins_ai2,
             'draws': draws,
-            'total_games': num_games,
+            'total_games': wins_ai1 + wins_ai2 + draws,
             'avg_game_time': sum(game_times) / len(game_times),
-            'game_times': game_times
+            'game_times': game_times,
+            'move_latency': summarize_moves(move_entries,
+                                            ('player', 'difficulty')),
+            'elo': elo_estimate(wins_ai1, draws, wins_ai2)
         }
+    
+    def _game_seed(self, match_key: str, game_num: int) -> int:
+        """Get the random seed of one game (reproducible with a base seed)."""
+        if self.seed is None:
+            return random.randrange(2 ** 32)
+        return random.Random(f"{self.seed}:{match_key}:{game_num}").randrange(2 ** 32)
+    
+    def _run_game(self, ai1: MillAI, ai2: MillAI,
+                  match_key: str, match_index: int, game_num: int,
+                  config: Dict):
+        """
+        Play one seeded game of a match and store it.
         
-        self.match_history.append(results)
-        return results
+        Args:
+            ai1: First AI (plays as player 1)
+            ai2: Second AI (plays as player 2)
+            match_key: Name of the match in the database
+            match_index: Index of the match in match_history
+            game_num: Number of the game within the match
+            config: Settings of both AIs
+        
+        Returns:
+            Tuple of (winner, game time in seconds)
+        """
+        seed = self._game_seed(match_key, game_num)
+        first_entry = len(self.move_log)
+        record, game_time = self._play_seeded_game(
+            ai1, ai2, seed, {'match': match_index, 'game': game_num})
+        self._finish_game(match_key, game_num, config, record, game_time,
+                          self.move_log[first_entry:])
+        return record.winner, game_time
+    
+    def _play_seeded_game(self, ai1: MillAI, ai2: MillAI, seed: int,
+                          log_fields: Dict) -> Tuple[GameRecord, float]:
+        """
+        Play one game after seeding the random generator.
+        
+        Args:
+            ai1: First AI (plays as player 1)
+            ai2: Second AI (plays as player 2)
+            seed: Random seed of the game
+            log_fields: Fields added to this game's move log entries
+        
+        Returns:
+            Tuple of (finished game record, game time in seconds)
+        """
+        # AIs without their own seed draw random moves from the
+        # module-level generator
+        random.seed(seed)
+        
+        record = GameRecord({'player_1': ai1.difficulty.value,
+                             'player_2': ai2.difficulty.value,
+                             'seed': seed})
+        start_time = time.time()
+        record.winner = self._play_game(ai1, ai2, record, log_fields)
+        return record, time.time() - start_time
+    
+    def _finish_game(self, match_key: str, game_num: int, config: Dict,
+                     record: GameRecord, game_time: float,
+                     move_entries: List[Dict]):
+        """Keep the record of a finished game and write it to the database."""
+        if self.record_games:
+            self.records.append(record)
+        if self.database is not None:
+            timings = [{key: value for key, value in entry.items()
+                        if key != 'match'}
+                       for entry in move_entries]
+            self.database.add_game(match_key, game_num,
+                                   record.metadata['player_1'],
+                                   record.metadata['player_2'],
+                                   config, record.metadata['seed'],
+                                   record.winner, game_time,
+                                   record.moves, timings)
+    
+    @staticmethod
+    def _ai_config(ai: MillAI) -> Dict:
+        """Get the settings that identify an AI's playing strength."""
+        return {
+            'difficulty': ai.difficulty.value,
+            'max_depth': ai.max_depth,
+            'random_prob': ai.random_prob,
+            'utility': ai.utility_function.profile_id,
+            'node_budget': ai.minimax_ai.node_budget,
+            'use_lmr': ai.minimax_ai.use_lmr,
+            'use_futility': ai.minimax_ai.use_futility,
+            'use_pvs': ai.minimax_ai.use_pvs
+        }
     
-    def _play_game(self, ai1: MillAI, ai2: MillAI) -> int:
+    def _play_game(self, ai1: MillAI, ai2: MillAI,
+                   record: GameRecord = None,
+                   log_fields: Dict = None) -> int:
         """
         Play a single game between two AIs.
         
         Args:
             ai1: First AI (plays as player 1)
             ai2: Second AI (plays as player 2)
+            record: Record to append the played moves to
+            log_fields: Fields added to this game's move log entries
         
         Returns:
             Winner (1, 2, or 0 for draw)
         """
+        if self.memory_profiler is None:
+            return self._play_moves(ai1, ai2, record, log_fields)
+        
+        # Objects still alive after the game are what it retains (e.g. in
+        # the move log or caches)
+        self.memory_profiler.start_game()
+        winner = self._play_moves(ai1, ai2, record, log_fields)
+        self.memory_profiler.finish_game(log_fields)
+        return winner
+    
+    def _play_moves(self, ai1: MillAI, ai2: MillAI,
+                    record: GameRecord = None,
+                    log_fields: Dict = None) -> int:
+        """Play the moves of a game (see _play_game) and return the winner."""
+        from famnit_gym.envs import mill
+        
         env = mill.env(render_mode=None)  # No rendering for speed
         env.reset()
         
+        # Position hash -> occurrences since the last irreversible move
+        history = {}
+        ply = 0
+        
         for agent in env.agent_iter():
             observation, reward, termination, truncation, info = env.last()
             
@@ -106,32 +388,71 @@ class Tournament:
             # Get current player
             player = 1 if agent == "player_1" else 2
             
-            # Get transition model
-            model = mill.transition_model(env)
+            # Get transition model (with the pieces in hand, which
+            # famnit does not expose)
+            model = HandTrackingModel(mill.transition_model(env), ply)
+            
+            if self.repetition_limit:
+                key = GameUtils.position_hash(model, player)
+                history[key] = history.get(key, 0) + 1
+                if history[key] >= self.repetition_limit:
+                    return 0  # Draw by repetition
             
             # Get move from appropriate AI
-            if player == 1:
-                move = ai1.get_move(model, player)
-            else:
-                move = ai2.get_move(model, player)
+            ai = ai1 if player == 1 else ai2
+            features = position_features(model, player)
+            if self.memory_profiler is not None:
+                self.memory_profiler.start_move()
+            start_time = time.perf_counter()
+            move = ai.get_move(model, player)
+            elapsed = time.perf_counter() - start_time
+            
+            entry = dict(log_fields or {})
+            entry.update(features)
+            entry.update({
+                'ply': ply,
+                'player': player,
+                'difficulty': ai.difficulty.value,
+                'seconds': elapsed,
+                'nodes': ai.minimax_ai.nodes_evaluated,
+                'depth': ai.minimax_ai.completed_depth
+            })
+            if self.memory_profiler is not None:
+                entry.update(self.memory_profiler.finish_move(entry['nodes']))
+            self.move_log.append(entry)
+            ply += 1
             
+            if move is not None and GameUtils.is_irreversible(move):
+                history.clear()
+            
+            if record is not None:
+                record.add_move(move)
             env.step(move)
         
         return 0  # Draw
     
     def run_tournament(self, 
                       difficulties: List[Difficulty],
-                      games_per_match: int = 2) -> Dict:
+                      games_per_match: int = 2,
+                      resume: bool = False,
+                      num_workers: int = 1) -> Dict:
         """
         Run a round-robin tournament.
         
         Args:
             difficulties: List of difficulties to include
             games_per_match: Number of games per match
+            resume: Skip games already stored in the database
+            num_workers: Number of processes playing games in parallel
+                (see TournamentScheduler)
         
         Returns:
             Tournament results
         """
+        if num_workers > 1:
+            return TournamentScheduler(self, num_workers).run(
+                difficulties, games_per_match, resume)
+        
         results = {}
         
         for i, diff1 in enumerate(difficulties):
@@ -139,16 +460,125 @@ class Tournament:
                 if diff1 == diff2:
                     continue
                 
-                ai1 = MillAI(difficulty=diff1)
-                ai2 = MillAI(difficulty=diff2)
-                
-                match_result = self.run_match(ai1, ai2, games_per_match)
+                ai1 = MillAI(difficulty=diff1, disk_cache=self.disk_cache)
+                ai2 = MillAI(difficulty=diff2, disk_cache=self.disk_cache)
                 
                 key = f"{diff1.value}_vs_{diff2.value}"
+                match_result = self.run_match(ai1, ai2, games_per_match,
+                                              match_key=key, resume=resume)
+                
                 results[key] = match_result
         
         return results
     
+    def latency_summary(self,
+                        group_by: Sequence[str] = ('difficulty', 'phase')) -> Dict:
+        """
+        Summarize the AI move times of all games played so far.
+        
+        Args:
+            group_by: Move log fields to group by (e.g. 'player',
+                'difficulty', 'phase')
+        
+        Returns:
+            Dictionary mapping each group to p50/p95/p99/max latency and
+            nodes/sec
+        """
+        return summarize_moves(self.move_log, group_by)
+    
+    def export_move_log(self, path: str):
+        """
+        Write the move log as JSON lines (one AI move per line).
+        
+        Args:
+            path: Output file
+        """
+        with open(path, 'w') as f:
+            for entry in self.move_log:
+                f.write(json.dumps(entry) + '\n')
+    
+    def memory_summary(self,
+                       group_by: Sequence[str] = ('difficulty', 'phase')) -> Dict:
+        """
+        Summarize the memory measurements of all games played so far.
+        
+        Args:
+            group_by: Move log fields to group the moves by
+        
+        Returns:
+            Dictionary with per-group move summaries ('moves', see
+            summarize_memory) and the retained memory of the games
+            ('games', see MemoryProfiler.summary)
+        
+        Raises:
+            ValueError: If the tournament has no memory profiler
+        """
+        if self.memory_profiler is None:
+            raise ValueError("Memory summaries need a memory profiler")
+        return {'moves': summarize_memory(self.move_log, group_by),
+                'games': self.memory_profiler.summary()}
+    
+    def export_memory_report(self, path: str):
+        """
+        Write the memory summary and per-game measurements as JSON.
+        
+        Args:
+            path: Output file
+        
+        Raises:
+            ValueError: If the tournament has no memory profiler
+        """
+        report = self.memory_summary()
+        report['per_game'] = self.memory_profiler.games
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    def print_memory_table(self,
+                           group_by: Sequence[str] = ('difficulty', 'phase')):
+        """
+        Print per-move peak memory and the memory retained by games.
+        
+        Args:
+            group_by: Move log fields to group by
+        
+        Raises:
+            ValueError: If the tournament has no memory profiler
+        """
+        summary = self.memory_summary(group_by)
+        print("\n=== Move Memory (KiB) ===")
+        print(f"{'group':24s} {'moves':>6s} {'p50':>8s} {'p95':>8s} "
+              f"{'max':>8s} {'B/node':>8s}")
+        for name, moves in summary['moves'].items():
+            print(f"{name:24s} {moves['count']:6d} "
+                  f"{moves['peak_p50'] / 1024:8.1f} "
+                  f"{moves['peak_p95'] / 1024:8.1f} "
+                  f"{moves['peak_max'] / 1024:8.1f} "
+                  f"{moves['bytes_per_node']:8.0f}")
+        
+        games = summary['games']
+        print(f"\nRetained per game: {games['objects_per_game']:.0f} objects, "
+              f"{games['bytes_per_game'] / 1024:.1f} KiB "
+              f"({games['games']} games)")
+        for site, size in list(games['top_sites'].items())[:5]:
+            print(f"  {size / 1024:8.1f} KiB  {site}")
+    
+    def print_latency_table(self,
+                            group_by: Sequence[str] = ('difficulty', 'phase')):
+        """
+        Print per-move latency percentiles and throughput.
+        
+        Args:
+            group_by: Move log fields to group by
+        """
+        print("\n=== Move Latency ===")
+        print(f"{'group':24s} {'moves':>6s} {'p50':>8s} {'p95':>8s} "
+              f"{'p99':>8s} {'max':>8s} {'nodes/s':>10s}")
+        for name, summary in self.latency_summary(group_by).items():
+            print(f"{name:24s} {summary['count']:6d} "
+                  f"{summary['p50']:8.3f} {summary['p95']:8.3f} "
+                  f"{summary['p99']:8.3f} {summary['max']:8.3f} "
+                  f"{summary['nodes_per_sec']:10.0f}")
+    
     def print_results(self):
         """Print tournament results."""
         print("\n=== Tournament Results ===")
@@ -158,4 +588,12 @@ class Tournament:
             print(f"  AI2 wins: {match['ai2_wins']}")
             print(f"  Draws: {match['draws']}")
             print(f"  Avg game time: {match['avg_game_time']:.2f}s")
+            elo = match['elo']
+            print(f"  AI1 Elo difference: {elo['elo']:+.0f} "
+                  f"[{elo['elo_lower']:+.0f}, {elo['elo_upper']:+.0f}]")
+            if 'sprt' in match:
+                print(f"  SPRT ({match['sprt']['elo0']:g} vs "
+                      f"{match['sprt']['elo1']:g} Elo): "
+                      f"{match['sprt']['result']} "
+                      f"(LLR {match['sprt']['llr']:.2f})")
 
@@ -0,0 +1,116 @@
+"""
+Lockstep simulation of many games between shallow AIs.
+"""
+
+import time
+from typing import TYPE_CHECKING, Dict
+
+import numpy as np
+
+from src.ai.vector_search import best_moves
+from src.game.game_record import GameRecord
+from src.game.vector_env import VectorMillEnv, generate_moves
+from src.analysis.elo import elo_estimate
+
+if TYPE_CHECKING:
+    from src.ai.difficulties import MillAI
+
+
+def _random_moves(env: VectorMillEnv,
+                  games: np.ndarray,
+                  rng: np.random.Generator) -> np.ndarray:
+    """Pick a uniformly random legal move in each of the given games."""
+    position, moves = generate_moves(env.boards[games], env.in_hand[games],
+                                     env.players[games])
+    counts = np.bincount(position, minlength=len(games))
+    starts = np.cumsum(counts) - counts
+    return moves[starts + (rng.random(len(games)) * counts).astype(np.int64)]
+
+
+def run_vector_match(ai1: 'MillAI',
+                     ai2: 'MillAI',
+                     num_games: int,
+                     max_plies: int = 200,
+                     seed: int = None,
+                     record_games: bool = False) -> Dict:
+    """
+    Play many games between two AIs at once.
+    
+    All games advance one move per step, and the moves of every game are
+    chosen together: random moves with each AI's random_prob, otherwise
+    a batched full-width minimax search to its max_depth with its utility
+    function (see src.ai.vector_search). The search has no alpha-beta
+    specific refinements (flying search, repetition draws), so the games
+    follow MillAI's play closely but not exactly; it suits shallow AIs
+    such as EASY.
+    
+    Args:
+        ai1: First AI (plays as player 1)
+        ai2: Second AI (plays as player 2)
+        num_games: Number of games
+        max_plies: Moves after which a game is drawn
+        seed: Seed for the random moves
+        record_games: Whether to return a GameRecord of each game
+    
+    Returns:
+        Dictionary with wins of each AI, draws, total games, average
+        game length in plies, elapsed time, games per second and an Elo
+        estimate (plus records if requested)
+    """
+    env = VectorMillEnv(num_games, max_plies=max_plies)
+    rng = np.random.default_rng(seed)
+    records = None
+    if record_games:
+        records = [GameRecord({'player_1': ai1.difficulty.value,
+                               'player_2': ai2.difficulty.value,
+                               'seed': seed, 'game': game})
+                   for game in range(num_games)]
+    
+    start_time = time.time()
+    while True:
+        games = env.active()
+        if len(games) == 0:
+            break
+        
+        moves = np.zeros((len(games), 3), dtype=np.int64)
+        for player, ai in ((1, ai1), (2, ai2)):
+            selected = np.flatnonzero(env.players[games] == player)
+            if len(selected) == 0:
+                continue
+            player_games = games[selected]
+            random_move = rng.random(len(player_games)) < ai.random_prob
+            if random_move.any():
+                moves[selected[random_move]] = _random_moves(
+                    env, player_games[random_move], rng)
+            searched = player_games[~random_move]
+            if len(searched):
+                moves[selected[~random_move]], _ = best_moves(
+                    env.boards[searched], env.in_hand[searched],
+                    env.players[searched], ai.max_depth, ai.utility_function)
+        
+        if records is not None:
+            for game, move in zip(games, moves.tolist()):
+                records[game].add_move(move)
+        env.step(games, moves)
+    elapsed = time.time() - start_time
+    
+    wins_ai1 = int((env.winners == 1).sum())
+    wins_ai2 = int((env.winners == 2).sum())
+    draws = num_games - wins_ai1 - wins_ai2
+    results = {
+        'ai1_difficulty': ai1.difficulty.value,
+        'ai2_difficulty': ai2.difficulty.value,
+        'ai1_wins': wins_ai1,
+        'ai2_wins': wins_ai2,
+        'draws': draws,
+        'total_games': num_games,
+        'avg_plies': float(env.plies.mean()),
+        'total_time': elapsed,
+        'games_per_second': num_games / elapsed if elapsed > 0 else float('inf'),
+        'elo': elo_estimate(wins_ai1, draws, wins_ai2)
+    }
+    if records is not None:
+        for record, winner in zip(records, env.winners.tolist()):
+            record.winner = winner
+        results['records'] = records
+    return results
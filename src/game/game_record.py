@@ -0,0 +1,134 @@
+"""
+Compact records of played games.
+"""
+
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .mill_state import MillState
+
+
+class GameRecord:
+    """
+    Move list of one game, from the initial position.
+    
+    Players alternate starting with player 1; a move of None is a pass.
+    Positions are rebuilt by replaying the moves, so a record only stores
+    the moves, the result and free-form metadata.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self,
+                 metadata: Dict = None,
+                 moves: List[Optional[List[int]]] = None,
+                 winner: int = None):
+        """
+        Initialize game record.
+        
+        Args:
+            metadata: Information about the game (e.g. player names)
+            moves: Moves played so far
+            winner: 1, 2, or 0 for draw (None while the game is running)
+        """
+        self.metadata = dict(metadata or {})
+        self.moves = [None if move is None else [int(x) for x in move]
+                      for move in (moves or [])]
+        self.winner = winner
+    
+    def add_move(self, move: Optional[List[int]]):
+        """
+        Append the next move.
+        
+        Args:
+            move: Move [src, dst, capture], or None for a pass
+        """
+        self.moves.append(None if move is None else [int(x) for x in move])
+    
+    def states(self) -> Iterator[Tuple[MillState, int, Optional[List[int]]]]:
+        """
+        Replay the game, keeping the full game state.
+        
+        Yields:
+            Tuples of (state, player_to_move, last_move) for the initial
+            position and the position after every move (each state is a
+            separate copy)
+        """
+        state = MillState()
+        player = 1
+        last_move = None
+        yield state.clone(), player, last_move
+        
+        for move in self.moves:
+            if move is not None:
+                state.make_move(player, move)
+            player = 2 if player == 1 else 1
+            last_move = move
+            yield state.clone(), player, last_move
+    
+    def positions(self) -> Iterator[Tuple[List[int], int, Optional[List[int]]]]:
+        """
+        Replay the game.
+        
+        Yields:
+            Tuples of (board, player_to_move, last_move) for the initial
+            position and the position after every move
+        """
+        for state, player, last_move in self.states():
+            yield state.get_state(), player, last_move
+    
+    def to_dict(self) -> Dict:
+        """
+        Serialize the record.
+        
+        Returns:
+            JSON-compatible dictionary
+        """
+        return {
+            'version': self.VERSION,
+            'metadata': self.metadata,
+            'winner': self.winner,
+            'moves': self.moves
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GameRecord':
+        """
+        Deserialize a record.
+        
+        Args:
+            data: Dictionary created by to_dict
+        
+        Returns:
+            Game record
+        
+        Raises:
+            ValueError: If the record version is not supported
+        """
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported record version: {data.get('version')}")
+        return cls(data.get('metadata'), data.get('moves'), data.get('winner'))
+    
+    def save(self, path: str):
+        """
+        Write the record to a JSON file.
+        
+        Args:
+            path: Output file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+    
+    @classmethod
+    def load(cls, path: str) -> 'GameRecord':
+        """
+        Read a record from a JSON file.
+        
+        Args:
+            path: Record file
+        
+        Returns:
+            Game record
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
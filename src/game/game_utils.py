@@ -2,12 +2,66 @@
 Utility functions for Mill game.
 """
 
-from typing import TYPE_CHECKING, List
+import random
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from famnit_gym.envs.mill.mill_model import MillModel
 
 
+def _make_zobrist_keys(seed: int):
+    """Generate Zobrist keys for pieces, side to move, placing and hands."""
+    rng = random.Random(seed)
+    pieces = [[0, rng.getrandbits(64), rng.getrandbits(64)]
+              for _ in range(24)]
+    side = rng.getrandbits(64)
+    placing = [0, rng.getrandbits(64), rng.getrandbits(64)]
+    # Indexed by player, then pieces in hand (at most one per point)
+    hand = [[0] * 25] + [[rng.getrandbits(64) for _ in range(25)]
+                         for _ in range(2)]
+    return pieces, side, placing, hand
+
+
+def _board_symmetries(mills: List[List[int]]) -> List[Tuple[int, ...]]:
+    """
+    Find the permutations of the points that map every mill to a mill.
+    
+    Adjacency follows the lines of the mills, so these permutations
+    preserve the rules. Each is a tuple indexed by point (0 maps to 0, so
+    move fields that are not points stay unchanged).
+    """
+    lines = {tuple(mill) for mill in mills} | {tuple(mill[::-1]) for mill in mills}
+    adjacent = {point: set() for point in range(1, 25)}
+    for a, b, c in mills:
+        adjacent[a].add(b)
+        adjacent[b].update((a, c))
+        adjacent[c].add(b)
+    
+    symmetries = []
+    image = [0] * 25
+    
+    def extend(point: int, used: set):
+        if point > 24:
+            symmetries.append(tuple(image))
+            return
+        for target in range(1, 25):
+            if (target in used
+                    or len(adjacent[target]) != len(adjacent[point])
+                    or any(image[other] not in adjacent[target]
+                           for other in adjacent[point] if other < point)):
+                continue
+            image[point] = target
+            if all(tuple(image[p] for p in mill) in lines
+                   for mill in mills if point == max(mill)):
+                used.add(target)
+                extend(point + 1, used)
+                used.discard(target)
+            image[point] = 0
+    
+    extend(1, set())
+    return symmetries
+
+
 class GameUtils:
     """
     Utility functions for Mill game operations.
@@ -27,6 +81,18 @@ class GameUtils:
         [1, 4, 7], [3, 6, 9], [16, 19, 22], [18, 21, 24]
     ]
     
+    # Zobrist keys: one random 64-bit value per (position, player) pair,
+    # plus keys for the side to move, for each player still placing and
+    # for the pieces a placing player has left in hand.
+    # Fixed seed keeps hashes stable between runs and processes.
+    (ZOBRIST_PIECES, ZOBRIST_SIDE, ZOBRIST_PLACING,
+     ZOBRIST_HAND) = _make_zobrist_keys(0x4D494C4C)
+    
+    # Point permutations preserving the board (rotations, reflections
+    # and the exchange of the inner and outer squares); the first one is
+    # the identity
+    SYMMETRIES = _board_symmetries(MILL_TRIPLETS)
+    
     @staticmethod
     def count_mills(model: 'MillModel', player: int) -> int:
         """
@@ -103,6 +169,157 @@ class GameUtils:
         """
         return model.get_phase(player)
     
+    @staticmethod
+    def board_hash(board: Sequence[int], player: int) -> int:
+        """
+        Compute the Zobrist hash of a board with a given side to move.
+        
+        Args:
+            board: 24 board cells (0 empty, 1 or 2 for the owner)
+            player: Player to move (1 or 2)
+        
+        Returns:
+            64-bit position hash
+        """
+        keys = GameUtils.ZOBRIST_PIECES
+        h = GameUtils.ZOBRIST_SIDE if player == 2 else 0
+        for pos in range(24):
+            owner = board[pos]
+            if owner:
+                h ^= keys[pos][owner]
+        return h
+    
+    @staticmethod
+    def position_hash(model: 'MillModel', player: int) -> int:
+        """
+        Compute the Zobrist hash of a game state with a given side to move.
+        
+        Besides the board, the hash covers which players are still in the
+        placing phase, since that changes their legal moves (see
+        placing_hash).
+        
+        Args:
+            model: Game state
+            player: Player to move (1 or 2)
+        
+        Returns:
+            64-bit position hash
+        """
+        return (GameUtils.board_hash(model.get_state(), player)
+                ^ GameUtils.placing_hash(model))
+    
+    @staticmethod
+    def placing_hash(model: 'MillModel') -> int:
+        """
+        Compute the part of a position hash that covers the placing phase.
+        
+        Hashes which players are still placing and, if the model exposes
+        them (see pieces_in_hand), how many pieces they have left: after
+        captures, the same board can be reached with different hands.
+        
+        Args:
+            model: Game state
+        
+        Returns:
+            64-bit hash (0 once both players have placed all pieces)
+        """
+        h = 0
+        hands = None
+        for owner in (1, 2):
+            if model.get_phase(owner) == 'placing':
+                h ^= GameUtils.ZOBRIST_PLACING[owner]
+                if hands is None:
+                    hands = GameUtils.pieces_in_hand(model) or ()
+                if hands:
+                    h ^= GameUtils.ZOBRIST_HAND[owner][hands[owner - 1]]
+        return h
+    
+    @staticmethod
+    def canonical_hash(model: 'MillModel', player: int) -> Tuple[int, Tuple[int, ...]]:
+        """
+        Compute a position hash shared by all symmetric positions.
+        
+        The hash is the smallest position hash of the board's symmetric
+        variants, so positions that differ only by a rotation or
+        reflection of the board get the same hash.
+        
+        Args:
+            model: Game state
+            player: Player to move (1 or 2)
+        
+        Returns:
+            Tuple of (64-bit hash, symmetry mapping the position onto the
+            variant that was hashed)
+        """
+        base = GameUtils.ZOBRIST_SIDE if player == 2 else 0
+        base ^= GameUtils.placing_hash(model)
+        
+        pieces = [(pos + 1, owner)
+                  for pos, owner in enumerate(model.get_state()) if owner]
+        keys = GameUtils.ZOBRIST_PIECES
+        best_hash, best_symmetry = None, None
+        for symmetry in GameUtils.SYMMETRIES:
+            h = base
+            for point, owner in pieces:
+                h ^= keys[symmetry[point] - 1][owner]
+            if best_hash is None or h < best_hash:
+                best_hash, best_symmetry = h, symmetry
+        return best_hash, best_symmetry
+    
+    @staticmethod
+    def pieces_in_hand(model: 'MillModel') -> Optional[Tuple[int, int]]:
+        """
+        Get the pieces both players still have to place, if known.
+        
+        The board alone does not tell them apart after captures. MillState
+        exposes them; other models give None.
+        
+        Args:
+            model: Game state
+        
+        Returns:
+            Tuple of (player 1, player 2) pieces in hand, or None
+        """
+        in_hand = getattr(model, 'in_hand', None)
+        if in_hand is None:
+            return None
+        return int(in_hand[1]), int(in_hand[2])
+    
+    @staticmethod
+    def transform_move(move: Sequence[int], symmetry: Sequence[int],
+                       inverse: bool = False) -> List[int]:
+        """
+        Map a move through a board symmetry.
+        
+        Args:
+            move: Move [src, dst, capture]
+            symmetry: Point permutation (from SYMMETRIES)
+            inverse: Map back from the symmetric position instead
+        
+        Returns:
+            Corresponding move on the transformed board
+        """
+        if inverse:
+            return [symmetry.index(int(point)) if point else 0
+                    for point in move]
+        return [symmetry[int(point)] for point in move]
+    
+    @staticmethod
+    def is_irreversible(move: List[int]) -> bool:
+        """
+        Check whether a move can never be undone by later moves.
+        
+        Placements and captures change the material on the board for
+        good, so no position seen before them can occur again.
+        
+        Args:
+            move: Move [src, dst, capture]
+        
+        Returns:
+            True for placements and captures
+        """
+        return move[0] == 0 or move[2] > 0
+    
     @staticmethod
     def format_move(move: List[int]) -> str:
         """
@@ -0,0 +1,88 @@
+"""
+Pieces-in-hand tracking for game models that do not expose them.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+
+
+class HandTrackingModel:
+    """
+    Game model wrapper that counts the pieces both players have in hand.
+    
+    famnit's MillModel does not expose the pieces left to place, and the
+    board alone does not tell them apart after captures. Players place
+    alternately, player 1 first, so the number of plies played gives
+    the hands; from there the wrapper counts placements (moves from
+    point 0) as they are made, in games and searches alike. The counts
+    are exposed as in_hand, like MillState (see GameUtils.pieces_in_hand).
+    """
+    
+    __slots__ = ('model', 'in_hand')
+    
+    def __init__(self,
+                 model: 'MillModel',
+                 plies: int = 0,
+                 pieces_per_player: int = 9):
+        """
+        Wrap a model.
+        
+        Args:
+            model: Game state
+            plies: Moves played since the start of the game
+            pieces_per_player: Pieces each player places in a game
+        """
+        self.model = model
+        self.in_hand = [0,
+                        max(0, pieces_per_player - (plies + 1) // 2),
+                        max(0, pieces_per_player - plies // 2)]
+    
+    def clone(self) -> 'HandTrackingModel':
+        """
+        Create a copy of the wrapped state and its hands.
+        
+        Returns:
+            Copied state
+        """
+        copy = HandTrackingModel.__new__(HandTrackingModel)
+        copy.model = self.model.clone()
+        copy.in_hand = self.in_hand[:]
+        return copy
+    
+    def make_move(self, player: int, move: Sequence[int]) -> Dict:
+        """
+        Play a move and count it if it places a piece.
+        
+        Args:
+            player: Player making the move
+            move: Move [src, dst, capture]
+        
+        Returns:
+            Move information of the wrapped model
+        """
+        info = self.model.make_move(player, move)
+        if move[0] == 0 and self.in_hand[player] > 0:
+            self.in_hand[player] -= 1
+        return info
+    
+    def get_state(self) -> List[int]:
+        """Get the board of the wrapped model."""
+        return self.model.get_state()
+    
+    def legal_moves(self, player: int) -> List[List[int]]:
+        """Get a player's legal moves from the wrapped model."""
+        return self.model.legal_moves(player)
+    
+    def game_over(self) -> bool:
+        """Check whether the wrapped game is over."""
+        return self.model.game_over()
+    
+    def count_pieces(self, player: int) -> int:
+        """Count a player's pieces on the board of the wrapped model."""
+        return self.model.count_pieces(player)
+    
+    def get_phase(self, player: int) -> str:
+        """Get a player's phase from the wrapped model."""
+        return self.model.get_phase(player)
@@ -0,0 +1,249 @@
+"""
+Pure-Python Mill state with its own move generator.
+
+MillState implements the part of the MillModel interface the search uses
+(get_state, legal_moves, make_move, clone, game_over, count_pieces,
+get_phase), so it can be checked against famnit with the perft tools in
+src.analysis.perft and used where famnit is not installed.
+"""
+
+from typing import Dict, List, Sequence
+
+from .game_utils import GameUtils
+
+
+def _build_tables():
+    """Derive point adjacency and the mills through each point."""
+    adjacent = [[] for _ in range(25)]
+    mills_through = [[] for _ in range(25)]
+    for mill in GameUtils.MILL_TRIPLETS:
+        # Points of a line are connected to their neighbours on it
+        for a, b in ((mill[0], mill[1]), (mill[1], mill[2])):
+            adjacent[a].append(b)
+            adjacent[b].append(a)
+        for pos in mill:
+            mills_through[pos].append([p for p in mill if p != pos])
+    return ([sorted(points) for points in adjacent],
+            [tuple(tuple(others) for others in mills) for mills in mills_through])
+
+
+# Indexed by point 1..24 (index 0 unused)
+ADJACENT, MILLS_THROUGH = _build_tables()
+
+
+class MillState:
+    """
+    Mill game state using 1-based points and [src, dst, capture] moves.
+    
+    Rules: players place their pieces first; a player with 3 pieces left
+    flies, and one with fewer than 3 (after placing) has lost. Forming a
+    mill captures an opponent piece that is not in a mill, unless all of
+    them are.
+    """
+    
+    def __init__(self, pieces_per_player: int = 9):
+        """
+        Initialize an empty board.
+        
+        Args:
+            pieces_per_player: Pieces each player has to place
+        """
+        self.board = [0] * 24
+        self.in_hand = [0, pieces_per_player, pieces_per_player]
+    
+    @classmethod
+    def from_moves(cls,
+                   moves: Sequence[Sequence[int]],
+                   first_player: int = 1) -> 'MillState':
+        """
+        Create a state by playing moves from the initial position.
+        
+        Args:
+            moves: Moves [src, dst, capture], players alternating
+            first_player: Player making the first move
+        
+        Returns:
+            Resulting state
+        """
+        state = cls()
+        player = first_player
+        for move in moves:
+            state.make_move(player, move)
+            player = 2 if player == 1 else 1
+        return state
+    
+    @classmethod
+    def from_position(cls,
+                      board: Sequence[int],
+                      pieces_in_hand: Sequence[int] = (0, 0)) -> 'MillState':
+        """
+        Create a state from a board and the pieces left to place.
+        
+        Args:
+            board: 24 board cells (0 empty, 1 or 2 for the owner)
+            pieces_in_hand: Pieces players 1 and 2 still have to place
+        
+        Returns:
+            State with the given position
+        
+        Raises:
+            ValueError: If the board does not have 24 valid cells
+        """
+        if len(board) != 24 or any(cell not in (0, 1, 2) for cell in board):
+            raise ValueError(f"Invalid board: {list(board)}")
+        state = cls(0)
+        state.board = [int(cell) for cell in board]
+        state.in_hand = [0, int(pieces_in_hand[0]), int(pieces_in_hand[1])]
+        return state
+    
+    def clone(self) -> 'MillState':
+        """
+        Create a copy of the state.
+        
+        Returns:
+            Copied state
+        """
+        state = MillState.__new__(MillState)
+        state.board = self.board[:]
+        state.in_hand = self.in_hand[:]
+        return state
+    
+    def get_state(self) -> List[int]:
+        """
+        Get the board.
+        
+        Returns:
+            24 board cells (0 empty, 1 or 2 for the owner)
+        """
+        return self.board[:]
+    
+    def count_pieces(self, player: int) -> int:
+        """
+        Count a player's pieces on the board.
+        
+        Args:
+            player: Player (1 or 2)
+        
+        Returns:
+            Number of pieces
+        """
+        return self.board.count(player)
+    
+    def get_phase(self, player: int) -> str:
+        """
+        Get a player's game phase.
+        
+        Args:
+            player: Player (1 or 2)
+        
+        Returns:
+            Phase name ('placing', 'moving', 'flying', 'lost')
+        """
+        if self.in_hand[player] > 0:
+            return 'placing'
+        pieces = self.board.count(player)
+        if pieces < 3:
+            return 'lost'
+        if pieces == 3:
+            return 'flying'
+        return 'moving'
+    
+    def game_over(self) -> bool:
+        """
+        Check if either player has lost on material.
+        
+        Returns:
+            True if the game is over
+        """
+        return self.get_phase(1) == 'lost' or self.get_phase(2) == 'lost'
+    
+    def _forms_mill(self, src: int, dst: int, player: int) -> bool:
+        """Check whether moving a piece from src (0: hand) to dst forms a mill."""
+        board = self.board
+        for a, b in MILLS_THROUGH[dst]:
+            # The moved piece no longer occupies its source point
+            if (a != src and b != src
+                    and board[a - 1] == player and board[b - 1] == player):
+                return True
+        return False
+    
+    def _in_mill(self, pos: int, player: int) -> bool:
+        """Check whether the piece on pos is part of a mill."""
+        board = self.board
+        return any(board[a - 1] == player and board[b - 1] == player
+                   for a, b in MILLS_THROUGH[pos])
+    
+    def capture_targets(self, player: int) -> List[int]:
+        """
+        Get the opponent pieces a player may capture after forming a mill.
+        
+        Args:
+            player: Player forming the mill
+        
+        Returns:
+            Points of capturable pieces
+        """
+        opponent = 2 if player == 1 else 1
+        pieces = [pos for pos in range(1, 25) if self.board[pos - 1] == opponent]
+        free = [pos for pos in pieces if not self._in_mill(pos, opponent)]
+        return free or pieces
+    
+    def legal_moves(self, player: int) -> List[List[int]]:
+        """
+        Get legal moves for a player.
+        
+        Args:
+            player: Player to move (1 or 2)
+        
+        Returns:
+            List of moves [src, dst, capture] (src 0 for placements,
+            capture 0 when no piece is captured)
+        """
+        phase = self.get_phase(player)
+        if phase == 'lost':
+            return []
+        
+        board = self.board
+        empty = [pos for pos in range(1, 25) if board[pos - 1] == 0]
+        if phase == 'placing':
+            steps = [(0, dst) for dst in empty]
+        else:
+            own = [pos for pos in range(1, 25) if board[pos - 1] == player]
+            if phase == 'flying':
+                steps = [(src, dst) for src in own for dst in empty]
+            else:
+                steps = [(src, dst) for src in own
+                         for dst in ADJACENT[src] if board[dst - 1] == 0]
+        
+        targets = None
+        moves = []
+        for src, dst in steps:
+            if self._forms_mill(src, dst, player):
+                if targets is None:
+                    targets = self.capture_targets(player)
+                if targets:
+                    moves.extend([src, dst, capture] for capture in targets)
+                    continue
+            moves.append([src, dst, 0])
+        return moves
+    
+    def make_move(self, player: int, move: Sequence[int]) -> Dict:
+        """
+        Play a move without checking that it is legal.
+        
+        Args:
+            player: Player making the move
+            move: Move [src, dst, capture]
+        
+        Returns:
+            Move information
+        """
+        src, dst, capture = move
+        if src == 0:
+            self.in_hand[player] -= 1
+        else:
+            self.board[src - 1] = 0
+        self.board[dst - 1] = player
+        if capture:
+            self.board[capture - 1] = 0
+        return {'player': player, 'move': [src, dst, capture]}
@@ -0,0 +1,361 @@
+"""
+Vectorized Mill rules for many positions at once.
+
+Positions are rows of NumPy arrays: boards (M, 24) with 0 for empty and
+1 or 2 for the owner, pieces in hand (M, 3) indexed by player (column 0
+unused), and the player to move (M,). The functions here apply the rules
+of MillState to all rows together, and VectorMillEnv advances many
+independent games in lockstep with them.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .game_utils import GameUtils
+from .mill_state import ADJACENT, MILLS_THROUGH
+
+PLACING, MOVING, FLYING, LOST = 0, 1, 2, 3
+
+
+def _build_arrays():
+    """Build the mill, adjacency and mill pair tables as arrays."""
+    mills = np.array(GameUtils.MILL_TRIPLETS) - 1
+    adjacent = np.zeros((24, 24), dtype=bool)
+    for point in range(1, 25):
+        adjacent[point - 1, np.array(ADJACENT[point]) - 1] = True
+    # Pairs are padded with cell 24, which is never occupied (see _padded)
+    width = max(len(mills_through) for mills_through in MILLS_THROUGH)
+    pairs = np.full((24, width, 2), 24)
+    for point in range(1, 25):
+        for k, (a, b) in enumerate(MILLS_THROUGH[point]):
+            pairs[point - 1, k] = (a - 1, b - 1)
+    return mills, adjacent, pairs
+
+
+# Mill triplets as 0-based cells; ADJACENT_MATRIX[a, b] if cells a and b
+# are connected; PAIRS[cell] holds the other two cells of each mill
+# through cell
+MILLS, ADJACENT_MATRIX, PAIRS = _build_arrays()
+
+# Bitboard versions of the tables: bit c stands for cell c
+_ALL_CELLS = (1 << 24) - 1
+_MILL_BITS = (1 << MILLS).sum(axis=1)
+_ADJACENT_BITS = [int((1 << np.flatnonzero(ADJACENT_MATRIX[cell])).sum())
+                  for cell in range(24)]
+_PAIR_BITS = [[(1 << int(a)) | (1 << int(b)) for a, b in PAIRS[cell] if a < 24]
+              for cell in range(24)]
+_POPCOUNT8 = np.array([bin(value).count('1') for value in range(256)],
+                      dtype=np.uint8)
+
+# Positions processed at once (bounds the size of intermediate arrays)
+CHUNK = 4096
+
+
+def _padded(mask: np.ndarray) -> np.ndarray:
+    """Append the always-empty cell 24 to a (M, 24) mask."""
+    return np.concatenate([mask, np.zeros((len(mask), 1), dtype=bool)], axis=1)
+
+
+def phases(boards: np.ndarray, in_hand: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """
+    Get the phase of the given player in each position.
+    
+    Args:
+        boards: Boards (M, 24)
+        in_hand: Pieces left to place (M, 3)
+        players: Player of each position (M,)
+    
+    Returns:
+        Phase codes PLACING, MOVING, FLYING or LOST (M,)
+    """
+    pieces = (boards == players[:, None]).sum(axis=1)
+    phase = np.where(pieces < 3, LOST, np.where(pieces == 3, FLYING, MOVING))
+    return np.where(in_hand[np.arange(len(players)), players] > 0, PLACING, phase)
+
+
+def _capture_targets(boards: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """Get the cells each player may capture after forming a mill (M, 24)."""
+    opponent = boards == (3 - players)[:, None]
+    padded = _padded(opponent)
+    in_mill = (padded[:, PAIRS[:, :, 0]] & padded[:, PAIRS[:, :, 1]]).any(axis=2)
+    free = opponent & ~in_mill
+    return np.where(free.any(axis=1)[:, None], free, opponent)
+
+
+def _steps(boards: np.ndarray,
+           in_hand: np.ndarray,
+           players: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    List the piece movements (ignoring captures) of every position.
+    
+    Returns:
+        Tuple of (position, src point, dst point, forms a mill) arrays,
+        ordered by position, then src, then dst
+    """
+    phase = phases(boards, in_hand, players)[:, None, None]
+    own = boards == players[:, None]
+    empty = boards == 0
+    
+    mask = np.zeros((len(boards), 25, 24), dtype=bool)
+    mask[:, 0, :] = empty & (phase[:, :, 0] == PLACING)
+    mask[:, 1:, :] = (own[:, :, None] & empty[:, None, :]
+                      & ((phase == FLYING)
+                         | ((phase == MOVING) & ADJACENT_MATRIX[None])))
+    position, src, dst = np.nonzero(mask)
+    dst = dst + 1
+    
+    # A mill is formed if both other cells of a line through dst are own
+    # pieces, and neither is the piece being moved
+    pairs = PAIRS[dst - 1]
+    padded = _padded(own)
+    forms = (padded[position[:, None], pairs[:, :, 0]]
+             & padded[position[:, None], pairs[:, :, 1]]
+             & (pairs[:, :, 0] != src[:, None] - 1)
+             & (pairs[:, :, 1] != src[:, None] - 1)).any(axis=1)
+    return position, src, dst, forms
+
+
+def _chunks(num_positions: int) -> range:
+    """Get the start rows of the chunks positions are processed in."""
+    return range(0, max(num_positions, 1), CHUNK)
+
+
+def _popcount(bits: np.ndarray) -> np.ndarray:
+    """Count the set bits of 24-bit bitboards."""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(bits).astype(np.int64)
+    return (_POPCOUNT8[bits & 0xFF] + _POPCOUNT8[(bits >> 8) & 0xFF]
+            + _POPCOUNT8[bits >> 16]).astype(np.int64)
+
+
+def _cell_bits(mask: np.ndarray) -> np.ndarray:
+    """Pack a (M, 24) cell mask into 24-bit bitboards (bit c: cell c)."""
+    packed = np.packbits(mask, axis=1, bitorder='little').astype(np.int64)
+    return packed[:, 0] | (packed[:, 1] << 8) | (packed[:, 2] << 16)
+
+
+def _bitboards(boards: np.ndarray, players: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Get the own, opponent and empty cells of each position as bitboards."""
+    return (_cell_bits(boards == players[:, None]),
+            _cell_bits(boards == (3 - players)[:, None]),
+            _cell_bits(boards == 0))
+
+
+def count_moves(boards: np.ndarray, in_hand: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """
+    Count the legal moves of each position (as len(legal_moves) would).
+    
+    Unlike generate_moves, no move list is built: steps and mill-forming
+    steps are counted on bitboards, and every mill-forming step counts
+    once per capturable piece.
+    
+    Args:
+        boards: Boards (M, 24)
+        in_hand: Pieces left to place (M, 3)
+        players: Player to move in each position (M,)
+    
+    Returns:
+        Number of legal moves (M,)
+    """
+    phase = phases(boards, in_hand, players)
+    own, opponent, empty = _bitboards(boards, players)
+    placing = phase == PLACING
+    moving = phase == MOVING
+    flying = phase == FLYING
+    
+    steps = np.where(placing, _popcount(empty),
+                     np.where(flying, _popcount(own) * _popcount(empty), 0))
+    forming = np.zeros(len(boards), dtype=np.int64)
+    for cell in range(24):
+        open_cell = ((empty >> cell) & 1).astype(bool) & (phase != LOST)
+        neighbours = own & _ADJACENT_BITS[cell]
+        steps += np.where(moving & open_cell, _popcount(neighbours), 0)
+        
+        # A step to the cell closes a mill if some pair of the cell is
+        # owned, unless the moved piece belongs to every owned pair
+        closes = np.zeros(len(boards), dtype=bool)
+        shared = np.full(len(boards), _ALL_CELLS)
+        for pair in _PAIR_BITS[cell]:
+            owned = (own & pair) == pair
+            closes |= owned
+            shared = np.where(owned, shared & pair, shared)
+        sources = np.where(moving, neighbours, own) & ~shared
+        forming += np.where(closes & open_cell,
+                            np.where(placing, 1, _popcount(sources)), 0)
+    
+    in_mill = np.zeros(len(boards), dtype=np.int64)
+    for mill in _MILL_BITS:
+        in_mill |= np.where((opponent & mill) == mill, mill, 0)
+    free = opponent & ~in_mill
+    targets = _popcount(np.where(free != 0, free, opponent))
+    return steps + np.where(targets > 0, forming * (targets - 1), 0)
+
+
+def generate_moves(boards: np.ndarray,
+                   in_hand: np.ndarray,
+                   players: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the legal moves of each position.
+    
+    Args:
+        boards: Boards (M, 24)
+        in_hand: Pieces left to place (M, 3)
+        players: Player to move in each position (M,)
+    
+    Returns:
+        Tuple of (position index of each move, moves [src, dst, capture]
+        as a (K, 3) array); the moves of a position are consecutive and in
+        the order of MillState.legal_moves
+    """
+    positions, all_moves = [], []
+    for start in _chunks(len(boards)):
+        rows = slice(start, start + CHUNK)
+        position, src, dst, forms = _steps(boards[rows], in_hand[rows],
+                                           players[rows])
+        targets = _capture_targets(boards[rows], players[rows])
+        capturing = forms & targets[position].any(axis=1)
+        
+        # Each mill-forming step becomes one move per capturable piece
+        target_rows, cells = np.nonzero(targets[position[capturing]])
+        quiet = ~capturing
+        move_position = np.concatenate([position[quiet],
+                                        position[capturing][target_rows]])
+        moves = np.stack([
+            np.concatenate([src[quiet], src[capturing][target_rows]]),
+            np.concatenate([dst[quiet], dst[capturing][target_rows]]),
+            np.concatenate([np.zeros(quiet.sum(), dtype=np.int64), cells + 1])
+        ], axis=1)
+        order = np.lexsort((moves[:, 2], moves[:, 1], moves[:, 0],
+                            move_position))
+        positions.append(move_position[order] + start)
+        all_moves.append(moves[order])
+    return np.concatenate(positions), np.concatenate(all_moves)
+
+
+def apply_moves(boards: np.ndarray,
+                in_hand: np.ndarray,
+                players: np.ndarray,
+                moves: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Play one move in each position, without checking legality.
+    
+    Args:
+        boards: Boards (M, 24)
+        in_hand: Pieces left to place (M, 3)
+        players: Player making the move in each position (M,)
+        moves: Moves [src, dst, capture] (M, 3)
+    
+    Returns:
+        Tuple of (boards, in_hand, players) of the resulting positions,
+        with the opponent to move
+    """
+    rows = np.arange(len(boards))
+    src, dst, capture = moves[:, 0], moves[:, 1], moves[:, 2]
+    boards = boards.copy()
+    in_hand = in_hand.copy()
+    
+    placing = src == 0
+    in_hand[rows[placing], players[placing]] -= 1
+    boards[rows[~placing], src[~placing] - 1] = 0
+    boards[rows, dst - 1] = players
+    captures = capture > 0
+    boards[rows[captures], capture[captures] - 1] = 0
+    return boards, in_hand, (3 - players).astype(players.dtype)
+
+
+def count_mills(boards: np.ndarray, player: int) -> np.ndarray:
+    """Count the closed mills of a player in each position (M,)."""
+    bits = _cell_bits(boards == player)[:, None]
+    return ((bits & _MILL_BITS) == _MILL_BITS).sum(axis=1)
+
+
+def count_threats(boards: np.ndarray, player: int) -> np.ndarray:
+    """Count the lines with two pieces of a player and one empty cell (M,)."""
+    bits = _cell_bits(boards == player)[:, None]
+    empty = _cell_bits(boards == 0)[:, None]
+    return ((_popcount(bits & _MILL_BITS) == 2)
+            & (_popcount(empty & _MILL_BITS) == 1)).sum(axis=1)
+
+
+class VectorMillEnv:
+    """
+    Many independent Mill games advanced in lockstep.
+    
+    A game ends when the player to move has lost on material or has no
+    legal moves (the other player wins), or as a draw after max_plies
+    moves. Finished games keep their final position until reset.
+    """
+    
+    def __init__(self,
+                 num_games: int,
+                 pieces_per_player: int = 9,
+                 max_plies: int = 200):
+        """
+        Initialize environment.
+        
+        Args:
+            num_games: Number of games
+            pieces_per_player: Pieces each player places
+            max_plies: Moves after which a game is drawn
+        """
+        self.num_games = num_games
+        self.pieces_per_player = pieces_per_player
+        self.max_plies = max_plies
+        self.reset()
+    
+    def reset(self):
+        """Start all games from the initial position."""
+        n = self.num_games
+        self.boards = np.zeros((n, 24), dtype=np.int8)
+        self.in_hand = np.zeros((n, 3), dtype=np.int16)
+        self.in_hand[:, 1:] = self.pieces_per_player
+        self.players = np.ones(n, dtype=np.int8)
+        self.plies = np.zeros(n, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.winners = np.zeros(n, dtype=np.int8)
+    
+    def active(self) -> np.ndarray:
+        """Get the indices of the games still in progress."""
+        return np.flatnonzero(~self.done)
+    
+    def legal_moves(self, games: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate the legal moves of some games.
+        
+        Args:
+            games: Game indices (None: the active games)
+        
+        Returns:
+            Tuple of (game index of each move, moves (K, 3))
+        """
+        if games is None:
+            games = self.active()
+        position, moves = generate_moves(self.boards[games],
+                                         self.in_hand[games],
+                                         self.players[games])
+        return games[position], moves
+    
+    def step(self, games: np.ndarray, moves: np.ndarray):
+        """
+        Play one move in each of the given games.
+        
+        Args:
+            games: Indices of active games
+            moves: Move [src, dst, capture] of each game (len(games), 3)
+        """
+        boards, in_hand, players = apply_moves(self.boards[games],
+                                               self.in_hand[games],
+                                               self.players[games],
+                                               np.asarray(moves))
+        self.boards[games] = boards
+        self.in_hand[games] = in_hand
+        self.players[games] = players
+        self.plies[games] += 1
+        
+        # The player now to move loses without pieces or moves
+        lost = ((phases(boards, in_hand, players) == LOST)
+                | (count_moves(boards, in_hand, players) == 0))
+        self.winners[games[lost]] = 3 - players[lost]
+        self.done[games[lost]] = True
+        self.done[games[self.plies[games] >= self.max_plies]] = True
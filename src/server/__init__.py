@@ -0,0 +1,10 @@
+"""
+Network game server for concurrent human vs AI sessions.
+"""
+
+from .game_server import GameServer, GameSession
+from .client import GameClient, run_load_test
+from .distributed import GameCoordinator, run_worker
+
+__all__ = ['GameServer', 'GameSession', 'GameClient', 'run_load_test',
+           'GameCoordinator', 'run_worker']
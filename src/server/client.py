@@ -0,0 +1,157 @@
+"""
+Asyncio client and load test for the game server.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List
+
+from src.analysis.metrics import LatencyStats
+
+
+class GameClient:
+    """
+    Client for the newline-delimited JSON game server protocol.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765):
+        """
+        Initialize client.
+        
+        Args:
+            host: Server host
+            port: Server port
+        """
+        self.host = host
+        self.port = port
+        self.latency = LatencyStats()
+        self._reader = None
+        self._writer = None
+        self._next_id = 0
+    
+    async def connect(self):
+        """Open the connection to the server."""
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port)
+    
+    async def close(self):
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+    
+    async def request(self, cmd: str, **params) -> Dict:
+        """
+        Send one request and wait for its response.
+        
+        Args:
+            cmd: Command name
+            **params: Command parameters
+        
+        Returns:
+            Response dictionary
+        
+        Raises:
+            RuntimeError: If the server reports an error
+        """
+        self._next_id += 1
+        message = dict(params, cmd=cmd, id=self._next_id)
+        
+        start_time = time.perf_counter()
+        self._writer.write((json.dumps(message) + '\n').encode())
+        await self._writer.drain()
+        response = json.loads(await self._reader.readline())
+        self.latency.add(time.perf_counter() - start_time)
+        
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', 'request failed'))
+        return response
+    
+    async def play_random_game(self,
+                               difficulty: str = 'easy',
+                               rng: random.Random = None,
+                               max_moves: int = 200) -> int:
+        """
+        Play one game with random legal moves against the server AI.
+        
+        Args:
+            difficulty: AI difficulty value
+            rng: Random number generator for move choice
+            max_moves: Number of own moves after which to give up
+        
+        Returns:
+            Number of AI moves served during the game
+        """
+        rng = rng or random.Random()
+        response = await self.request('new_game', difficulty=difficulty,
+                                      human_player=rng.choice([1, 2]))
+        state = response['state']
+        ai_moves = 1 if response['ai_move'] is not None else 0
+        
+        for _ in range(max_moves):
+            if state['game_over'] or not state['legal_moves']:
+                break
+            move = rng.choice(state['legal_moves'])
+            response = await self.request('move', session=state['session'],
+                                          move=move)
+            state = response['state']
+            if response['ai_move'] is not None:
+                ai_moves += 1
+        
+        await self.request('close', session=state['session'])
+        return ai_moves
+
+
+async def run_load_test(host: str = '127.0.0.1',
+                        port: int = 8765,
+                        num_clients: int = 8,
+                        games_per_client: int = 2,
+                        difficulty: str = 'easy',
+                        seed: int = 0) -> Dict:
+    """
+    Measure server throughput with many concurrent random-move clients.
+    
+    Args:
+        host: Server host
+        port: Server port
+        num_clients: Number of concurrent connections
+        games_per_client: Games played by each connection
+        difficulty: AI difficulty value for all sessions
+        seed: Seed for the clients' move choice
+    
+    Returns:
+        Dictionary with AI moves, elapsed time, moves/sec and client-side
+        request latency percentiles
+    """
+    async def client_task(index: int) -> List:
+        client = GameClient(host, port)
+        await client.connect()
+        rng = random.Random(seed + index)
+        moves = 0
+        try:
+            for _ in range(games_per_client):
+                moves += await client.play_random_game(difficulty, rng)
+        finally:
+            await client.close()
+        return [moves, client.latency.samples]
+    
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(client_task(i)
+                                     for i in range(num_clients)))
+    elapsed = time.perf_counter() - start_time
+    
+    total_moves = sum(moves for moves, _ in results)
+    latency = LatencyStats(sample for _, samples in results
+                           for sample in samples)
+    
+    return {
+        'clients': num_clients,
+        'games': num_clients * games_per_client,
+        'ai_moves': total_moves,
+        'elapsed': elapsed,
+        'moves_per_sec': total_moves / elapsed if elapsed > 0 else 0.0,
+        'latency': latency.summary()
+    }
@@ -0,0 +1,317 @@
+"""
+Distributed tournament games over TCP.
+
+A GameCoordinator hands out games to worker processes, which may run on
+other machines. Both sides use the newline-delimited JSON style of the
+game server:
+
+- worker -> coordinator ``{"cmd": "hello", "name": ...}`` once connected
+- coordinator -> worker ``{"cmd": "play", "job": id, "game": {...}}``
+  with both engine configurations, the seed and the game number
+- worker -> coordinator ``{"type": "heartbeat", "job": id}`` every few
+  seconds while playing, then ``{"type": "result", "job": id,
+  "result": {...}}`` with the game record, game time and move log
+- coordinator -> worker ``{"cmd": "shutdown"}`` when it stops
+
+A game whose worker disconnects, reports an error or misses heartbeats
+is put back in the queue and retried on another worker.
+"""
+
+import asyncio
+import json
+import queue
+import socket
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from src.ai.difficulties import MillAI
+from src.analysis.tournament import Tournament
+
+
+# Warm engines of the current worker, keyed by (player, configuration)
+_worker_engines = {}
+
+# Longest message line in bytes: a result carries the game's whole move
+# log (about 210 bytes per ply), far more than asyncio's 64 KiB default
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+def play_game_job(game: Dict) -> Dict:
+    """
+    Play one dispatched game.
+    
+    Args:
+        game: Dictionary with player_1 and player_2 engine configurations
+            (MillAI.get_config), seed, game number and repetition_limit
+    
+    Returns:
+        Dictionary with the game record (GameRecord.to_dict), game_time
+        and move_log
+    """
+    ais = []
+    for player in ('player_1', 'player_2'):
+        key = (player, json.dumps(game[player], sort_keys=True))
+        if key not in _worker_engines:
+            _worker_engines[key] = MillAI.from_config(game[player])
+        ais.append(_worker_engines[key])
+    
+    tournament = Tournament(repetition_limit=game.get('repetition_limit', 3))
+    record, game_time = tournament._play_seeded_game(
+        ais[0], ais[1], game['seed'], {'game': game['game']})
+    return {
+        'record': record.to_dict(),
+        'game_time': game_time,
+        'move_log': tournament.move_log
+    }
+
+
+async def run_worker(host: str = '127.0.0.1',
+                     port: int = 8766,
+                     name: str = None,
+                     heartbeat_interval: float = 2.0) -> int:
+    """
+    Play games for a coordinator until it shuts down or disconnects.
+    
+    Args:
+        host: Coordinator host
+        port: Coordinator port
+        name: Worker name reported to the coordinator (default: host name)
+        heartbeat_interval: Seconds between heartbeats while playing
+    
+    Returns:
+        Number of games played
+    """
+    reader, writer = await asyncio.open_connection(host, port,
+                                                   limit=STREAM_LIMIT)
+    loop = asyncio.get_running_loop()
+    games_played = 0
+    
+    async def send(message: Dict):
+        writer.write((json.dumps(message) + '\n').encode())
+        await writer.drain()
+    
+    try:
+        await send({'cmd': 'hello', 'name': name or socket.gethostname()})
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if message.get('cmd') == 'shutdown':
+                break
+            if message.get('cmd') != 'play':
+                continue
+            
+            job = message['job']
+            # The game runs in a thread so heartbeats keep flowing
+            future = loop.run_in_executor(None, play_game_job, message['game'])
+            while True:
+                done, _ = await asyncio.wait({future},
+                                             timeout=heartbeat_interval)
+                if done:
+                    break
+                await send({'type': 'heartbeat', 'job': job})
+            
+            try:
+                result = future.result()
+            except Exception as e:
+                await send({'type': 'error', 'job': job, 'error': repr(e)})
+                continue
+            await send({'type': 'result', 'job': job, 'result': result})
+            games_played += 1
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+    return games_played
+
+
+class GameCoordinator:
+    """
+    Dispatches games to connected workers and collects their results.
+    
+    The coordinator runs its event loop in a background thread, so
+    play_games can be called from ordinary synchronous code such as
+    Tournament.run_match.
+    """
+    
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 8766,
+                 heartbeat_timeout: float = 10.0,
+                 max_attempts: int = 3,
+                 worker_timeout: float = 60.0):
+        """
+        Initialize coordinator.
+        
+        Args:
+            host: Interface to listen on ('0.0.0.0' for remote workers)
+            port: TCP port (0 picks a free port)
+            heartbeat_timeout: Seconds without a message after which a
+                worker's game is considered lost
+            max_attempts: Number of times a game is dispatched before
+                play_games gives up on it
+            worker_timeout: Seconds play_games waits while no worker is
+                connected before giving up
+        """
+        self.host = host
+        self.port = port
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.worker_timeout = worker_timeout
+        self.workers = {}  # Connected worker names by connection
+        self.lost_games = 0
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._jobs = None
+        self._handlers = set()
+    
+    def start(self):
+        """Start accepting workers."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_server(),
+                                         self._loop).result()
+    
+    def stop(self):
+        """Shut down connected workers and stop the event loop."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop_server(),
+                                         self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+    
+    def __enter__(self) -> 'GameCoordinator':
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+    
+    def play_games(self, games: List[Dict]) -> Iterator[Tuple[int, Dict]]:
+        """
+        Play games on the workers, yielding results as they finish.
+        
+        Args:
+            games: Game descriptions (see play_game_job)
+        
+        Yields:
+            Tuples of (index in games, result dictionary)
+        
+        Raises:
+            RuntimeError: If a game failed max_attempts times, or no worker
+                was connected for worker_timeout seconds
+        """
+        results = queue.Queue()
+        for index, game in enumerate(games):
+            self._loop.call_soon_threadsafe(self._jobs.put_nowait,
+                                            (results, index, game, 1))
+        for _ in range(len(games)):
+            idle_since = None
+            while True:
+                try:
+                    index, result = results.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    pass
+                if self.workers:
+                    idle_since = None
+                elif idle_since is None:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since >= self.worker_timeout:
+                    self._loop.call_soon_threadsafe(self._drop_jobs, results)
+                    raise RuntimeError(f"No worker connected for "
+                                       f"{self.worker_timeout:g} seconds")
+            if isinstance(result, Exception):
+                raise result
+            yield index, result
+    
+    async def _start_server(self):
+        """Create the job queue and listening socket in the loop thread."""
+        self._jobs = asyncio.Queue()
+        self._server = await asyncio.start_server(
+            self._handle_worker, self.host, self.port, limit=STREAM_LIMIT)
+        # Port 0 asks the OS for a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def _stop_server(self):
+        """Close the listening socket and all worker connections."""
+        self._server.close()
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+    
+    def _drop_jobs(self, results: queue.Queue):
+        """Remove the queued games of an abandoned play_games call."""
+        kept = []
+        while not self._jobs.empty():
+            task = self._jobs.get_nowait()
+            if task[0] is not results:
+                kept.append(task)
+        for task in kept:
+            self._jobs.put_nowait(task)
+    
+    def _retry(self, task: Tuple, error: str):
+        """Queue a failed game again, or report it after the last attempt."""
+        results, index, game, attempt = task
+        self.lost_games += 1
+        if attempt >= self.max_attempts:
+            results.put((index, RuntimeError(
+                f"Game {game['game']} failed {attempt} times: {error}")))
+        else:
+            self._jobs.put_nowait((results, index, game, attempt + 1))
+    
+    async def _handle_worker(self,
+                             reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        """Feed games to one worker connection until it fails or stops."""
+        self._handlers.add(asyncio.current_task())
+        task = None
+        try:
+            hello = json.loads(await asyncio.wait_for(
+                reader.readline(), self.heartbeat_timeout))
+            self.workers[writer] = hello.get('name', 'worker')
+            
+            while True:
+                task = await self._jobs.get()
+                results, index, game, _ = task
+                writer.write((json.dumps({'cmd': 'play', 'job': index,
+                                          'game': game}) + '\n').encode())
+                await writer.drain()
+                
+                # Any message proves the worker is alive
+                message = {}
+                while message.get('type') not in ('result', 'error'):
+                    line = await asyncio.wait_for(reader.readline(),
+                                                  self.heartbeat_timeout)
+                    if not line:
+                        raise ConnectionError("Worker disconnected")
+                    message = json.loads(line)
+                
+                if message['type'] == 'error':
+                    self._retry(task, message.get('error', 'worker error'))
+                else:
+                    results.put((index, message['result']))
+                task = None
+        except (asyncio.TimeoutError, ConnectionError, ValueError) as e:
+            if task is not None:
+                self._retry(task, repr(e))
+        except asyncio.CancelledError:
+            try:
+                writer.write(b'{"cmd": "shutdown"}\n')
+            except ConnectionError:
+                pass
+            if task is not None:
+                self._retry(task, "coordinator stopped")
+        finally:
+            self.workers.pop(writer, None)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
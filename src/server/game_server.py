@@ -0,0 +1,407 @@
+"""
+Asyncio game server for concurrent human vs AI sessions.
+
+Clients talk to the server over a local TCP connection using one JSON
+object per line. Every request carries a ``cmd`` field:
+
+- ``new_game``: start a session (``difficulty``, ``human_player``)
+- ``move``: play a human move (``session``, ``move``) and get the AI reply
+- ``state``: get the current session state (``session``)
+- ``close``: end a session (``session``)
+- ``stats``: get latency metrics and CPU budget usage
+
+AI searches run in a shared process pool so the event loop never blocks.
+"""
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from src.ai.difficulties import MillAI, Difficulty
+from src.analysis.metrics import LatencyStats
+from src.game.game_utils import GameUtils
+
+if TYPE_CHECKING:
+    from famnit_gym.envs.mill.mill_model import MillModel
+
+
+# Warm engines of the current worker process, keyed by (difficulty, depth)
+_worker_engines = {}
+
+
+def _search_move(difficulty: str, depth: Optional[int],
+                 model: 'MillModel', player: int) -> tuple:
+    """
+    Compute an AI move inside a pool worker.
+    
+    Args:
+        difficulty: Difficulty value ('easy', 'medium' or 'hard')
+        depth: Search depth override (None for the difficulty default)
+        model: Game state
+        player: Player to move
+    
+    Returns:
+        Tuple of (move, statistics, cpu_seconds)
+    """
+    key = (difficulty, depth)
+    ai = _worker_engines.get(key)
+    if ai is None:
+        ai = MillAI(difficulty=Difficulty(difficulty), custom_depth=depth)
+        _worker_engines[key] = ai
+    
+    start_cpu = time.process_time()
+    move = ai.get_move(model, player)
+    cpu_seconds = time.process_time() - start_cpu
+    
+    if move is not None:
+        move = [int(x) for x in move]
+    return move, ai.get_statistics(), cpu_seconds
+
+
+class GameSession:
+    """
+    State of one human vs AI game.
+    """
+    
+    def __init__(self,
+                 session_id: str,
+                 difficulty: Difficulty,
+                 human_player: int,
+                 repetition_limit: int = 3,
+                 max_moves: int = 300,
+                 model: 'MillModel' = None):
+        """
+        Initialize a game session.
+        
+        Args:
+            session_id: Unique session identifier
+            difficulty: AI difficulty level
+            human_player: Player controlled by the client (1 or 2)
+            repetition_limit: Occurrences of a position that draw the game
+            max_moves: Number of moves after which the game is a draw
+            model: Initial game state (default: a new famnit game)
+        """
+        if model is None:
+            from famnit_gym.envs import mill
+            
+            env = mill.env(render_mode=None)
+            env.reset()
+            model = mill.transition_model(env)
+        
+        self.session_id = session_id
+        self.difficulty = difficulty
+        self.human_player = human_player
+        self.ai_player = 2 if human_player == 1 else 1
+        self.model = model
+        self.current_player = 1
+        self.move_count = 0
+        self.winner = None  # 1, 2, or 0 for draw once the game is over
+        self.cpu_used = 0.0
+        self.repetition_limit = repetition_limit
+        self.max_moves = max_moves
+        self._history = {}
+        self._record_position()
+    
+    def _record_position(self):
+        """Count the current position for repetition detection."""
+        if not self.repetition_limit:
+            return
+        key = GameUtils.position_hash(self.model, self.current_player)
+        self._history[key] = self._history.get(key, 0) + 1
+        if self._history[key] >= self.repetition_limit:
+            self.winner = 0
+    
+    def legal_moves(self) -> List[List[int]]:
+        """
+        Get legal moves for the player to move.
+        
+        Returns:
+            List of moves [src, dst, capture]
+        """
+        if self.winner is not None:
+            return []
+        return [[int(x) for x in move]
+                for move in self.model.legal_moves(self.current_player)]
+    
+    def apply_move(self, move: List[int]):
+        """
+        Play a move for the player to move.
+        
+        Args:
+            move: Move [src, dst, capture]
+        
+        Raises:
+            ValueError: If the move is not legal
+        """
+        if move not in self.legal_moves():
+            raise ValueError(f"Illegal move: {move}")
+        
+        self.model.make_move(self.current_player, move)
+        self.move_count += 1
+        mover = self.current_player
+        self.current_player = 2 if mover == 1 else 1
+        
+        if GameUtils.is_irreversible(move):
+            self._history.clear()
+        
+        if (self.model.game_over()
+                or not self.model.legal_moves(self.current_player)):
+            self.winner = mover
+        elif self.move_count >= self.max_moves:
+            self.winner = 0
+        else:
+            self._record_position()
+    
+    def to_dict(self) -> Dict:
+        """
+        Serialize the session state for a client.
+        
+        Returns:
+            Dictionary with board, turn, legal moves and result
+        """
+        return {
+            'session': self.session_id,
+            'board': [int(x) for x in self.model.get_state()],
+            'current_player': self.current_player,
+            'human_player': self.human_player,
+            'phase': self.model.get_phase(self.current_player),
+            'legal_moves': (self.legal_moves()
+                            if self.current_player == self.human_player
+                            else []),
+            'move_count': self.move_count,
+            'game_over': self.winner is not None,
+            'winner': self.winner
+        }
+
+
+class GameServer:
+    """
+    Asyncio server hosting many concurrent human vs AI sessions.
+    """
+    
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 8765,
+                 max_workers: int = None,
+                 session_cpu_budget: float = 60.0,
+                 global_cpu_budget: float = None,
+                 budget_window: float = 60.0,
+                 fallback_depth: int = 1,
+                 model_factory: Callable[[], 'MillModel'] = None):
+        """
+        Initialize the game server.
+        
+        When a session has used up its CPU budget, or all sessions together
+        have used up the global budget within the current window, the AI
+        keeps playing with a search of fallback_depth only.
+        
+        Args:
+            host: Interface to listen on (local only by default)
+            port: TCP port
+            max_workers: Size of the shared search process pool
+            session_cpu_budget: AI CPU seconds per session (None: unlimited)
+            global_cpu_budget: AI CPU seconds across all sessions per
+                budget window (None: unlimited)
+            budget_window: Length of the global budget window in seconds
+            fallback_depth: Search depth used once a budget is exhausted
+            model_factory: Creates the initial state of new sessions, e.g.
+                MillState (default: a new famnit game); states are sent to
+                the pool workers and must be picklable
+        """
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self.session_cpu_budget = session_cpu_budget
+        self.global_cpu_budget = global_cpu_budget
+        self.budget_window = budget_window
+        self.fallback_depth = fallback_depth
+        self.model_factory = model_factory
+        
+        self.sessions = {}
+        self.latency = {}
+        self.search_latency = LatencyStats()
+        self.moves_served = 0
+        self.budget_fallbacks = 0
+        
+        self._ids = itertools.count(1)
+        self._window_start = time.monotonic()
+        self._window_cpu = 0.0
+        self._executor = None
+        self._server = None
+        self._started = None
+    
+    async def start(self):
+        """Start the process pool and begin accepting connections."""
+        # Spawned workers do not inherit the event loop or open sockets
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'))
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port)
+        self._started = time.monotonic()
+        # Port 0 asks the OS for a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self):
+        """Start the server and run until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.stop()
+    
+    async def stop(self):
+        """Stop accepting connections and shut down the process pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def _handle_client(self,
+                             reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        """Serve newline-delimited JSON requests from one connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                
+                start_time = time.perf_counter()
+                request = None
+                try:
+                    request = json.loads(line)
+                    response = await self._dispatch(request)
+                    cmd = request.get('cmd', 'unknown')
+                except (ValueError, KeyError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                    cmd = 'invalid'
+                except Exception as e:
+                    # Report failures (e.g. a broken worker pool) to the
+                    # client instead of dropping the connection
+                    response = {'ok': False, 'error': repr(e)}
+                    cmd = 'failed'
+                
+                if isinstance(request, dict) and 'id' in request:
+                    response['id'] = request['id']
+                writer.write((json.dumps(response) + '\n').encode())
+                await writer.drain()
+                
+                elapsed = time.perf_counter() - start_time
+                self.latency.setdefault(cmd, LatencyStats()).add(elapsed)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def _dispatch(self, request: Dict) -> Dict:
+        """Execute one request and build its response."""
+        cmd = request['cmd']
+        
+        if cmd == 'new_game':
+            session = GameSession(
+                str(next(self._ids)),
+                Difficulty(request.get('difficulty', 'medium')),
+                int(request.get('human_player', 1)),
+                model=self.model_factory() if self.model_factory else None)
+            self.sessions[session.session_id] = session
+            ai_move = None
+            if session.current_player == session.ai_player:
+                ai_move = await self._play_ai_move(session)
+            return {'ok': True, 'ai_move': ai_move, 'state': session.to_dict()}
+        
+        if cmd == 'stats':
+            return {'ok': True, 'stats': self.get_statistics()}
+        
+        session = self.sessions.get(str(request.get('session')))
+        if session is None:
+            raise KeyError(f"Unknown session: {request.get('session')}")
+        
+        if cmd == 'state':
+            return {'ok': True, 'state': session.to_dict()}
+        
+        if cmd == 'close':
+            del self.sessions[session.session_id]
+            return {'ok': True}
+        
+        if cmd == 'move':
+            if session.winner is not None:
+                raise ValueError("Game is over")
+            if session.current_player != session.human_player:
+                raise ValueError("Not your turn")
+            session.apply_move([int(x) for x in request['move']])
+            ai_move = None
+            if session.winner is None:
+                ai_move = await self._play_ai_move(session)
+            return {'ok': True, 'ai_move': ai_move, 'state': session.to_dict()}
+        
+        raise ValueError(f"Unknown command: {cmd}")
+    
+    def _search_depth(self, session: GameSession) -> Optional[int]:
+        """Pick the search depth allowed by the CPU budgets."""
+        now = time.monotonic()
+        if now - self._window_start >= self.budget_window:
+            self._window_start = now
+            self._window_cpu = 0.0
+        
+        session_exhausted = (self.session_cpu_budget is not None
+                             and session.cpu_used >= self.session_cpu_budget)
+        global_exhausted = (self.global_cpu_budget is not None
+                            and self._window_cpu >= self.global_cpu_budget)
+        
+        if session_exhausted or global_exhausted:
+            self.budget_fallbacks += 1
+            return self.fallback_depth
+        return None
+    
+    async def _play_ai_move(self, session: GameSession) -> List[int]:
+        """Search the AI move in the process pool and apply it."""
+        depth = self._search_depth(session)
+        loop = asyncio.get_running_loop()
+        
+        start_time = time.perf_counter()
+        move, _, cpu_seconds = await loop.run_in_executor(
+            self._executor, _search_move, session.difficulty.value, depth,
+            session.model.clone(), session.current_player)
+        self.search_latency.add(time.perf_counter() - start_time)
+        
+        session.cpu_used += cpu_seconds
+        self._window_cpu += cpu_seconds
+        
+        if move is None:
+            # AI cannot move: the human wins
+            session.winner = session.human_player
+        else:
+            session.apply_move(move)
+            self.moves_served += 1
+        return move
+    
+    def get_statistics(self) -> Dict:
+        """
+        Get server latency metrics and budget usage.
+        
+        Returns:
+            Dictionary with per-command latency percentiles, AI search
+            latency, throughput and CPU budget usage
+        """
+        uptime = time.monotonic() - self._started if self._started else 0.0
+        return {
+            'sessions': len(self.sessions),
+            'uptime': uptime,
+            'ai_moves': self.moves_served,
+            'ai_moves_per_sec': self.moves_served / uptime if uptime else 0.0,
+            'request_latency': {cmd: stats.summary()
+                                for cmd, stats in self.latency.items()},
+            'search_latency': self.search_latency.summary(),
+            'window_cpu': self._window_cpu,
+            'budget_fallbacks': self.budget_fallbacks
+        }
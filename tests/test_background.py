@@ -0,0 +1,80 @@
+"""
+Tests for background AI search.
+"""
+
+import threading
+import time
+
+import pytest
+from src.ai.background import BackgroundSearch, CancellationToken
+from src.ai.difficulties import MillAI, Difficulty
+from src.ai.minimax import MinimaxAI, SearchAborted
+from src.ai.utility import UtilityFunction
+from src.game.mill_state import MillState
+
+
+def test_progress_per_depth():
+    """Test that every completed depth is reported."""
+    ai = MillAI(difficulty=Difficulty.HARD, custom_depth=3)
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0]])
+    progress = []
+    
+    search = BackgroundSearch(ai, on_progress=progress.append)
+    search.start(state, 1)
+    move = search.result(timeout=60)
+    
+    assert search.done
+    assert [p['depth'] for p in progress] == [1, 2, 3]
+    assert move == progress[-1]['best_move']
+    assert ai.minimax_ai.max_depth == 3
+    assert ai.minimax_ai.should_stop is None
+
+
+def test_move_now():
+    """Test that a stopped search still returns a legal move."""
+    ai = MillAI(difficulty=Difficulty.HARD, custom_depth=12)
+    state = MillState()
+    
+    search = BackgroundSearch(ai)
+    search.start(state, 1)
+    search.move_now()
+    move = search.result(timeout=60)
+    
+    assert search.done
+    assert move in state.legal_moves(1)
+
+
+def test_hint_search():
+    """Test that a multi-move search reports the best moves in order."""
+    ai = MillAI(difficulty=Difficulty.MEDIUM, custom_depth=2)
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0]])
+    progress = []
+    
+    search = BackgroundSearch(ai, on_progress=progress.append, num_moves=3)
+    search.start(state, 1)
+    move = search.result(timeout=60)
+    
+    expected = ai.get_hints(state, 1)
+    assert [hint[:2] for hint in search.top_moves] == [hint[:2] for hint in expected]
+    assert move == expected[0][0]
+    assert progress[-1]['top_moves'] == search.top_moves
+
+
+
+
+def test_cancel_lazy_smp_search():
+    """Test that cancelling stops a search running on worker processes."""
+    ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=12,
+                   num_workers=2)
+    token = CancellationToken()
+    ai.should_stop = token.is_cancelled
+    threading.Timer(0.5, token.cancel).start()
+    
+    try:
+        start = time.monotonic()
+        with pytest.raises(SearchAborted):
+            ai.get_best_move(MillState(), 1)
+        
+        assert time.monotonic() - start < 10
+    finally:
+        ai.close()
@@ -0,0 +1,27 @@
+"""
+Tests for batch position analysis.
+"""
+
+import pytest
+from src.analysis.batch import BatchAnalyzer
+from src.ai.difficulties import Difficulty
+
+
+def test_analyze_positions():
+    """Test that every position is analysed once with bounded work."""
+    board = [0] * 24
+    board[0] = board[1] = 1
+    board[9] = board[10] = 2
+    positions = [(board, 1, (7, 7)), (board, 2, (7, 7)), (board, 1, (2, 3))]
+    
+    with BatchAnalyzer(Difficulty.EASY, depth=2, max_workers=1,
+                       max_in_flight=2) as analyzer:
+        results = analyzer.analyze_all(iter(positions))
+    
+    assert len(results) == 3
+    moves = {(r[0][1], r[0][2]): r[1] for r in results}
+    # Player 1 closes the mill 1-2-3
+    assert moves[(1, (7, 7))][:2] == [0, 3]
+    for position, move, score, nodes, seconds in results:
+        assert move is not None
+        assert nodes > 0 and seconds >= 0
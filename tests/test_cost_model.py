@@ -0,0 +1,54 @@
+"""
+Tests for the search cost predictor.
+"""
+
+import pytest
+from src.ai.cost_model import CostModel, position_features
+from src.ai.difficulties import MillAI, Difficulty
+from src.game.game_record import GameRecord
+from src.game.mill_state import MillState
+
+
+def _samples():
+    """Synthetic move log: nodes grow like mobility^depth, 10 us per node."""
+    entries = []
+    for mobility in (4, 8, 12, 16, 20, 24):
+        for depth in (1, 2, 3, 4):
+            nodes = (mobility + 1) ** depth
+            entries.append({'mobility': mobility, 'opponent_mobility': mobility,
+                            'pieces': 5, 'opponent_pieces': 5,
+                            'phase': 'moving', 'depth': depth,
+                            'nodes': nodes, 'seconds': nodes * 1e-5})
+    return entries
+
+
+def test_predicts_training_data():
+    """Test that the fitted model reproduces a clean exponential cost."""
+    model = CostModel().fit(_samples())
+    features = {'mobility': 12, 'opponent_mobility': 12, 'pieces': 5,
+                'opponent_pieces': 5, 'phase': 'moving'}
+    
+    nodes, seconds = model.predict_features(features, 3)
+    assert nodes == pytest.approx(13 ** 3, rel=0.1)
+    assert seconds == pytest.approx(13 ** 3 * 1e-5, rel=0.1)
+    
+    restored = CostModel.from_dict(model.to_dict())
+    assert restored.predict_features(features, 3) == pytest.approx((nodes, seconds))
+
+
+def test_latency_target_limits_depth():
+    """Test that tighter latency targets choose shallower searches."""
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0]])
+    assert position_features(state, 1)['mobility'] == 22
+    
+    model = CostModel().fit(_samples())
+    depths = [MillAI(difficulty=Difficulty.HARD, cost_model=model,
+                     latency_target=target).choose_depth(state, 1)
+              for target in (1e-9, 0.01, 1e9)]
+    assert depths[0] == 1
+    assert depths[0] <= depths[1] <= depths[2] == 6
+    
+    ai = MillAI(difficulty=Difficulty.HARD, cost_model=model)
+    cost = ai.expected_game_cost([GameRecord(moves=[[0, 1, 0], [0, 10, 0]])])
+    assert cost['moves'] == pytest.approx(1.5)
+    assert cost['nodes'] > 0
@@ -21,3 +21,16 @@ def test_difficulty_initialization():
     
     assert ai_easy.random_prob >= ai_medium.random_prob
     assert ai_medium.random_prob >= ai_hard.random_prob
+
+
+def test_seeded_random_moves_repeat():
+    """Test that AIs with the same seed pick the same random moves."""
+    from src.game.mill_state import MillState
+    state = MillState()
+    
+    moves = []
+    for _ in range(2):
+        ai = MillAI(difficulty=Difficulty.EASY, seed=7, node_budget=200)
+        moves.append([ai.get_move(state, 1) for _ in range(10)])
+    
+    assert moves[0] == moves[1]
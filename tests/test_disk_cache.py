@@ -0,0 +1,215 @@
+"""
+Tests for the persistent search cache.
+"""
+
+import pytest
+from src.ai.disk_cache import DiskSearchCache
+from src.ai.minimax import MinimaxAI
+from src.ai.transposition import EXACT, LOWER
+from src.ai.utility import UtilityFunction
+from src.game.game_utils import GameUtils
+from src.game.hand_tracking import HandTrackingModel
+from src.game.mill_state import MillState
+
+
+class HandlessModel:
+    """MillState behind the famnit model interface, without in_hand."""
+    
+    def __init__(self, state):
+        self.state = state
+    
+    def clone(self):
+        return HandlessModel(self.state.clone())
+    
+    def make_move(self, player, move):
+        return self.state.make_move(player, move)
+    
+    def get_state(self):
+        return self.state.get_state()
+    
+    def legal_moves(self, player):
+        return self.state.legal_moves(player)
+    
+    def game_over(self):
+        return self.state.game_over()
+    
+    def count_pieces(self, player):
+        return self.state.count_pieces(player)
+    
+    def get_phase(self, player):
+        return self.state.get_phase(player)
+
+
+def test_entries_persist(tmp_path):
+    """Test that stored results survive closing and reopening the file."""
+    path = str(tmp_path / 'search.cache')
+    with DiskSearchCache(path, num_entries=64) as cache:
+        cache.store(12345, 7, 5, 42.5, EXACT, [0, 3, 0])
+        cache.store(12345, 7, 4, 10.0, LOWER, None)
+    
+    with DiskSearchCache(path, num_entries=1 << 16) as cache:
+        assert cache.num_entries == 64
+        assert cache.probe(12345, 7) == (5, 42.5, EXACT, [0, 3, 0])
+        assert cache.probe(12345, 8) is None
+
+
+def test_rejects_other_files(tmp_path):
+    """Test that a file that is not a cache is not overwritten."""
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'x' * 100)
+    
+    with pytest.raises(ValueError):
+        DiskSearchCache(str(path))
+    assert path.read_bytes() == b'x' * 100
+
+
+def test_clock_keeps_used_entries(tmp_path):
+    """Test that a full bucket evicts entries that were not used."""
+    with DiskSearchCache(str(tmp_path / 'search.cache'),
+                         num_entries=DiskSearchCache.WAYS) as cache:
+        keys = list(range(cache.WAYS))
+        for key in keys:
+            cache.store(key, 0, 5, float(key), EXACT)
+        
+        # Unused entries go first; used ones get a second chance
+        cache.store(100, 0, 5, 0.0, EXACT)
+        survivors = [key for key in keys if cache.probe(key, 0) is not None]
+        assert len(survivors) == cache.WAYS - 1
+        
+        cache.store(101, 0, 5, 0.0, EXACT)
+        assert all(cache.probe(key, 0) is not None for key in survivors)
+        assert cache.probe(100, 0) is None
+        assert cache.evictions == 2
+
+
+def test_symmetric_positions_share_hash():
+    """Test that canonical hashes ignore board symmetries."""
+    state = MillState.from_moves([[0, 1, 0], [0, 5, 0], [0, 10, 0]])
+    
+    assert len(GameUtils.SYMMETRIES) == 16
+    key, _ = GameUtils.canonical_hash(state, 2)
+    for symmetry in GameUtils.SYMMETRIES:
+        board = [0] * 24
+        for pos, owner in enumerate(state.get_state()):
+            board[symmetry[pos + 1] - 1] = owner
+        mirrored = MillState.from_position(board, (7, 8))
+        assert GameUtils.canonical_hash(mirrored, 2)[0] == key
+        assert (sorted(GameUtils.transform_move(move, symmetry)
+                       for move in state.legal_moves(2))
+                == sorted(mirrored.legal_moves(2)))
+
+
+def test_search_reuses_results(tmp_path):
+    """Test that a second run gets the same move with far fewer nodes."""
+    path = str(tmp_path / 'search.cache')
+    state = MillState.from_moves([[0, 1, 0], [0, 4, 0], [0, 2, 0], [0, 3, 0]])
+    results = []
+    for _ in range(2):
+        with DiskSearchCache(path, num_entries=1 << 14, min_depth=2) as cache:
+            ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=4,
+                           disk_cache=cache)
+            move, value = ai.get_best_move(state, 1)
+            results.append((move, value, ai.nodes_evaluated))
+    
+    assert results[1][:2] == results[0][:2]
+    assert results[1][2] < results[0][2] / 10
+
+
+def test_search_modes_do_not_mix(tmp_path):
+    """Test that selective search results are not reused by full-width search."""
+    path = str(tmp_path / 'search.cache')
+    state = MillState.from_moves([[0, 1, 0], [0, 4, 0], [0, 2, 0], [0, 3, 0]])
+    with DiskSearchCache(path, num_entries=1 << 14, min_depth=2) as cache:
+        selective = MinimaxAI(utility_function=UtilityFunction(), max_depth=4,
+                              use_lmr=True, use_futility=True,
+                              disk_cache=cache)
+        selective.get_best_move(state, 1)
+        
+        full_width = MinimaxAI(utility_function=UtilityFunction(),
+                               max_depth=4, disk_cache=cache)
+        hits = cache.hits
+        full_width.get_best_move(state, 1)
+        
+        assert cache.hits == hits
+        assert full_width.disk_cache_cutoffs == 0
+
+
+def test_pieces_in_hand_are_part_of_the_key():
+    """Test that placing positions only share entries with equal hands."""
+    board = [1, 1, 0, 2] + [0] * 20
+    before = MillState.from_position(board, (5, 6))
+    after_captures = MillState.from_position(board, (3, 4))
+    
+    assert (MinimaxAI._disk_position(before, 1)[0]
+            != MinimaxAI._disk_position(after_captures, 1)[0])
+    
+    assert MinimaxAI._disk_position(HandlessModel(before), 1)[0] is None
+    assert GameUtils.pieces_in_hand(before) == (5, 6)
+
+
+def search_twice(model, path):
+    """Search a position with two engines sharing a cache file."""
+    with DiskSearchCache(path, num_entries=1 << 14, min_depth=2) as cache:
+        first = MinimaxAI(utility_function=UtilityFunction(), max_depth=3,
+                          disk_cache=cache)
+        result = first.get_best_move(model, 2)
+        stores = cache.stores
+        second = MinimaxAI(utility_function=UtilityFunction(), max_depth=3,
+                           disk_cache=cache)
+        assert second.get_best_move(model, 2) == result
+        return stores, second.disk_cache_cutoffs
+
+
+def test_hand_tracking_caches_openings(tmp_path):
+    """Test that opening positions of models without hands are cached."""
+    opening = [[0, 1, 0], [0, 10, 0], [0, 2, 0]]
+    tracked = HandTrackingModel(HandlessModel(MillState()))
+    for player, move in zip((1, 2, 1), opening):
+        tracked.make_move(player, move)
+    
+    assert GameUtils.pieces_in_hand(tracked) == (7, 8)
+    assert (GameUtils.pieces_in_hand(HandTrackingModel(HandlessModel(MillState()), 3))
+            == (7, 8))
+    assert search_twice(HandlessModel(MillState.from_moves(opening)),
+                        str(tmp_path / 'plain.cache')) == (0, 0)
+    stores, cutoffs = search_twice(tracked, str(tmp_path / 'tracked.cache'))
+    assert stores > 0
+    assert cutoffs == 1
+
+
+def test_famnit_openings_are_cached(tmp_path):
+    """Test that the examples' famnit positions are stored and then hit."""
+    pytest.importorskip('famnit_gym')
+    from famnit_gym.envs import mill
+    
+    env = mill.env(render_mode=None)
+    env.reset()
+    model = HandTrackingModel(mill.transition_model(env))
+    model.make_move(1, model.legal_moves(1)[0])
+    
+    stores, cutoffs = search_twice(model, str(tmp_path / 'search.cache'))
+    assert stores > 0
+    assert cutoffs == 1
+
+
+
+def test_repetition_draws_are_not_stored(tmp_path):
+    """Test that scores depending on the search path stay out of the cache."""
+    board = [0] * 24
+    for point in (1, 3, 13, 22):
+        board[point - 1] = 1
+    for point in (5, 8, 17, 20):
+        board[point - 1] = 2
+    state = MillState.from_position(board, (0, 0))
+    
+    with DiskSearchCache(str(tmp_path / 'search.cache'), num_entries=1 << 14,
+                         min_depth=1) as cache:
+        ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=4,
+                       disk_cache=cache)
+        ai.get_best_move(state, 1)
+        key, _ = MinimaxAI._disk_position(state, 1)
+        
+        # Four plies of shuffling repeat the root position
+        assert ai.repetition_count > 0
+        assert cache.probe(key, ai._disk_profile_id()) is None
+        assert cache.stores > 0
@@ -0,0 +1,109 @@
+"""
+Tests for distributed tournament games over localhost TCP.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import pytest
+from src.server.distributed import GameCoordinator, run_worker
+from src.analysis.tournament import Tournament
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def _start_worker(port: int, games_played: list) -> threading.Thread:
+    """Run a worker in a thread until the coordinator shuts it down."""
+    def worker():
+        games_played.append(asyncio.run(run_worker(port=port,
+                                                   heartbeat_interval=0.2)))
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_engine_config_round_trip():
+    """Test that an AI rebuilt from its configuration plays the same."""
+    ai = MillAI(difficulty=Difficulty.MEDIUM, custom_depth=2)
+    rebuilt = MillAI.from_config(ai.get_config())
+    
+    assert rebuilt.get_config() == ai.get_config()
+    assert Tournament._ai_config(rebuilt) == Tournament._ai_config(ai)
+
+
+def test_engine_config_keeps_search_switches():
+    """Test that selective search settings survive the round trip."""
+    ai = MillAI(difficulty=Difficulty.MEDIUM, selective_search=True)
+    ai.minimax_ai.lmr_move_index = 5
+    rebuilt = MillAI.from_config(ai.get_config())
+    
+    assert rebuilt.minimax_ai.search_options() == ai.minimax_ai.search_options()
+    assert rebuilt.minimax_ai.use_lmr and rebuilt.minimax_ai.use_pvs
+    assert (Tournament._ai_config(ai)
+            != Tournament._ai_config(MillAI(difficulty=Difficulty.MEDIUM)))
+
+
+def test_lost_games_are_retried():
+    """Test that games of a disconnected worker are played by another."""
+    pytest.importorskip('famnit_gym')
+    
+    with GameCoordinator(port=0, heartbeat_timeout=5.0) as coordinator:
+        def lost_worker():
+            # Takes a game and disconnects without playing it
+            with socket.create_connection(('127.0.0.1', coordinator.port)) as conn:
+                conn.sendall(b'{"cmd": "hello", "name": "lost"}\n')
+                conn.recv(65536)
+        
+        threading.Thread(target=lost_worker, daemon=True).start()
+        time.sleep(0.2)
+        games_played = []
+        worker = _start_worker(coordinator.port, games_played)
+        time.sleep(0.2)
+        
+        tournament = Tournament()
+        results = tournament.run_match(
+            MillAI(difficulty=Difficulty.EASY, custom_depth=1),
+            MillAI(difficulty=Difficulty.EASY, custom_depth=1),
+            num_games=2, verbose=False, coordinator=coordinator)
+        
+        assert results['total_games'] == 2
+        assert coordinator.lost_games == 1
+        assert {entry['game'] for entry in tournament.move_log} == {0, 1}
+    
+    worker.join(10)
+    assert games_played == [2]
+
+
+def test_long_results_are_received():
+    """Test that a result line above asyncio's 64 KiB default arrives."""
+    move_log = [{'game': 0, 'move': 'x' * 200}] * 1000
+    
+    with GameCoordinator(port=0, worker_timeout=5.0) as coordinator:
+        def long_worker():
+            with socket.create_connection(('127.0.0.1', coordinator.port)) as conn:
+                conn.sendall(b'{"cmd": "hello", "name": "long"}\n')
+                conn.makefile().readline()
+                result = {'type': 'result', 'job': 0,
+                          'result': {'move_log': move_log}}
+                conn.sendall((json.dumps(result) + '\n').encode())
+                time.sleep(0.5)
+        
+        threading.Thread(target=long_worker, daemon=True).start()
+        results = list(coordinator.play_games([{'game': 0}]))
+    
+    assert results == [(0, {'move_log': move_log})]
+
+
+def test_play_games_without_workers_times_out():
+    """Test that play_games gives up when no worker ever connects."""
+    with GameCoordinator(port=0, worker_timeout=0.3) as coordinator:
+        start = time.monotonic()
+        with pytest.raises(RuntimeError):
+            list(coordinator.play_games([{'game': 0}, {'game': 1}]))
+        
+        assert time.monotonic() - start < 5.0
+        # The unplayed games are dropped on the coordinator's loop
+        time.sleep(0.1)
+        assert coordinator._jobs.empty()
@@ -0,0 +1,47 @@
+"""
+Tests for Elo estimation and SPRT.
+"""
+
+import json
+import math
+import pytest
+from src.analysis.elo import (ELO_LIMIT, SPRT, elo_estimate, elo_from_score,
+                             score_from_elo)
+
+
+def test_elo_score_conversion():
+    """Test that Elo and expected score convert both ways."""
+    assert elo_from_score(0.5) == 0.0
+    assert score_from_elo(elo_from_score(0.75)) == pytest.approx(0.75)
+    assert elo_from_score(1.0) == math.inf
+
+
+def test_elo_confidence_interval():
+    """Test that the interval contains the estimate and narrows with games."""
+    small = elo_estimate(6, 2, 2)
+    large = elo_estimate(60, 20, 20)
+    
+    assert small['elo'] == pytest.approx(large['elo'])
+    assert small['elo_lower'] < small['elo'] < small['elo_upper']
+    assert (large['elo_upper'] - large['elo_lower']
+            < small['elo_upper'] - small['elo_lower'])
+
+
+def test_sprt_decisions():
+    """Test that clear results stop the test early and mixed ones do not."""
+    sprt = SPRT(elo0=0, elo1=100)
+    
+    assert sprt.status(0, 0, 0) == 'continue'
+    assert sprt.status(3, 1, 2) == 'continue'
+    assert sprt.status(30, 5, 5) == 'H1'
+    assert sprt.status(10, 10, 30) == 'H0'
+
+
+def test_one_sided_results_stay_finite():
+    """Test that a match won or lost every game gets a finite, JSON-safe Elo."""
+    won = elo_estimate(10, 0, 0)
+    lost = elo_estimate(0, 0, 10)
+    
+    assert won['elo'] == won['elo_upper'] == ELO_LIMIT
+    assert lost['elo'] == lost['elo_lower'] == -ELO_LIMIT
+    assert 'Infinity' not in json.dumps([won, lost])
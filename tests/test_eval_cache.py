@@ -0,0 +1,41 @@
+"""
+Tests for the evaluation cache.
+"""
+
+import pytest
+from src.ai.eval_cache import EvalCache
+from src.ai.utility import UtilityFunction
+
+
+def test_hit_and_miss():
+    """Test that stored evaluations are returned and counted."""
+    cache = EvalCache(capacity=100)
+    
+    assert cache.capacity == 128
+    assert cache.get(12345, 7) is None
+    cache.put(12345, 7, 42.5)
+    assert cache.get(12345, 7) == 42.5
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate() == 0.5
+
+
+def test_profiles_do_not_collide():
+    """Test that entries are only shared within one weight profile."""
+    cache = EvalCache(capacity=16)
+    cache.put(99, 1, 10.0)
+    
+    assert cache.get(99, 2) is None
+    assert cache.get(99, 1) == 10.0
+
+
+def test_profile_id_follows_weights():
+    """Test that the profile id depends only on the weights."""
+    utility = UtilityFunction()
+    
+    assert utility.profile_id == UtilityFunction().profile_id
+    assert utility.profile_id != UtilityFunction(mill_weight=40.0).profile_id
+    
+    profile_id = utility.profile_id
+    utility.mill_weight = 40.0
+    assert utility.profile_id != profile_id
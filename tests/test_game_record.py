@@ -0,0 +1,25 @@
+"""
+Tests for game records.
+"""
+
+import pytest
+from src.game.game_record import GameRecord
+
+
+def test_record_round_trip(tmp_path):
+    """Test that a saved record replays the same positions."""
+    record = GameRecord({'player_1': 'easy'})
+    for move in ([0, 1, 0], [0, 10, 0], None, [0, 2, 0]):
+        record.add_move(move)
+    record.winner = 0
+    
+    path = tmp_path / 'game.json'
+    record.save(str(path))
+    loaded = GameRecord.load(str(path))
+    
+    assert loaded.to_dict() == record.to_dict()
+    positions = list(loaded.positions())
+    assert len(positions) == 5
+    board, player, last_move = positions[-1]
+    assert board[0] == 1 and board[9] == 2 and board[1] == 2
+    assert player == 1 and last_move == [0, 2, 0]
@@ -0,0 +1,83 @@
+"""
+Tests for the asyncio game server and its sessions.
+"""
+
+import asyncio
+
+import pytest
+from src.ai.difficulties import Difficulty
+from src.game.mill_state import MillState
+from src.server.client import GameClient
+from src.server.game_server import GameServer, GameSession
+
+
+async def _round_trip(server: GameServer) -> list:
+    """Play one human move against a running server and close the game."""
+    await server.start()
+    client = GameClient(port=server.port)
+    await client.connect()
+    try:
+        started = await client.request('new_game', difficulty='easy',
+                                       human_player=1)
+        session = started['state']['session']
+        move = started['state']['legal_moves'][0]
+        played = await client.request('move', session=session, move=move)
+        state = await client.request('state', session=session)
+        stats = await client.request('stats')
+        await client.request('close', session=session)
+        with pytest.raises(RuntimeError):
+            await client.request('state', session=session)
+        return [started, played, state, stats]
+    finally:
+        await client.close()
+        await server.stop()
+
+
+def test_localhost_round_trip():
+    """Test new_game, move, state, stats and close over a local connection."""
+    server = GameServer(port=0, max_workers=1, model_factory=MillState)
+    started, played, state, stats = asyncio.run(_round_trip(server))
+    
+    assert started['ai_move'] is None
+    assert started['state']['current_player'] == 1
+    assert played['ai_move'] is not None
+    assert played['state']['move_count'] == 2
+    assert state['state'] == played['state']
+    assert stats['stats']['ai_moves'] == 1
+    assert stats['stats']['budget_fallbacks'] == 0
+    assert server.sessions == {}
+
+
+def test_cpu_budget_falls_back_to_shallow_search():
+    """Test that an exhausted CPU budget switches to fallback_depth."""
+    server = GameServer(port=0, max_workers=1, session_cpu_budget=0.0,
+                        fallback_depth=1, model_factory=MillState)
+    _, played, _, stats = asyncio.run(_round_trip(server))
+    
+    assert played['ai_move'] is not None
+    assert stats['stats']['budget_fallbacks'] == 1
+    
+    server = GameServer(session_cpu_budget=10.0, fallback_depth=2)
+    session = GameSession('1', Difficulty.HARD, 1, model=MillState())
+    assert server._search_depth(session) is None
+    session.cpu_used = 10.0
+    assert server._search_depth(session) == 2
+
+
+def test_session_rejects_illegal_moves():
+    """Test that apply_move refuses illegal moves and keeps the position."""
+    session = GameSession('1', Difficulty.EASY, 1, model=MillState())
+    board = session.to_dict()['board']
+    move = session.legal_moves()[0]
+    illegal = [move[1], move[1], 0]
+    
+    assert illegal not in session.legal_moves()
+    with pytest.raises(ValueError):
+        session.apply_move(illegal)
+    session.apply_move(move)
+    with pytest.raises(ValueError):
+        session.apply_move(move)
+    
+    assert session.move_count == 1
+    assert session.current_player == 2
+    assert session.to_dict()['board'] != board
@@ -0,0 +1,38 @@
+"""
+Tests for game utilities.
+"""
+
+import pytest
+from src.game.game_utils import GameUtils
+
+
+def test_board_hash_side_to_move():
+    """Test that the side to move is part of the position hash."""
+    board = [0] * 24
+    board[0] = 1
+    board[5] = 2
+    
+    assert GameUtils.board_hash(board, 1) == GameUtils.board_hash(list(board), 1)
+    assert GameUtils.board_hash(board, 1) != GameUtils.board_hash(board, 2)
+    assert GameUtils.board_hash(board, 1) != GameUtils.board_hash([0] * 24, 1)
+
+
+def test_irreversible_moves():
+    """Test that placements and captures are irreversible."""
+    assert GameUtils.is_irreversible([0, 5, 0])
+    assert GameUtils.is_irreversible([4, 5, 12])
+    assert not GameUtils.is_irreversible([4, 5, 0])
+
+
+def test_position_hash_pieces_in_hand():
+    """Test that placing positions with different hands hash differently."""
+    from src.game.mill_state import MillState
+    
+    board = [1, 1, 0, 2, 0, 2] + [0] * 18
+    seven = MillState.from_position(board, (7, 7))
+    six = MillState.from_position(board, (6, 6))
+    
+    assert GameUtils.position_hash(seven, 1) != GameUtils.position_hash(six, 1)
+    assert GameUtils.canonical_hash(seven, 1)[0] != GameUtils.canonical_hash(six, 1)[0]
+    assert (GameUtils.position_hash(seven, 1)
+            == GameUtils.position_hash(seven.clone(), 1))
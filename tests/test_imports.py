@@ -0,0 +1,65 @@
+"""
+Tests for import-time dependencies.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Packages only the game environment, plotting and video adapters use;
+# they are blocked while importing, so any module-level import of them fails
+ADAPTER_PACKAGES = ['famnit_gym', 'gymnasium', 'pettingzoo', 'matplotlib',
+                    'imageio_ffmpeg']
+
+# Game state, move generation, evaluation and search
+CORE_MODULES = ['src.game', 'src.game.mill_state', 'src.game.game_record',
+                'src.game.hand_tracking', 'src.ai', 'src.ai.minimax',
+                'src.ai.utility', 'src.ai.difficulties', 'src.ai.lazy_smp',
+                'src.ai.background', 'src.ai.disk_cache', 'src.ai.search_trace']
+
+# Everything except the video renderer (src.analysis.replay)
+ALL_MODULES = CORE_MODULES + [
+    'src.game.vector_env', 'src.ai.cost_model', 'src.ai.vector_search',
+    'src.analysis', 'src.analysis.tournament', 'src.analysis.statistics',
+    'src.analysis.scheduler', 'src.analysis.batch', 'src.analysis.perft',
+    'src.analysis.elo', 'src.analysis.metrics', 'src.analysis.memory',
+    'src.analysis.results_db', 'src.analysis.vector_match', 'src.server'
+]
+
+IMPORT_SCRIPT = """
+import importlib, json, sys
+for name in {adapters!r}:
+    sys.modules[name] = None
+before = set(sys.modules)
+for module in {modules!r}:
+    importlib.import_module(module)
+loaded = sorted({{name.split('.')[0] for name in set(sys.modules) - before}})
+print(json.dumps({{'loaded': loaded}}))
+"""
+
+
+def import_fresh(modules):
+    """Import modules in a new interpreter and report the new packages."""
+    script = IMPORT_SCRIPT.format(adapters=ADAPTER_PACKAGES, modules=modules)
+    result = subprocess.run([sys.executable, '-c', script], cwd=str(PROJECT_ROOT),
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def test_core_needs_no_numpy_or_adapters():
+    """Test that the engine core imports with the standard library alone."""
+    report = import_fresh(CORE_MODULES)
+    
+    assert 'numpy' not in report['loaded']
+
+
+def test_tools_import_without_adapters():
+    """Test that analysis and server tools load adapters only when used."""
+    # Adapter packages are blocked, so importing one fails import_fresh
+    report = import_fresh(ALL_MODULES)
+    
+    assert 'src' in report['loaded']
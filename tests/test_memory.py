@@ -0,0 +1,41 @@
+"""
+Tests for memory profiling.
+"""
+
+import tracemalloc
+
+from src.ai.minimax import MinimaxAI
+from src.ai.utility import UtilityFunction
+from src.analysis.memory import MemoryProfiler
+from src.game.mill_state import MillState
+
+
+def test_move_peak_per_node():
+    """Test that a search reports its peak memory and bytes per node."""
+    ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=2)
+    
+    with MemoryProfiler() as profiler:
+        profiler.start_move()
+        ai.get_best_move(MillState(), 1)
+        stats = profiler.finish_move(ai.nodes_evaluated)
+    
+    assert stats['peak_bytes'] > 0
+    assert stats['bytes_per_node'] == stats['peak_bytes'] / ai.nodes_evaluated
+    assert not tracemalloc.is_tracing()
+
+
+def test_game_retained_objects():
+    """Test that objects kept past a game are reported with their site."""
+    kept = []
+    
+    with MemoryProfiler() as profiler:
+        profiler.start_game()
+        kept.extend([position] for position in range(500))
+        entry = profiler.finish_game({'game': 3})
+    
+    assert entry['game'] == 3
+    assert entry['object_growth']['list'] >= 500
+    assert entry['retained_objects'] >= 490
+    assert entry['top_sites'][0]['site'].startswith(__file__)
+    assert profiler.summary()['games'] == 1
+    assert profiler.summary()['objects_per_game'] == entry['retained_objects']
@@ -0,0 +1,67 @@
+"""
+Tests for latency metrics.
+"""
+
+import pytest
+from src.analysis.metrics import (percentile, LatencyStats, summarize_memory,
+                                  summarize_moves)
+
+
+def test_percentile_interpolation():
+    """Test percentile computation."""
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+    
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 100) == 5.0
+    assert percentile(values, 25) == 2.0
+    assert percentile([], 95) == 0.0
+
+
+def test_latency_summary():
+    """Test latency summary keys and values."""
+    stats = LatencyStats()
+    for ms in range(1, 101):
+        stats.add(ms / 1000.0)
+    
+    summary = stats.summary()
+    
+    assert summary['count'] == 100
+    assert summary['max'] == 0.1
+    assert summary['p50'] <= summary['p95'] <= summary['p99'] <= summary['max']
+
+
+def test_summarize_moves_by_phase():
+    """Test grouped move summaries with throughput."""
+    entries = [
+        {'phase': 'placing', 'seconds': 0.5, 'nodes': 100},
+        {'phase': 'placing', 'seconds': 1.5, 'nodes': 300},
+        {'phase': 'moving', 'seconds': 2.0, 'nodes': 100}
+    ]
+    
+    summaries = summarize_moves(entries, group_by=('phase',))
+    
+    assert list(summaries) == ['moving', 'placing']
+    assert summaries['placing']['count'] == 2
+    assert summaries['placing']['nodes_per_sec'] == 200.0
+    assert summarize_moves(entries)['all']['max'] == 2.0
+
+
+def test_summarize_memory_skips_unprofiled_moves():
+    """Test memory summaries of profiled moves only."""
+    entries = [
+        {'phase': 'placing', 'peak_bytes': 1000, 'bytes_per_node': 10.0,
+         'retained_bytes': 100},
+        {'phase': 'placing', 'peak_bytes': 3000, 'bytes_per_node': 30.0,
+         'retained_bytes': -50},
+        {'phase': 'moving', 'seconds': 0.1, 'nodes': 10}
+    ]
+    
+    summary = summarize_memory(entries, ('phase',))
+    
+    assert list(summary) == ['placing']
+    assert summary['placing']['count'] == 2
+    assert summary['placing']['peak_p50'] == 2000
+    assert summary['placing']['peak_max'] == 3000
+    assert summary['placing']['bytes_per_node'] == pytest.approx(20.0)
+    assert summary['placing']['retained_bytes'] == 50
@@ -0,0 +1,42 @@
+"""
+Tests for the pure-Python Mill state.
+"""
+
+import pytest
+from src.game.mill_state import MillState, ADJACENT
+
+
+def test_initial_moves():
+    """Test that every point can be taken with the first placement."""
+    state = MillState()
+    
+    assert state.get_phase(1) == 'placing'
+    assert len(state.legal_moves(1)) == 24
+    assert all(len(ADJACENT[pos]) in (2, 3, 4) for pos in range(1, 25))
+
+
+def test_mill_captures_free_pieces_first():
+    """Test that pieces in a mill are protected while others are free."""
+    # Player 2 holds the mill 22-23-24 and a free piece on 10
+    state = MillState.from_moves([[0, 1, 0], [0, 22, 0], [0, 2, 0],
+                                  [0, 23, 0], [0, 12, 0], [0, 24, 0],
+                                  [0, 14, 0], [0, 10, 0]])
+    
+    captures = [move for move in state.legal_moves(1) if move[1] == 3]
+    assert captures == [[0, 3, 10]]
+    
+    state.make_move(1, captures[0])
+    assert state.count_pieces(2) == 3
+    assert state.in_hand[1] == 4
+
+
+def test_from_position():
+    """Test creating a state from a board and pieces in hand."""
+    board = [0] * 24
+    board[0] = 1
+    state = MillState.from_position(board, (3, 4))
+    
+    assert state.get_phase(1) == 'placing'
+    assert state.in_hand == [0, 3, 4]
+    with pytest.raises(ValueError):
+        MillState.from_position([0] * 23)
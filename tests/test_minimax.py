@@ -5,6 +5,7 @@ Tests for minimax algorithm.
 import pytest
 from src.ai.minimax import MinimaxAI
 from src.ai.utility import UtilityFunction
+from src.game.mill_state import MillState
 
 
 def test_minimax_initialization():
@@ -27,3 +28,180 @@ def test_minimax_statistics():
     assert 'nodes_evaluated' in stats
     assert 'pruning_count' in stats
     assert 'pruning_ratio' in stats
+    assert stats['repetitions_detected'] == 0
+
+
+def test_selective_search_switches():
+    """Test that selective search features are off by default."""
+    utility = UtilityFunction()
+    ai = MinimaxAI(utility_function=utility, max_depth=2)
+    selective = MinimaxAI(utility_function=utility, max_depth=2,
+                          use_lmr=True, use_futility=True, use_pvs=True)
+    
+    assert not (ai.use_lmr or ai.use_futility or ai.use_pvs)
+    assert selective.search_options()['use_lmr'] == True
+    for key in ('lmr_reductions', 'lmr_researches',
+                'futility_prunes', 'pvs_researches'):
+        assert selective.get_statistics()[key] == 0
+
+
+SELECTIVE_MOVES = [[0, 1, 0], [0, 10, 0], [0, 2, 0],
+                   [0, 11, 0], [0, 5, 0], [0, 14, 0]]
+
+
+def test_pvs_keeps_result():
+    """Test that principal variation search matches plain alpha-beta."""
+    utility = UtilityFunction()
+    state = MillState.from_moves(SELECTIVE_MOVES)
+    plain = MinimaxAI(utility_function=utility, max_depth=4)
+    pvs = MinimaxAI(utility_function=utility, max_depth=4, use_pvs=True)
+    
+    assert pvs.get_best_move(state, 1) == plain.get_best_move(state, 1)
+
+
+def test_lmr_and_futility_prune():
+    """Test that late move reductions and futility pruning take effect."""
+    utility = UtilityFunction()
+    state = MillState.from_moves(SELECTIVE_MOVES)
+    lmr = MinimaxAI(utility_function=utility, max_depth=4, use_lmr=True)
+    futility = MinimaxAI(utility_function=utility, max_depth=4,
+                         use_futility=True)
+    
+    lmr.get_best_move(state, 1)
+    futility.get_best_move(state, 1)
+    
+    assert lmr.get_statistics()['lmr_reductions'] > 0
+    assert futility.get_statistics()['futility_prunes'] > 0
+
+
+@pytest.mark.parametrize('min_depth, move_index', [(2, 1), (2, 3), (3, 1), (4, 2)])
+def test_lmr_settings_terminate(min_depth, move_index):
+    """Test that searches finish with any valid reduction settings."""
+    utility = UtilityFunction()
+    state = MillState.from_moves(SELECTIVE_MOVES)
+    ai = MinimaxAI(utility_function=utility, max_depth=4, use_lmr=True,
+                   lmr_min_depth=min_depth, lmr_move_index=move_index)
+    
+    move, _ = ai.get_best_move(state, 1)
+    
+    assert move in [list(legal) for legal in state.legal_moves(1)]
+
+
+def test_lmr_min_depth_validated():
+    """Test that reductions past the leaves are rejected."""
+    with pytest.raises(ValueError):
+        MinimaxAI(utility_function=UtilityFunction(), use_lmr=True,
+                  lmr_min_depth=1)
+
+
+def test_split_captures_keeps_score():
+    """Test that searching capture choice as a stage gives the same result."""
+    utility = UtilityFunction()
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0], [0, 2, 0],
+                                  [0, 11, 0], [0, 5, 0], [0, 14, 0]])
+    
+    plain = MinimaxAI(utility_function=utility, max_depth=3)
+    split = MinimaxAI(utility_function=utility, max_depth=3,
+                      split_captures=True)
+    
+    assert plain.get_best_move(state, 1)[1] == split.get_best_move(state, 1)[1]
+    assert split.search_options()['split_captures'] == True
+
+
+def test_flying_search_keeps_blocking_moves():
+    """Test that flying search prunes flights that do nothing."""
+    state = MillState(pieces_per_player=0)
+    for pos in (1, 5, 20):
+        state.board[pos - 1] = 1
+    for pos in (10, 11, 16, 17, 23):
+        state.board[pos - 1] = 2
+    ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=3,
+                   use_flying_search=True)
+    
+    legal_moves = state.legal_moves(1)
+    moves = ai._flying_moves(state, legal_moves, 1)
+    
+    assert state.get_phase(1) == 'flying'
+    assert [1, 12, 0] in moves and [5, 2, 0] in moves
+    assert len(moves) < len(legal_moves)
+    assert ai.flying_prunes == len(legal_moves) - len(moves)
+    assert ai._search_depth(state) == 2
+
+
+def test_top_moves_match_best_move():
+    """Test that Multi-PV returns exact scores, best first."""
+    utility = UtilityFunction()
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0], [0, 2, 0],
+                                  [0, 11, 0], [0, 5, 0], [0, 14, 0]])
+    ai = MinimaxAI(utility_function=utility, max_depth=3)
+    
+    best_move, best_score = ai.get_best_move(state, 1)
+    top_moves = ai.get_top_moves(state, 1, num_moves=3)
+    
+    assert len(top_moves) == 3
+    assert top_moves[0][1] == best_score
+    assert [score for _, score, _ in top_moves] == sorted(
+        [score for _, score, _ in top_moves], reverse=True)
+    for move, score, variation in top_moves:
+        assert variation[0] == move
+        child = state.clone()
+        child.make_move(1, move)
+        exact = MinimaxAI(utility_function=utility, max_depth=2)
+        assert exact._minimax_ab(child, 2, -1e9, 1e9, False, 2) == score
+    assert ai.transposition_table is None
+
+
+def test_node_budget_is_exact_and_reproducible():
+    """Test that a node budget stops the search at exactly that many nodes."""
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0], [0, 2, 0], [0, 3, 0]])
+    
+    results = []
+    for _ in range(2):
+        ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=6,
+                       eval_cache_size=1024, node_budget=2000)
+        move, value = ai.get_best_move(state, 1)
+        results.append((move, value, ai.nodes_evaluated, ai.completed_depth))
+    
+    assert results[0] == results[1]
+    assert results[0][2] == 2000
+    assert 1 <= results[0][3] < 6
+    assert results[0][0] in state.legal_moves(1)
+
+
+class TreeModel:
+    """Game tree model: inner nodes are lists of children, leaves are scores."""
+    
+    def __init__(self, node):
+        self.node = node
+    
+    def legal_moves(self, player):
+        if not isinstance(self.node, list):
+            return []
+        return [[0, index + 1, 0] for index in range(len(self.node))]
+    
+    def make_move(self, player, move):
+        self.node = self.node[move[1] - 1]
+    
+    def clone(self):
+        return TreeModel(self.node)
+    
+    def game_over(self):
+        return False
+
+
+class LeafUtility:
+    """Utility that scores a tree leaf by its value."""
+    
+    def evaluate(self, model, player, context=None):
+        return model.node
+
+
+@pytest.mark.parametrize('use_alpha_beta', [False, True])
+def test_root_children_search_opponent_side(use_alpha_beta):
+    """Test that the opponent picks its own best reply below the root."""
+    tree = [[10, -10], [1, 2]]
+    ai = MinimaxAI(utility_function=LeafUtility(), max_depth=2,
+                   use_alpha_beta=use_alpha_beta, detect_repetitions=False)
+    
+    assert ai.get_best_move(TreeModel(tree), 1) == ([0, 2, 0], 1)
+    assert ai.get_best_move(TreeModel(tree), 2) == ([0, 2, 0], 2)
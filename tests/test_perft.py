@@ -0,0 +1,43 @@
+"""
+Tests for the perft harness.
+"""
+
+import pytest
+from src.analysis.perft import perft, divide, find_divergence
+from src.game.mill_state import MillState
+
+
+class _NoCaptureState(MillState):
+    """Move generator that forgets capture choices."""
+    
+    def clone(self):
+        state = _NoCaptureState()
+        state.board = self.board[:]
+        state.in_hand = self.in_hand[:]
+        return state
+    
+    def legal_moves(self, player):
+        return [[src, dst, 0] for src, dst, capture
+                in super().legal_moves(player) if capture <= 1]
+
+
+def test_perft_opening():
+    """Test leaf counts of the first plies."""
+    state = MillState()
+    
+    assert perft(state, 1, 1) == 24
+    assert perft(state, 1, 2) == 24 * 23
+    assert sum(divide(state, 1, 3).values()) == perft(state, 1, 3)
+
+
+def test_find_divergence():
+    """Test that a faulty move generator is caught with its move path."""
+    moves = [[0, 1, 0], [0, 10, 0], [0, 2, 0], [0, 11, 0]]
+    reference = MillState.from_moves(moves)
+    candidate = _NoCaptureState.from_moves(moves)
+    
+    assert find_divergence(reference, MillState.from_moves(moves), 1, 2) is None
+    
+    divergence = find_divergence(reference, candidate, 1, 2)
+    assert divergence['path'] == []
+    assert [0, 3, 10] in [list(m) for m in divergence['missing']]
@@ -0,0 +1,69 @@
+"""
+Tests for the offscreen game video renderer.
+"""
+
+import sys
+import types
+
+from src.analysis.replay import (PLAYER_COLORS, POINT_COORDS, BoardRenderer,
+                                 render_record)
+from src.game.game_record import GameRecord
+
+
+class FrameCollector:
+    """Stands in for the imageio-ffmpeg writer and keeps the frames."""
+    
+    def __init__(self, output_file, size, **options):
+        self.output_file = output_file
+        self.size = size
+        self.frames = []
+        self.closed = False
+    
+    def send(self, frame):
+        if frame is not None:
+            self.frames.append(frame)
+    
+    def close(self):
+        self.closed = True
+
+
+def _pixel(renderer: BoardRenderer, frame, point: int) -> tuple:
+    """Get the frame color at the center of a board point."""
+    x, y = renderer._pieces.axes.transData.transform(POINT_COORDS[point - 1])
+    return tuple(int(c) for c in frame[renderer.size - 1 - int(round(y)),
+                                       int(round(x))])
+
+
+def _rgb(color: str) -> tuple:
+    """Convert a '#rrggbb' color to an RGB tuple."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def test_render_record_frames(monkeypatch):
+    """Test the frame count and the board drawn after a known move."""
+    writers = []
+    
+    def write_frames(output_file, size, **options):
+        writers.append(FrameCollector(output_file, size, **options))
+        return writers[-1]
+    
+    monkeypatch.setitem(sys.modules, 'imageio_ffmpeg',
+                        types.SimpleNamespace(write_frames=write_frames))
+    record = GameRecord(moves=[[0, 1, 0], [0, 10, 0], [0, 2, 0]], winner=0)
+    
+    assert render_record(record, 'game.mp4', frames_per_move=2,
+                         size=160) == 'game.mp4'
+    writer, = writers
+    assert writer.closed
+    assert writer.size == (160, 160)
+    assert len(writer.frames) == 2 * (len(record.moves) + 1)
+    
+    # Position after the second move: 1 is white, 10 black, 2 still empty
+    frame = writer.frames[2 * 2]
+    assert frame.shape == (160, 160, 3)
+    renderer = BoardRenderer(160)
+    renderer.render([0] * 24)
+    assert _pixel(renderer, frame, 1) == _rgb(PLAYER_COLORS[1])
+    assert _pixel(renderer, frame, 10) == _rgb(PLAYER_COLORS[2])
+    assert _pixel(renderer, frame, 2) == _rgb(PLAYER_COLORS[0])
+    assert (writer.frames[2 * 2 + 1] == frame).all()
@@ -0,0 +1,58 @@
+"""
+Tests for the tournament results database.
+"""
+
+import pytest
+from src.analysis.results_db import ResultsDatabase
+from src.analysis.tournament import Tournament
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def _add(db, game_index, winner, config=None):
+    """Store a short game of the easy_vs_medium match."""
+    return db.add_game('easy_vs_medium', game_index, 'easy', 'medium',
+                       config or {}, 42, winner, 1.5, [[0, 1, 0], None],
+                       [{'game': game_index, 'ply': 0, 'player': 1,
+                         'difficulty': 'easy', 'phase': 'placing',
+                         'seconds': 0.01, 'nodes': 10}])
+
+
+def test_games_round_trip_and_aggregate():
+    """Test that stored games decode and aggregate per match."""
+    with ResultsDatabase(':memory:') as db:
+        assert _add(db, 0, 1)
+        assert _add(db, 1, 0)
+        assert _add(db, 2, 2)
+        assert not _add(db, 2, 1)  # Same game again is ignored
+        
+        games = db.games('easy_vs_medium')
+        assert [game['game_index'] for game in games] == [0, 1, 2]
+        assert games[0]['moves'] == [[0, 1, 0], None]
+        assert games[0]['seed'] == 42
+        
+        results = db.match_results()['easy_vs_medium']
+        assert (results['ai1_wins'], results['draws'], results['ai2_wins'],
+                results['total_games']) == (1, 1, 1, 3)
+
+
+def test_resume_skips_stored_games(tmp_path):
+    """Test that a resumed match counts stored games without replaying them."""
+    ai1 = MillAI(difficulty=Difficulty.EASY)
+    ai2 = MillAI(difficulty=Difficulty.MEDIUM)
+    config = {'player_1': Tournament._ai_config(ai1),
+              'player_2': Tournament._ai_config(ai2)}
+    
+    with ResultsDatabase(str(tmp_path / 'results.db')) as db:
+        _add(db, 0, 1, config)
+        _add(db, 1, 2, config)
+        
+        tournament = Tournament(database=db)
+        results = tournament.run_match(ai1, ai2, num_games=2, verbose=False,
+                                       resume=True)
+        assert (results['ai1_wins'], results['ai2_wins']) == (1, 1)
+        assert len(tournament.move_log) == 2
+        
+        with pytest.raises(ValueError):
+            tournament.run_match(MillAI(difficulty=Difficulty.HARD), ai2,
+                                 num_games=2, verbose=False,
+                                 match_key='easy_vs_medium', resume=True)
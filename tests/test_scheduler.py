@@ -0,0 +1,38 @@
+"""
+Tests for the parallel tournament scheduler.
+"""
+
+from src.analysis.results_db import ResultsDatabase
+from src.analysis.scheduler import TournamentScheduler
+from src.analysis.tournament import Tournament
+from src.ai.difficulties import MillAI, Difficulty
+
+
+def test_expected_costs_order_pairings():
+    """Test that deeper pairings are expected to take longer."""
+    scheduler = TournamentScheduler(Tournament(), max_workers=2)
+    costs = scheduler.expected_costs([(Difficulty.EASY, Difficulty.MEDIUM),
+                                      (Difficulty.MEDIUM, Difficulty.HARD)])
+    
+    assert (costs[(Difficulty.MEDIUM, Difficulty.HARD)]
+            > 5 * costs[(Difficulty.EASY, Difficulty.MEDIUM)])
+
+
+def test_resumed_tournament_collects_stored_games():
+    """Test that stored games are collected without scheduling them."""
+    config = {'player_1': Tournament._ai_config(MillAI(difficulty=Difficulty.EASY)),
+              'player_2': Tournament._ai_config(MillAI(difficulty=Difficulty.HARD))}
+    
+    with ResultsDatabase(':memory:') as db:
+        for game_index, winner in enumerate([2, 2, 0]):
+            db.add_game('easy_vs_hard', game_index, 'easy', 'hard', config,
+                        game_index, winner, 2.0, [], [])
+        
+        tournament = Tournament(database=db)
+        results = TournamentScheduler(tournament, max_workers=2).run(
+            [Difficulty.EASY, Difficulty.HARD], games_per_match=3,
+            resume=True, verbose=False)
+        
+        match = results['easy_vs_hard']
+        assert (match['ai1_wins'], match['ai2_wins'], match['draws']) == (0, 2, 1)
+        assert tournament.match_history == [match]
@@ -0,0 +1,70 @@
+"""
+Tests for search traces.
+"""
+
+import pytest
+from src.ai.minimax import MinimaxAI
+from src.ai.search_trace import (FLAG_CUTOFF, FLAG_LEAF, SearchTracer,
+                                 read_trace, summarize_trace)
+from src.ai.utility import UtilityFunction
+from src.game.mill_state import MillState
+
+
+MOVES = [[0, 1, 0], [0, 4, 0], [0, 2, 0], [0, 3, 0]]
+
+
+def trace_search(path, **tracer_options):
+    """Search a placing position with a tracer and return the trace."""
+    state = MillState.from_moves(MOVES)
+    with SearchTracer(str(path), **tracer_options) as tracer:
+        ai = MinimaxAI(utility_function=UtilityFunction(), max_depth=3,
+                       tracer=tracer)
+        move = ai.get_best_move(state, 1)
+    return move, list(read_trace(str(path)))
+
+
+def test_trace_records_nodes(tmp_path):
+    """Test that a full trace holds the searched tree."""
+    move, records = trace_search(tmp_path / 'full.trace')
+    untraced = MinimaxAI(utility_function=UtilityFunction(), max_depth=3)
+    
+    assert move == untraced.get_best_move(MillState.from_moves(MOVES), 1)
+    assert {record.ply for record in records} == {1, 2, 3}
+    leaves = [record for record in records if record.flags & FLAG_LEAF]
+    assert leaves and all(record.depth == 0 for record in leaves)
+    cutoffs = [record for record in records if record.flags & FLAG_CUTOFF]
+    assert cutoffs
+    assert all(0 <= record.cutoff_index < record.moves for record in cutoffs)
+
+
+def test_summary_per_phase(tmp_path):
+    """Test branching and cutoff histograms of a trace."""
+    _, records = trace_search(tmp_path / 'full.trace')
+    summary = summarize_trace(records)
+    
+    placing = summary['placing']
+    assert placing['leaves'] > 0
+    assert sum(placing['branching'].values()) == placing['nodes']
+    assert placing['mean_branching'] > 1
+    assert 0 < placing['cutoff_rate'] <= 1
+    assert 0 <= placing['first_move_cutoffs'] <= 1
+
+
+def test_sampling_and_ply_limit(tmp_path):
+    """Test that sampling and the ply limit reduce the trace."""
+    _, full = trace_search(tmp_path / 'full.trace')
+    _, sampled = trace_search(tmp_path / 'sampled.trace', sample_rate=0.25)
+    _, shallow = trace_search(tmp_path / 'shallow.trace', max_ply=1)
+    
+    assert 0 < len(sampled) < len(full)
+    assert {record.key for record in sampled} < {record.key for record in full}
+    assert shallow and all(record.ply == 1 for record in shallow)
+
+
+def test_rejects_other_files(tmp_path):
+    """Test that files without a trace header are rejected."""
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a trace')
+    
+    with pytest.raises(ValueError):
+        list(read_trace(str(path)))
@@ -0,0 +1,60 @@
+"""
+Tests for the shared transposition table and Lazy SMP search.
+"""
+
+import pytest
+from src.ai.minimax import MinimaxAI
+from src.ai.transposition import SharedTranspositionTable, EXACT, LOWER
+from src.ai.utility import UtilityFunction
+from src.game.mill_state import MillState
+
+
+def test_store_and_probe():
+    """Test that stored entries are found and verified by key."""
+    table = SharedTranspositionTable(num_entries=1000)
+    try:
+        key = 0x123456789ABCDEF0
+        table.store(key, 4, -12.5, LOWER, [3, 5, 17])
+        
+        assert table.num_entries == 1024
+        assert table.probe(key) == (4, -12.5, LOWER, [3, 5, 17])
+        # Same slot, different key: the XOR check rejects the entry
+        assert table.probe(key ^ (1 << 40)) is None
+    finally:
+        table.close()
+
+
+def test_deeper_entries_are_kept():
+    """Test depth-preferred replacement and sharing by name."""
+    table = SharedTranspositionTable(num_entries=64)
+    other = SharedTranspositionTable(num_entries=64, name=table.name)
+    try:
+        key = 42
+        table.store(key, 5, 10.0, EXACT, None)
+        table.store(key, 2, 99.0, EXACT, [0, 1, 0])
+        
+        assert other.probe(key) == (5, 10.0, EXACT, None)
+    finally:
+        other.close()
+        table.close()
+
+
+def test_lazy_smp_matches_single_process():
+    """Test that two workers find a legal move with the single-process score."""
+    state = MillState.from_moves([[0, 1, 0], [0, 10, 0], [0, 2, 0],
+                                  [0, 11, 0], [0, 5, 0]])
+    smp = MinimaxAI(utility_function=UtilityFunction(), max_depth=3,
+                    num_workers=2)
+    try:
+        move, score = smp.get_best_move(state, 2)
+        depth = smp.completed_depth
+    finally:
+        smp.close()
+    
+    # The helper searches one ply deeper and may finish first
+    single = MinimaxAI(utility_function=UtilityFunction(), max_depth=depth)
+    
+    assert depth in (3, 4)
+    assert move in state.legal_moves(2)
+    assert score == pytest.approx(single.get_best_move(state, 2)[1])
+
@@ -19,3 +19,27 @@ def test_utility_initialization():
     assert utility.mobility_weight == 2.0
 
 
+def test_evaluation_reuses_node_context():
+    """Test that evaluation reads move lists from the search node context."""
+    from src.ai.node_context import NodeContext
+    from src.game.mill_state import MillState
+    
+    class CountingState(MillState):
+        move_generations = 0
+        
+        def legal_moves(self, player):
+            CountingState.move_generations += 1
+            return super().legal_moves(player)
+    
+    state = CountingState.from_moves([[0, 1, 0], [0, 10, 0], [0, 2, 0]])
+    utility = UtilityFunction()
+    expected = utility.evaluate(state, 1)
+    
+    context = NodeContext(state)
+    context.legal_moves(2)  # Generated by the search
+    CountingState.move_generations = 0
+    
+    assert utility.evaluate(state, 1, context) == expected
+    assert CountingState.move_generations == 1  # Only player 1's moves
+    assert utility.evaluate(state, 1, context) == expected
+    assert CountingState.move_generations == 1
@@ -0,0 +1,130 @@
+"""
+Tests for the vectorized game environment and batched search.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from src.ai.difficulties import MillAI, Difficulty
+from src.ai.minimax import MinimaxAI
+from src.ai.utility import UtilityFunction
+from src.ai.vector_search import best_moves
+from src.analysis.vector_match import run_vector_match
+from src.game.mill_state import MillState
+from src.game.vector_env import (VectorMillEnv, apply_moves, count_moves,
+                                 generate_moves)
+
+
+def random_positions(count, seed=0):
+    """Play random games and collect the positions along the way."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        state = MillState()
+        player = 1
+        for _ in range(rng.randint(0, 80)):
+            moves = state.legal_moves(player)
+            if state.game_over() or not moves:
+                break
+            state.make_move(player, rng.choice(moves))
+            player = 2 if player == 1 else 1
+        positions.append((state, player))
+    return positions
+
+
+def as_arrays(positions):
+    """Convert (MillState, player) pairs to board, in_hand and player arrays."""
+    boards = np.array([state.board for state, _ in positions], dtype=np.int8)
+    in_hand = np.array([state.in_hand for state, _ in positions], dtype=np.int16)
+    players = np.array([player for _, player in positions], dtype=np.int8)
+    return boards, in_hand, players
+
+
+def test_moves_match_mill_state():
+    """Test that generated moves and counts equal MillState.legal_moves."""
+    positions = random_positions(200)
+    boards, in_hand, players = as_arrays(positions)
+    position, moves = generate_moves(boards, in_hand, players)
+    counts = count_moves(boards, in_hand, players)
+    
+    for index, (state, player) in enumerate(positions):
+        expected = [list(move) for move in state.legal_moves(player)]
+        assert moves[position == index].tolist() == expected
+        assert counts[index] == len(expected)
+
+
+def test_apply_moves_matches_mill_state():
+    """Test that applied moves give MillState's resulting positions."""
+    positions = random_positions(50, seed=1)
+    boards, in_hand, players = as_arrays(positions)
+    position, moves = generate_moves(boards, in_hand, players)
+    new_boards, new_in_hand, new_players = apply_moves(
+        boards[position], in_hand[position], players[position], moves)
+    
+    for row, (index, move) in enumerate(zip(position, moves.tolist())):
+        state, player = positions[index]
+        child = state.clone()
+        child.make_move(player, move)
+        assert new_boards[row].tolist() == child.board
+        assert new_in_hand[row].tolist() == list(child.in_hand)
+        assert new_players[row] == 3 - player
+
+
+def test_evaluate_batch_matches_evaluate():
+    """Test that batched evaluation equals evaluate for both players."""
+    positions = random_positions(100, seed=2)
+    boards, in_hand, _ = as_arrays(positions)
+    utility = UtilityFunction()
+    
+    for player in (1, 2):
+        scores = utility.evaluate_batch(boards, in_hand, player)
+        expected = [utility.evaluate(state, player) for state, _ in positions]
+        assert scores.tolist() == pytest.approx(expected)
+
+
+def test_best_moves_match_minimax():
+    """Test that batched search values equal plain minimax."""
+    positions = [(state, player) for state, player in random_positions(20, seed=3)
+                 if not state.game_over() and state.legal_moves(player)]
+    boards, in_hand, players = as_arrays(positions)
+    utility = UtilityFunction()
+    _, values = best_moves(boards, in_hand, players, 2, utility)
+    
+    ai = MinimaxAI(utility_function=utility, max_depth=2,
+                   use_alpha_beta=False, detect_repetitions=False)
+    for (state, player), value in zip(positions, values):
+        assert ai.get_best_move(state, player)[1] == pytest.approx(value)
+
+
+def test_env_games_end():
+    """Test that lockstep random games finish with legal moves."""
+    env = VectorMillEnv(8, max_plies=60)
+    rng = np.random.default_rng(0)
+    while len(env.active()):
+        games = env.active()
+        game_of_move, moves = env.legal_moves(games)
+        choice = [rng.choice(np.flatnonzero(game_of_move == game))
+                  for game in games]
+        env.step(games, moves[choice])
+    
+    assert env.done.all()
+    assert (env.plies <= 60).all()
+    assert ((env.winners > 0) | (env.plies == 60)).all()
+
+
+def test_vector_match_records_legal_games():
+    """Test that a lockstep match reports results and legal records."""
+    ai = MillAI(difficulty=Difficulty.EASY)
+    results = run_vector_match(ai, ai, 6, max_plies=40, seed=1,
+                               record_games=True)
+    
+    assert (results['ai1_wins'] + results['ai2_wins'] + results['draws']
+            == results['total_games'] == 6)
+    for record in results['records']:
+        state = MillState()
+        player = 1
+        for move in record.moves:
+            assert move in [list(legal) for legal in state.legal_moves(player)]
+            state.make_move(player, move)
+            player = 2 if player == 1 else 1